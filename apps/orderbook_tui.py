@@ -114,10 +114,10 @@ class OrderbookTUI:
         lines.append("-" * 80)
 
         # Get 10 levels for TUI
-        up_bids = up_ob.bids[:10] if up_ob else []
-        up_asks = up_ob.asks[:10] if up_ob else []
-        down_bids = down_ob.bids[:10] if down_ob else []
-        down_asks = down_ob.asks[:10] if down_ob else []
+        up_bids = up_ob.top_bids(10) if up_ob else []
+        up_asks = up_ob.top_asks(10) if up_ob else []
+        down_bids = down_ob.top_bids(10) if down_ob else []
+        down_asks = down_ob.top_asks(10) if down_ob else []
 
         for i in range(10):
             up_bid = f"{up_bids[i].price:>9.4f} {up_bids[i].size:>9.1f}" if i < len(up_bids) else f"{'--':>9} {'--':>9}"
@@ -8,6 +8,8 @@ Usage:
     python apps/run_flash_crash.py --coin ETH
     python apps/run_flash_crash.py --coin BTC --size 10
     python apps/run_flash_crash.py --coin BTC --drop 0.25
+    python apps/run_flash_crash.py --coin BTC --event-driven
+    python apps/run_flash_crash.py --coin BTC --event-driven --presign
 """
 
 import os
@@ -76,6 +78,16 @@ def main():
         default=0.05,
         help="Stop loss in dollars (default: 0.05)"
     )
+    parser.add_argument(
+        "--event-driven",
+        action="store_true",
+        help="Tick on orderbook changes instead of every 100ms"
+    )
+    parser.add_argument(
+        "--presign",
+        action="store_true",
+        help="Keep entry orders signed ahead of time"
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -114,6 +126,8 @@ def main():
         price_lookback_seconds=args.lookback,
         take_profit=args.take_profit,
         stop_loss=args.stop_loss,
+        tick_mode="event" if args.event_driven else "interval",
+        presign_orders=args.presign,
     )
 
     # Print configuration
@@ -128,6 +142,8 @@ def main():
     print(f"  Lookback: {strategy_config.price_lookback_seconds}s")
     print(f"  Take profit: +${strategy_config.take_profit:.2f}")
     print(f"  Stop loss: -${strategy_config.stop_loss:.2f}")
+    print(f"  Tick mode: {strategy_config.tick_mode}")
+    print(f"  Pre-signed entries: {'on' if strategy_config.presign_orders else 'off'}")
     print()
 
     # Create and run strategy
@@ -187,7 +187,25 @@ class BaseStrategy(ABC):
             size=size,
             side=side
         )
+        return self._track_order(token_id, price, size, side, result)
 
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[OrderInfo]:
+        """Place several orders in one batch and track them (input order)."""
+        results = await self.bot.place_orders(orders)
+        return [
+            self._track_order(order['token_id'], order['price'], order['size'], order['side'], result)
+            for order, result in zip(orders, results)
+        ]
+
+    def _track_order(
+        self,
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,
+        result: OrderResult
+    ) -> OrderInfo:
+        """Record an order placement result."""
         order_info = OrderInfo(
             order_id=result.order_id or f"temp_{int(time.time())}",
             token_id=token_id,
@@ -201,7 +219,7 @@ class BaseStrategy(ABC):
             self.orders[order_info.order_id] = order_info
         else:
             order_info.status = 'failed'
-            order_info.order_id = f"failed_{int(time.time())}"
+            order_info.order_id = f"failed_{int(time.time())}_{len(self.orders)}"
             self.orders[order_info.order_id] = order_info
 
         return order_info
@@ -463,14 +481,14 @@ class GridTradingStrategy(BaseStrategy):
         return levels
 
     async def _place_grid_orders(self, token_id: str, current_price: float) -> None:
-        """Place orders at grid levels."""
-        for level in self.grid_levels[token_id]:
-            if level < current_price:
-                side = "BUY"
-            else:
-                side = "SELL"
-
-            await self.place_order(token_id, level, self.size, side)
+        """Place orders at all grid levels in one batch."""
+        orders = [
+            self.bot.create_order_dict(
+                token_id, level, self.size, "BUY" if level < current_price else "SELL"
+            )
+            for level in self.grid_levels[token_id]
+        ]
+        await self.place_orders(orders)
 
     async def on_order_update(self, order: OrderInfo) -> None:
         # When an order fills, check if we should replace the grid
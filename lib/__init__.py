@@ -5,8 +5,10 @@ This package provides reusable components for trading strategies and application
 
 - console: Terminal output utilities (colors, formatting)
 - market_manager: Market discovery and WebSocket management
+- multi_market_manager: Several coins' markets over one WebSocket
 - price_tracker: Price history and pattern detection
 - position_manager: Position tracking with TP/SL
+- order_pool: Pre-signed orders for latency-critical entries
 
 Usage:
     from lib import MarketManager, PriceTracker, PositionManager
@@ -15,16 +17,22 @@ Usage:
 
 from lib.console import Colors
 from lib.market_manager import MarketManager, MarketInfo
+from lib.multi_market_manager import MultiMarketManager, CoinMarketView
 from lib.price_tracker import PriceTracker, PricePoint, FlashCrashEvent
 from lib.position_manager import PositionManager, Position
+from lib.order_pool import PreSignedOrderPool, OrderPoolStats
 
 __all__ = [
     "Colors",
     "MarketManager",
     "MarketInfo",
+    "MultiMarketManager",
+    "CoinMarketView",
     "PriceTracker",
     "PricePoint",
     "FlashCrashEvent",
     "PositionManager",
     "Position",
+    "PreSignedOrderPool",
+    "OrderPoolStats",
 ]
@@ -4,7 +4,8 @@ Market Manager - Market Discovery and WebSocket Management
 Provides unified interface for:
 - 15-minute market discovery via GammaClient
 - WebSocket connection and subscription management
-- Automatic market switching when markets expire
+- Automatic market switching when markets expire, with the next
+  window pre-subscribed so its books are warm at the boundary
 - Real-time orderbook caching
 
 Usage:
@@ -28,6 +29,15 @@ Usage:
     print(f"Best bid: {ob.best_bid}")
 
     await manager.stop()
+
+    # Opt-in: deliver only the newest pending snapshot per asset
+    from src.event_queue import current_event
+
+    manager = MarketManager(coin="BTC", coalesce_books=True)
+
+    @manager.on_book_update
+    async def handle_book(snapshot):
+        skipped = current_event().coalesced  # superseded snapshots
 """
 
 import asyncio
@@ -36,8 +46,10 @@ from datetime import datetime, timezone
 from dataclasses import dataclass
 from typing import Optional, Dict, Callable, List, Union, Awaitable
 
+from src.client import ClobClient
+from src.event_queue import BoundedEventQueue, QueuedEvent, QueueStats, COALESCE, dispatching
 from src.gamma_client import GammaClient
-from src.websocket_client import MarketWebSocket, OrderbookSnapshot
+from src.websocket_client import MarketWebSocket, OrderbookSnapshot, PriceChange
 
 
 @dataclass
@@ -129,11 +141,65 @@ class MarketInfo:
         return mins == 0 and secs == 0
 
 
+def market_from_info(market_data: Optional[Dict]) -> Optional[MarketInfo]:
+    """Build MarketInfo from a GammaClient market info dict."""
+    if not market_data:
+        return None
+
+    return MarketInfo(
+        slug=market_data.get("slug", ""),
+        question=market_data.get("question", ""),
+        end_date=market_data.get("end_date", ""),
+        token_ids=market_data.get("token_ids", {}),
+        prices=market_data.get("prices", {}),
+        accepting_orders=market_data.get("accepting_orders", False),
+    )
+
+
+def _market_sort_key(market: MarketInfo) -> Optional[int]:
+    """Get comparable timestamp for market ordering."""
+    return market.slug_timestamp() or market.end_timestamp()
+
+
+def should_switch_market(old_market: Optional[MarketInfo], new_market: MarketInfo) -> bool:
+    """
+    Check if new_market should replace old_market.
+
+    Args:
+        old_market: Current market (None if there is none)
+        new_market: Candidate market
+
+    Returns:
+        True if the candidate has different tokens and is not older
+    """
+    if not old_market:
+        return True
+
+    old_tokens = set(old_market.token_ids.values())
+    new_tokens = set(new_market.token_ids.values())
+    if new_tokens == old_tokens:
+        return False
+
+    old_key = _market_sort_key(old_market)
+    new_key = _market_sort_key(new_market)
+    if old_key is not None and new_key is not None and new_key <= old_key:
+        return False
+
+    return True
+
+
 # Callback type aliases
 BookCallback = Callable[[OrderbookSnapshot], Union[None, Awaitable[None]]]
+PriceChangeCallback = Callable[[str, List[PriceChange]], Union[None, Awaitable[None]]]
 MarketChangeCallback = Callable[[str, str], None]  # (old_slug, new_slug)
 ConnectionCallback = Callable[[], None]
 
+# Pending-book bound when coalescing (one slot per subscribed asset)
+COALESCE_QUEUE_SIZE = 1024
+
+# Seconds between attempts to find the next window before it opens
+PREFETCH_RETRY_INTERVAL = 2.0
+
 
 class MarketManager:
     """
@@ -143,6 +209,8 @@ class MarketManager:
     - Automatic 15-minute market discovery
     - WebSocket connection with auto-reconnect
     - Market change detection and notification
+    - Predictive rollover: the next window is subscribed alongside the
+      current one and becomes current exactly at the boundary
     - Orderbook caching
     """
 
@@ -151,6 +219,11 @@ class MarketManager:
         coin: str = "BTC",
         market_check_interval: float = 30.0,
         auto_switch_market: bool = True,
+        json_backend: str = "auto",
+        event_queue_size: int = 0,
+        overflow_policy: str = "coalesce",
+        coalesce_books: bool = False,
+        prefetch_seconds: float = 60.0,
     ):
         """
         Initialize market manager.
@@ -159,25 +232,46 @@ class MarketManager:
             coin: Coin symbol (BTC, ETH, SOL, XRP)
             market_check_interval: Seconds between market checks
             auto_switch_market: Auto switch when market changes
+            json_backend: JSON decoder for WebSocket frames (see src.codec)
+            event_queue_size: Bound for queued WebSocket callbacks (0 = inline)
+            overflow_policy: Queue overflow policy (drop_oldest, coalesce, block)
+            coalesce_books: Collapse pending book updates per asset and deliver
+                only the newest snapshot (skipped count via current_event())
+            prefetch_seconds: Seconds before the current market ends to
+                subscribe to the next window (0 = switch on the next poll)
         """
         self.coin = coin.upper()
         self.market_check_interval = market_check_interval
         self.auto_switch_market = auto_switch_market
+        self.json_backend = json_backend
+        self.event_queue_size = event_queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesce_books = coalesce_books
+        self.prefetch_seconds = prefetch_seconds
 
         # Clients
         self.gamma = GammaClient()
+        self.clob = ClobClient()  # Public endpoints only (orderbook resync)
         self.ws: Optional[MarketWebSocket] = None
 
         # State
         self.current_market: Optional[MarketInfo] = None
+        self.next_market: Optional[MarketInfo] = None  # Pre-subscribed window
         self._previous_slug: Optional[str] = None
         self._running = False
         self._ws_connected = False
         self._ws_task: Optional[asyncio.Task] = None
         self._market_check_task: Optional[asyncio.Task] = None
+        self._rollover_task: Optional[asyncio.Task] = None
+
+        # Book coalescing
+        self._book_queue: Optional[BoundedEventQueue] = None
+        self._book_task: Optional[asyncio.Task] = None
+        self.skipped_book_updates: Dict[str, int] = {}
 
         # Callbacks
         self._on_book_callbacks: List[BookCallback] = []
+        self._on_price_change_callbacks: List[PriceChangeCallback] = []
         self._on_market_change_callbacks: List[MarketChangeCallback] = []
         self._on_connect_callbacks: List[ConnectionCallback] = []
         self._on_disconnect_callbacks: List[ConnectionCallback] = []
@@ -199,6 +293,11 @@ class MarketManager:
             return self.current_market.token_ids
         return {}
 
+    @property
+    def book_queue_stats(self) -> Optional[QueueStats]:
+        """Coalescing queue stats (None when coalescing is disabled)."""
+        return self._book_queue.stats if self._book_queue else None
+
     def get_orderbook(self, side: str) -> Optional[OrderbookSnapshot]:
         """
         Get cached orderbook for side.
@@ -216,6 +315,23 @@ class MarketManager:
             return self.ws.get_orderbook(token_id)
         return None
 
+    def is_book_fresh(self, side: str, max_age: Optional[float] = None) -> bool:
+        """
+        Check that the cached book for side can be traded on.
+
+        Args:
+            side: "up" or "down"
+            max_age: Also require an update within this many seconds
+
+        Returns:
+            False if there is no book, it went stale in a disconnect,
+            or it is older than max_age
+        """
+        ob = self.get_orderbook(side)
+        if ob is None or ob.stale:
+            return False
+        return max_age is None or ob.age <= max_age
+
     def get_mid_price(self, side: str) -> float:
         """Get mid price for side."""
         ob = self.get_orderbook(side)
@@ -244,6 +360,11 @@ class MarketManager:
         self._on_book_callbacks.append(callback)
         return callback
 
+    def on_price_change(self, callback: PriceChangeCallback) -> PriceChangeCallback:
+        """Register price change callback (cached books are already updated)."""
+        self._on_price_change_callbacks.append(callback)
+        return callback
+
     def on_market_change(self, callback: MarketChangeCallback) -> MarketChangeCallback:
         """Register market change callback."""
         self._on_market_change_callbacks.append(callback)
@@ -264,30 +385,13 @@ class MarketManager:
         self._previous_slug = market.slug
         self.current_market = market
 
-    def _market_sort_key(self, market: MarketInfo) -> Optional[int]:
-        """Get comparable timestamp for market ordering."""
-        return market.slug_timestamp() or market.end_timestamp()
-
     def _should_switch_market(
         self,
         old_market: Optional[MarketInfo],
         new_market: MarketInfo
     ) -> bool:
         """Check if new market should replace current market."""
-        if not old_market:
-            return True
-
-        old_tokens = set(old_market.token_ids.values())
-        new_tokens = set(new_market.token_ids.values())
-        if new_tokens == old_tokens:
-            return False
-
-        old_key = self._market_sort_key(old_market)
-        new_key = self._market_sort_key(new_market)
-        if old_key is not None and new_key is not None and new_key <= old_key:
-            return False
-
-        return True
+        return should_switch_market(old_market, new_market)
 
     def discover_market(self, update_state: bool = True) -> Optional[MarketInfo]:
         """
@@ -296,41 +400,77 @@ class MarketManager:
         Returns:
             MarketInfo if found, None otherwise
         """
-        market_data = self.gamma.get_market_info(self.coin)
+        return self._apply_discovered(self.gamma.get_market_info(self.coin), update_state)
 
-        if not market_data:
-            return None
+    async def discover_market_async(self, update_state: bool = True) -> Optional[MarketInfo]:
+        """Async version of discover_market (no worker thread)."""
+        market_data = await self.gamma.get_market_info_async(self.coin)
+        return self._apply_discovered(market_data, update_state)
 
-        if not market_data.get("accepting_orders", False):
+    def _apply_discovered(
+        self,
+        market_data: Optional[Dict],
+        update_state: bool
+    ) -> Optional[MarketInfo]:
+        """Build MarketInfo from Gamma market info and optionally store it."""
+        market = market_from_info(market_data)
+        if market is None or not market.accepting_orders:
             return None
 
-        market = MarketInfo(
-            slug=market_data.get("slug", ""),
-            question=market_data.get("question", ""),
-            end_date=market_data.get("end_date", ""),
-            token_ids=market_data.get("token_ids", {}),
-            prices=market_data.get("prices", {}),
-            accepting_orders=market_data.get("accepting_orders", False),
-        )
-
         if update_state:
             # Note: Market change callbacks are fired in _market_check_loop
             # to ensure they run in the main thread after resubscription
             self._update_current_market(market)
         return market
 
+    async def _deliver_book(self, snapshot: OrderbookSnapshot) -> None:
+        """Run book callbacks for one snapshot."""
+        for callback in self._on_book_callbacks:
+            try:
+                result = callback(snapshot)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass
+
+    async def _book_delivery_loop(self) -> None:
+        """Deliver the newest pending snapshot per asset."""
+        while True:
+            event = await self._book_queue.get()
+            if event.coalesced:
+                asset_id = event.key
+                self.skipped_book_updates[asset_id] = (
+                    self.skipped_book_updates.get(asset_id, 0) + event.coalesced
+                )
+            with dispatching(event):
+                await self._deliver_book(*event.args)
+
     async def _setup_websocket(self) -> bool:
         """Setup WebSocket connection and callbacks."""
         if not self.current_market:
             return False
 
-        self.ws = MarketWebSocket()
+        self.ws = MarketWebSocket(
+            rest_client=self.clob,
+            json_backend=self.json_backend,
+            event_queue_size=self.event_queue_size,
+            overflow_policy=self.overflow_policy,
+        )
 
         @self.ws.on_book
         async def handle_book(snapshot: OrderbookSnapshot):  # pyright: ignore[reportUnusedFunction]
-            for callback in self._on_book_callbacks:
+            if self._book_queue is not None:
+                await self._book_queue.put(
+                    QueuedEvent(kind="book", args=(snapshot,), key=snapshot.asset_id)
+                )
+            else:
+                await self._deliver_book(snapshot)
+
+        @self.ws.on_price_change
+        async def handle_price_change(market: str, changes: List[PriceChange]):  # pyright: ignore[reportUnusedFunction]
+            for callback in self._on_price_change_callbacks:
                 try:
-                    result = callback(snapshot)
+                    result = callback(market, changes)
                     if asyncio.iscoroutine(result):
                         await result
                 except Exception:
@@ -376,10 +516,8 @@ class MarketManager:
 
             old_market = self.current_market
             old_tokens = set(old_market.token_ids.values()) if old_market else set()
-            old_slug = old_market.slug if old_market else None
 
-            # Run synchronous HTTP call in thread pool to avoid blocking
-            market = await asyncio.to_thread(self.discover_market, update_state=False)
+            market = await self.discover_market_async(update_state=False)
 
             if not market:
                 continue
@@ -397,17 +535,102 @@ class MarketManager:
             if not self._should_switch_market(old_market, market):
                 continue
 
-            # Market changed - resubscribe to new tokens
+            await self._switch_market(market)
+
+    async def _switch_market(self, market: MarketInfo, notify: bool = True) -> None:
+        """
+        Make market current and move the WebSocket subscription to it.
+
+        A pre-subscribed market switches without clearing any books: the
+        new window's books are already cached and only the old tokens are
+        dropped. Otherwise the subscription is replaced.
+
+        Args:
+            market: Market to switch to
+            notify: Fire market change callbacks
+        """
+        old_market = self.current_market
+        old_slug = old_market.slug if old_market else None
+        old_tokens = set(old_market.token_ids.values()) if old_market else set()
+        new_tokens = set(market.token_ids.values())
+        warm = (
+            self.next_market is not None
+            and set(self.next_market.token_ids.values()) == new_tokens
+        )
+        self.next_market = None
+
+        if self.ws and not warm:
             await self.ws.subscribe(list(new_tokens), replace=True)
-            self._update_current_market(market)
 
-            # Fire market change callbacks in main thread
-            if old_slug and old_slug != market.slug:
-                for callback in self._on_market_change_callbacks:
-                    try:
-                        callback(old_slug, market.slug)
-                    except Exception:
-                        pass
+        self._update_current_market(market)
+
+        # Fire market change callbacks in main thread
+        if notify and old_slug and old_slug != market.slug:
+            for callback in self._on_market_change_callbacks:
+                try:
+                    callback(old_slug, market.slug)
+                except Exception:
+                    pass
+
+        if self.ws and warm and old_tokens - new_tokens:
+            await self.ws.unsubscribe(list(old_tokens - new_tokens))
+
+    async def _prefetch_next_market(self, market: MarketInfo) -> Optional[MarketInfo]:
+        """
+        Find the window that follows market and subscribe to it alongside it.
+
+        Args:
+            market: Current market
+
+        Returns:
+            The pre-subscribed market, or None if it is not created yet
+        """
+        window_start = market.end_timestamp()
+        info = await self.gamma.get_next_market_info_async(self.coin, window_start)
+        next_market = market_from_info(info)
+        if next_market is None or not self._should_switch_market(market, next_market):
+            return None
+
+        if self.current_market is not market:
+            return None  # Switched while the lookup was in flight
+
+        if self.ws:
+            await self.ws.subscribe_more(list(next_market.token_ids.values()))
+        self.next_market = next_market
+        return next_market
+
+    async def _rollover_loop(self) -> None:
+        """Pre-subscribe the next window and switch to it when the current one ends."""
+        while self._running:
+            market = self.current_market
+            end = market.end_timestamp() if market else None
+            if end is None:
+                await asyncio.sleep(self.market_check_interval)
+                continue
+
+            # Sleep until the prefetch point (re-check if the market changes)
+            delay = end - self.prefetch_seconds - time.time()
+            if delay > 0:
+                await asyncio.sleep(min(delay, self.market_check_interval))
+                continue
+
+            if self.next_market is None:
+                try:
+                    await self._prefetch_next_market(market)
+                except Exception:
+                    pass
+
+            if self.next_market is None or self.current_market is not market:
+                # Not created yet (or already switched by the poll loop)
+                await asyncio.sleep(PREFETCH_RETRY_INTERVAL)
+                continue
+
+            delay = end - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self._running and self.current_market is market and self.next_market:
+                await self._switch_market(self.next_market)
 
     async def start(self) -> bool:
         """
@@ -423,9 +646,14 @@ class MarketManager:
             self._running = False
             return False
 
+        # Setup book coalescing before any snapshot can arrive
+        if self.coalesce_books:
+            self._book_queue = BoundedEventQueue(COALESCE_QUEUE_SIZE, policy=COALESCE)
+            self._book_task = asyncio.create_task(self._book_delivery_loop())
+
         # Setup WebSocket
         if not await self._setup_websocket():
-            self._running = False
+            await self.stop()
             return False
 
         # Start WebSocket in background
@@ -434,6 +662,8 @@ class MarketManager:
         # Start market check loop
         if self.auto_switch_market:
             self._market_check_task = asyncio.create_task(self._market_check_loop())
+            if self.prefetch_seconds > 0:
+                self._rollover_task = asyncio.create_task(self._rollover_loop())
 
         return True
 
@@ -449,6 +679,15 @@ class MarketManager:
                 pass
             self._market_check_task = None
 
+        if self._rollover_task:
+            self._rollover_task.cancel()
+            try:
+                await self._rollover_task
+            except asyncio.CancelledError:
+                pass
+            self._rollover_task = None
+        self.next_market = None
+
         if self._ws_task:
             self._ws_task.cancel()
             try:
@@ -461,6 +700,15 @@ class MarketManager:
             await self.ws.disconnect()
             self.ws = None
 
+        if self._book_task:
+            self._book_task.cancel()
+            try:
+                await self._book_task
+            except asyncio.CancelledError:
+                pass
+            self._book_task = None
+        self._book_queue = None
+
         self._ws_connected = False
 
     async def wait_for_data(self, timeout: float = 5.0) -> bool:
@@ -491,8 +739,7 @@ class MarketManager:
         old_market = self.current_market
         old_tokens = set(old_market.token_ids.values()) if old_market else set()
 
-        # Run synchronous HTTP call in thread pool to avoid blocking
-        market = await asyncio.to_thread(self.discover_market, update_state=False)
+        market = await self.discover_market_async(update_state=False)
 
         if not market:
             return None
@@ -505,8 +752,5 @@ class MarketManager:
         if not self._should_switch_market(old_market, market):
             return old_market
 
-        if self.ws:
-            await self.ws.subscribe(list(new_tokens), replace=True)
-
-        self._update_current_market(market)
+        await self._switch_market(market, notify=False)
         return market
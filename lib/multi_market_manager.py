@@ -0,0 +1,630 @@
+"""
+Multi-Market Manager - Many 15-Minute Markets over One WebSocket
+
+MarketManager follows a single coin. MultiMarketManager tracks the
+current 15-minute market of several coins at once:
+- Markets for all coins are discovered concurrently
+- Every coin's tokens share one WebSocket subscription
+- Each coin rolls over on its own: the next window is pre-subscribed
+  prefetch_seconds before the end and becomes current at the boundary
+- Prices come from live books in memory, not a REST call per lookup
+
+Usage:
+    from lib.multi_market_manager import MultiMarketManager
+
+    markets = MultiMarketManager(coins=["BTC", "ETH", "SOL", "XRP"])
+
+    @markets.on_book_update
+    def handle_book(coin, snapshot):
+        print(coin, snapshot.mid_price)
+
+    @markets.on_market_change
+    def handle_change(coin, old_slug, new_slug):
+        print(f"{coin}: {old_slug} -> {new_slug}")
+
+    await markets.start()
+    await markets.wait_for_data()
+
+    print(markets.get_mid_price("ETH", "up"))
+
+    # One coin behind the MarketManager interface (e.g. BaseStrategy.market)
+    eth = markets.view("ETH")
+    print(eth.get_mid_price("up"))
+
+    await markets.stop()
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from lib.market_manager import (
+    BookCallback,
+    ConnectionCallback,
+    MarketChangeCallback,
+    MarketInfo,
+    PREFETCH_RETRY_INTERVAL,
+    PriceChangeCallback,
+    market_from_info,
+    should_switch_market,
+)
+from src.client import ClobClient
+from src.gamma_client import GammaClient
+from src.websocket_client import MarketWebSocket, OrderbookSnapshot, PriceChange
+
+
+# Callback type aliases
+MultiBookCallback = Callable[[str, OrderbookSnapshot], Union[None, Awaitable[None]]]
+MultiPriceChangeCallback = Callable[[str, str, List[PriceChange]], Union[None, Awaitable[None]]]
+MultiMarketChangeCallback = Callable[[str, str, str], None]  # (coin, old_slug, new_slug)
+
+DEFAULT_COINS = ("BTC", "ETH", "SOL", "XRP")
+
+
+class MultiMarketManager:
+    """
+    Tracks the current 15-minute market of several coins on one WebSocket.
+
+    Provides:
+    - Concurrent discovery of every coin's market
+    - One shared subscription, updated by diff as markets roll
+    - Per-coin predictive rollover with warm books
+    - In-memory book, mid price and freshness lookups per coin
+    """
+
+    def __init__(
+        self,
+        coins: Iterable[str] = DEFAULT_COINS,
+        market_check_interval: float = 30.0,
+        prefetch_seconds: float = 60.0,
+        json_backend: str = "auto",
+        event_queue_size: int = 0,
+        overflow_policy: str = "coalesce",
+    ):
+        """
+        Initialize multi-market manager.
+
+        Args:
+            coins: Coin symbols to track (any GammaClient.COIN_SLUGS key)
+            market_check_interval: Seconds between full rediscoveries
+            prefetch_seconds: Seconds before a market ends to subscribe to
+                the next window (0 = switch on the next rediscovery)
+            json_backend: JSON decoder for WebSocket frames (see src.codec)
+            event_queue_size: Bound for queued WebSocket callbacks (0 = inline)
+            overflow_policy: Queue overflow policy (drop_oldest, coalesce, block)
+        """
+        self.coins = [coin.upper() for coin in coins]
+        for coin in self.coins:
+            if coin not in GammaClient.COIN_SLUGS:
+                raise ValueError(f"Unsupported coin: {coin}. Use: {list(GammaClient.COIN_SLUGS)}")
+
+        self.market_check_interval = market_check_interval
+        self.prefetch_seconds = prefetch_seconds
+        self.json_backend = json_backend
+        self.event_queue_size = event_queue_size
+        self.overflow_policy = overflow_policy
+
+        # Clients
+        self.gamma = GammaClient()
+        self.clob = ClobClient()  # Public endpoints only (orderbook backfill)
+        self.ws: Optional[MarketWebSocket] = None
+
+        # State
+        self.markets: Dict[str, MarketInfo] = {}
+        self.next_markets: Dict[str, MarketInfo] = {}  # Pre-subscribed windows
+        self._token_index: Dict[str, Tuple[str, str]] = {}  # token -> (coin, side)
+        self._subscribed: Set[str] = set()
+        self._running = False
+        self._ws_task: Optional[asyncio.Task] = None
+        self._market_task: Optional[asyncio.Task] = None
+        self._last_discovery = 0.0
+
+        # Callbacks
+        self._on_book_callbacks: List[MultiBookCallback] = []
+        self._on_price_change_callbacks: List[MultiPriceChangeCallback] = []
+        self._on_market_change_callbacks: List[MultiMarketChangeCallback] = []
+        self._on_connect_callbacks: List[ConnectionCallback] = []
+        self._on_disconnect_callbacks: List[ConnectionCallback] = []
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the shared WebSocket is connected."""
+        return self.ws is not None and self.ws.is_connected
+
+    @property
+    def is_running(self) -> bool:
+        """Check if manager is running."""
+        return self._running
+
+    def view(self, coin: str) -> "CoinMarketView":
+        """coin's market behind the MarketManager interface (see CoinMarketView)."""
+        if coin.upper() not in self.coins:
+            raise ValueError(f"Untracked coin: {coin}. Use: {self.coins}")
+        return CoinMarketView(self, coin)
+
+    def get_market(self, coin: str) -> Optional[MarketInfo]:
+        """Current market for coin (None if none was found)."""
+        return self.markets.get(coin.upper())
+
+    def token_ids(self, coin: str) -> Dict[str, str]:
+        """Token IDs of coin's current market."""
+        market = self.get_market(coin)
+        return market.token_ids if market else {}
+
+    def coin_for_token(self, token_id: str) -> Optional[Tuple[str, str]]:
+        """(coin, side) of a current or pre-subscribed token."""
+        return self._token_index.get(token_id)
+
+    def get_orderbook(self, coin: str, side: str) -> Optional[OrderbookSnapshot]:
+        """
+        Get cached orderbook for one side of coin's current market.
+
+        Args:
+            coin: Coin symbol
+            side: "up" or "down"
+
+        Returns:
+            OrderbookSnapshot or None
+        """
+        token_id = self.token_ids(coin).get(side)
+        if not token_id or not self.ws:
+            return None
+        return self.ws.get_orderbook(token_id)
+
+    def get_mid_price(self, coin: str, side: str) -> float:
+        """Get mid price for side of coin's market (0.0 without a book)."""
+        ob = self.get_orderbook(coin, side)
+        return ob.mid_price if ob else 0.0
+
+    def get_best_bid(self, coin: str, side: str) -> float:
+        """Get best bid price for side of coin's market."""
+        ob = self.get_orderbook(coin, side)
+        return ob.best_bid if ob else 0.0
+
+    def get_best_ask(self, coin: str, side: str) -> float:
+        """Get best ask price for side of coin's market."""
+        ob = self.get_orderbook(coin, side)
+        return ob.best_ask if ob else 1.0
+
+    def get_prices(self, coin: str) -> Dict[str, float]:
+        """Mid prices by side for coin (sides without a book are omitted)."""
+        prices = {}
+        for side in ("up", "down"):
+            price = self.get_mid_price(coin, side)
+            if price > 0:
+                prices[side] = price
+        return prices
+
+    def is_book_fresh(self, coin: str, side: str, max_age: Optional[float] = None) -> bool:
+        """
+        Check that a book can be traded on (see MarketManager.is_book_fresh).
+
+        Args:
+            coin: Coin symbol
+            side: "up" or "down"
+            max_age: Also require an update within this many seconds
+
+        Returns:
+            False if there is no book, it is stale, or older than max_age
+        """
+        ob = self.get_orderbook(coin, side)
+        if ob is None or ob.stale:
+            return False
+        return max_age is None or ob.age <= max_age
+
+    # Callback decorators
+    def on_book_update(self, callback: MultiBookCallback) -> MultiBookCallback:
+        """Register book update callback, called with (coin, snapshot)."""
+        self._on_book_callbacks.append(callback)
+        return callback
+
+    def on_price_change(self, callback: MultiPriceChangeCallback) -> MultiPriceChangeCallback:
+        """Register price change callback, called with (coin, market, changes)."""
+        self._on_price_change_callbacks.append(callback)
+        return callback
+
+    def on_market_change(self, callback: MultiMarketChangeCallback) -> MultiMarketChangeCallback:
+        """Register market change callback, called with (coin, old_slug, new_slug)."""
+        self._on_market_change_callbacks.append(callback)
+        return callback
+
+    def on_connect(self, callback: ConnectionCallback) -> ConnectionCallback:
+        """Register WebSocket connect callback."""
+        self._on_connect_callbacks.append(callback)
+        return callback
+
+    def on_disconnect(self, callback: ConnectionCallback) -> ConnectionCallback:
+        """Register WebSocket disconnect callback."""
+        self._on_disconnect_callbacks.append(callback)
+        return callback
+
+    async def discover_markets(self) -> Dict[str, MarketInfo]:
+        """
+        Discover every coin's current market concurrently and switch
+        coins whose market changed.
+
+        Returns:
+            Current markets by coin
+        """
+        infos = await asyncio.gather(
+            *(self.gamma.get_market_info_async(coin) for coin in self.coins),
+            return_exceptions=True,
+        )
+        self._last_discovery = time.time()
+
+        for coin, info in zip(self.coins, infos):
+            if isinstance(info, Exception):
+                continue
+            market = market_from_info(info)
+            if market is None or not market.accepting_orders:
+                continue
+            old_market = self.markets.get(coin)
+            if old_market and market.token_ids == old_market.token_ids:
+                self.markets[coin] = market  # Refresh metadata
+            elif should_switch_market(old_market, market):
+                self._switch_market(coin, market)
+
+        await self._sync_subscription()
+        return dict(self.markets)
+
+    def _switch_market(self, coin: str, market: MarketInfo) -> None:
+        """Make market current for coin and fire market change callbacks."""
+        old_market = self.markets.get(coin)
+        self.markets[coin] = market
+        pending = self.next_markets.get(coin)
+        if pending is not None and not should_switch_market(market, pending):
+            del self.next_markets[coin]  # Became current (or is now outdated)
+
+        if old_market and old_market.slug != market.slug:
+            for callback in self._on_market_change_callbacks:
+                try:
+                    callback(coin, old_market.slug, market.slug)
+                except Exception:
+                    pass
+
+    async def _prefetch_next_markets(self, coins: List[str]) -> None:
+        """Look up the window after each coin's current market concurrently."""
+        ends = {coin: self.markets[coin].end_timestamp() for coin in coins}
+        infos = await asyncio.gather(
+            *(self.gamma.get_next_market_info_async(coin, ends[coin]) for coin in coins),
+            return_exceptions=True,
+        )
+        for coin, info in zip(coins, infos):
+            if isinstance(info, Exception):
+                continue
+            next_market = market_from_info(info)
+            current = self.markets.get(coin)
+            if next_market is not None and should_switch_market(current, next_market):
+                self.next_markets[coin] = next_market
+
+    async def _roll_markets(self, now: float) -> None:
+        """Prefetch upcoming windows and switch coins whose market ended."""
+        prefetch = []
+        for coin, market in self.markets.items():
+            end = market.end_timestamp()
+            if end is None:
+                continue
+            if coin in self.next_markets:
+                if now >= end:
+                    self._switch_market(coin, self.next_markets.pop(coin))
+            elif self.prefetch_seconds > 0 and now >= end - self.prefetch_seconds:
+                prefetch.append(coin)
+
+        if prefetch:
+            await self._prefetch_next_markets(prefetch)
+
+    async def _sync_subscription(self) -> None:
+        """Subscribe to current and pre-subscribed tokens (sent as a diff)."""
+        index: Dict[str, Tuple[str, str]] = {}
+        for markets in (self.next_markets, self.markets):
+            for coin, market in markets.items():
+                for side, token_id in market.token_ids.items():
+                    index[token_id] = (coin, side)
+        self._token_index = index
+
+        tokens = set(index)
+        if self.ws is None or not tokens or tokens == self._subscribed:
+            return
+        await self.ws.subscribe(list(tokens), replace=True)
+        self._subscribed = tokens
+
+    def _next_wakeup(self, now: float) -> float:
+        """Seconds until the next prefetch, switch or rediscovery is due."""
+        due = [self._last_discovery + self.market_check_interval]
+        for coin, market in self.markets.items():
+            end = market.end_timestamp()
+            if end is None:
+                continue
+            if coin in self.next_markets:
+                due.append(end)
+            elif self.prefetch_seconds > 0:
+                # Retry lookups of a next window that does not exist yet
+                due.append(max(end - self.prefetch_seconds, now + PREFETCH_RETRY_INTERVAL))
+        return max(0.0, min(due) - now)
+
+    async def _market_loop(self) -> None:
+        """Roll markets at their boundaries and rediscover periodically."""
+        while self._running:
+            await asyncio.sleep(self._next_wakeup(time.time()))
+            if not self._running:
+                break
+
+            now = time.time()
+            try:
+                await self._roll_markets(now)
+                if now >= self._last_discovery + self.market_check_interval:
+                    await self.discover_markets()
+                else:
+                    await self._sync_subscription()
+            except Exception:
+                pass
+
+    async def _handle_book(self, snapshot: OrderbookSnapshot) -> None:
+        """Route a book to its coin's callbacks."""
+        owner = self._token_index.get(snapshot.asset_id)
+        if owner is None or snapshot.asset_id not in self.token_ids(owner[0]).values():
+            return  # Pre-subscribed window: cached, but not current yet
+        for callback in self._on_book_callbacks:
+            try:
+                result = callback(owner[0], snapshot)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass
+
+    async def _handle_price_change(self, market: str, changes: List[PriceChange]) -> None:
+        """Route a price change batch to its coin's callbacks."""
+        owner = self._token_index.get(changes[0].asset_id) if changes else None
+        if owner is None or changes[0].asset_id not in self.token_ids(owner[0]).values():
+            return
+        for callback in self._on_price_change_callbacks:
+            try:
+                result = callback(owner[0], market, changes)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass
+
+    def _handle_connection(self, callbacks: List[ConnectionCallback]) -> None:
+        """Fire connect or disconnect callbacks."""
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    async def start(self) -> bool:
+        """
+        Start the manager.
+
+        Returns:
+            True if at least one coin's market was found
+        """
+        self._running = True
+
+        self.ws = MarketWebSocket(
+            rest_client=self.clob,
+            json_backend=self.json_backend,
+            event_queue_size=self.event_queue_size,
+            overflow_policy=self.overflow_policy,
+        )
+        self.ws.on_book(self._handle_book)
+        self.ws.on_price_change(self._handle_price_change)
+        self.ws.on_connect(lambda: self._handle_connection(self._on_connect_callbacks))
+        self.ws.on_disconnect(lambda: self._handle_connection(self._on_disconnect_callbacks))
+
+        await self.discover_markets()
+        if not self.markets:
+            await self.stop()
+            return False
+
+        self._ws_task = asyncio.create_task(self.ws.run(auto_reconnect=True))
+        self._market_task = asyncio.create_task(self._market_loop())
+        return True
+
+    async def stop(self) -> None:
+        """Stop the manager and close the WebSocket."""
+        self._running = False
+
+        for task in (self._market_task, self._ws_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._market_task = None
+        self._ws_task = None
+
+        if self.ws:
+            await self.ws.disconnect()
+            self.ws = None
+        self._subscribed = set()
+        self.next_markets.clear()
+
+    async def wait_for_data(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every tracked market has at least one book.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all markets have data
+        """
+        start = time.time()
+        while time.time() - start < timeout:
+            if self.markets and all(self.get_prices(coin) for coin in self.markets):
+                return True
+            await asyncio.sleep(0.1)
+        return False
+
+
+class CoinMarketView:
+    """
+    One coin of a MultiMarketManager behind the MarketManager interface.
+
+    Code written against MarketManager (BaseStrategy, PreSignedOrderPool)
+    can follow a coin on the shared WebSocket instead of opening its own
+    connection. start() and stop() start and stop the whole manager.
+    """
+
+    def __init__(self, manager: MultiMarketManager, coin: str):
+        """
+        Args:
+            manager: Manager tracking coin
+            coin: Coin symbol
+        """
+        self.manager = manager
+        self.coin = coin.upper()
+
+        # Callbacks
+        self._on_book_callbacks: List[BookCallback] = []
+        self._on_price_change_callbacks: List[PriceChangeCallback] = []
+        self._on_market_change_callbacks: List[MarketChangeCallback] = []
+
+        manager.on_book_update(self._handle_book)
+        manager.on_price_change(self._handle_price_change)
+        manager.on_market_change(self._handle_market_change)
+
+    @property
+    def gamma(self) -> GammaClient:
+        """The manager's Gamma client."""
+        return self.manager.gamma
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the shared WebSocket is connected."""
+        return self.manager.is_connected
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the manager is running."""
+        return self.manager.is_running
+
+    @property
+    def current_market(self) -> Optional[MarketInfo]:
+        """Current market of the coin."""
+        return self.manager.get_market(self.coin)
+
+    @property
+    def token_ids(self) -> Dict[str, str]:
+        """Get current market token IDs."""
+        return self.manager.token_ids(self.coin)
+
+    def get_orderbook(self, side: str) -> Optional[OrderbookSnapshot]:
+        """Get cached orderbook for side."""
+        return self.manager.get_orderbook(self.coin, side)
+
+    def is_book_fresh(self, side: str, max_age: Optional[float] = None) -> bool:
+        """Check that the cached book for side can be traded on."""
+        return self.manager.is_book_fresh(self.coin, side, max_age)
+
+    def get_mid_price(self, side: str) -> float:
+        """Get mid price for side."""
+        return self.manager.get_mid_price(self.coin, side)
+
+    def get_best_bid(self, side: str) -> float:
+        """Get best bid price for side."""
+        return self.manager.get_best_bid(self.coin, side)
+
+    def get_best_ask(self, side: str) -> float:
+        """Get best ask price for side."""
+        return self.manager.get_best_ask(self.coin, side)
+
+    def get_spread(self, side: str) -> float:
+        """Get spread for side."""
+        ob = self.get_orderbook(side)
+        if ob and ob.best_bid > 0:
+            return ob.best_ask - ob.best_bid
+        return 0.0
+
+    # Callback decorators
+    def on_book_update(self, callback: BookCallback) -> BookCallback:
+        """Register book update callback for this coin."""
+        self._on_book_callbacks.append(callback)
+        return callback
+
+    def on_price_change(self, callback: PriceChangeCallback) -> PriceChangeCallback:
+        """Register price change callback for this coin."""
+        self._on_price_change_callbacks.append(callback)
+        return callback
+
+    def on_market_change(self, callback: MarketChangeCallback) -> MarketChangeCallback:
+        """Register market change callback for this coin."""
+        self._on_market_change_callbacks.append(callback)
+        return callback
+
+    def on_connect(self, callback: ConnectionCallback) -> ConnectionCallback:
+        """Register connect callback (shared WebSocket)."""
+        return self.manager.on_connect(callback)
+
+    def on_disconnect(self, callback: ConnectionCallback) -> ConnectionCallback:
+        """Register disconnect callback (shared WebSocket)."""
+        return self.manager.on_disconnect(callback)
+
+    async def _handle_book(self, coin: str, snapshot: OrderbookSnapshot) -> None:
+        """Pass this coin's books on."""
+        if coin != self.coin:
+            return
+        for callback in self._on_book_callbacks:
+            try:
+                result = callback(snapshot)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass
+
+    async def _handle_price_change(self, coin: str, market: str, changes: List[PriceChange]) -> None:
+        """Pass this coin's price changes on."""
+        if coin != self.coin:
+            return
+        for callback in self._on_price_change_callbacks:
+            try:
+                result = callback(market, changes)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                pass
+
+    def _handle_market_change(self, coin: str, old_slug: str, new_slug: str) -> None:
+        """Pass this coin's market changes on."""
+        if coin != self.coin:
+            return
+        for callback in self._on_market_change_callbacks:
+            try:
+                callback(old_slug, new_slug)
+            except Exception:
+                pass
+
+    async def start(self) -> bool:
+        """
+        Start the manager if it is not running yet.
+
+        Returns:
+            True if the coin has a current market
+        """
+        if not self.manager.is_running and not await self.manager.start():
+            return False
+        return self.current_market is not None
+
+    async def stop(self) -> None:
+        """Stop the manager."""
+        await self.manager.stop()
+
+    async def wait_for_data(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for the WebSocket to connect and the coin to receive data.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if connected and received data
+        """
+        start = time.time()
+        while time.time() - start < timeout:
+            if self.is_connected and (self.get_orderbook("up") or self.get_orderbook("down")):
+                return True
+            await asyncio.sleep(0.1)
+        return False
@@ -0,0 +1,373 @@
+"""
+Order Pool - Pre-Signed Orders for Latency-Critical Entries
+
+Keeps signed orders ready on a price grid so that an entry only costs
+the HTTP round trip:
+- Signs BUY/SELL orders for a set of tokens at the grid prices, or only
+  those within a band around each token's mid (recentered as it moves)
+- Sizes are fixed share counts or derived from a USDC notional
+- Each signed order is handed out once and re-signed in a worker thread
+- Re-prepares automatically when MarketManager switches markets
+
+Usage:
+    from lib.order_pool import PreSignedOrderPool
+
+    pool = PreSignedOrderPool(
+        signer=bot.signer,
+        maker=bot.config.safe_address,
+        prices=[p / 100 for p in range(1, 100)],
+        notional=5.0,                     # $5 per order, size = 5 / price
+        band=0.10,                        # only mid +/- 10c
+    )
+    pool.attach(market_manager)            # follow market changes
+    await pool.prepare_async(token_ids, mids={token_id: 0.43, ...})
+
+    signed = pool.take(token_id, "BUY", 0.43)
+    if signed:
+        result = await bot.submit_signed_order(signed)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.signer import Order, OrderSigner
+
+logger = logging.getLogger(__name__)
+
+
+# (token_id, side, price in ticks, size or None for notional sizing)
+PoolKey = Tuple[str, str, int, Optional[float]]
+
+
+@dataclass
+class OrderPoolStats:
+    """Order pool counters."""
+    signed: int = 0
+    hits: int = 0
+    misses: int = 0
+    prepare_seconds: float = 0.0
+
+
+class PreSignedOrderPool:
+    """
+    Pool of pre-signed orders keyed by token, side, price and size.
+
+    Prices are matched on a tick grid (take() rounds to the nearest tick).
+    With `notional`, one order per price is kept with size = notional / price
+    and take() is called without a size. `limit_offset` signs the limit
+    away from the matched price, like place_order callers that add slippage.
+    With `band`, only grid prices within band of each token's mid are
+    signed; tokens without a known mid get the whole grid.
+
+    Signing happens in worker threads while take() runs on the event loop;
+    the pool state is only read and written under a lock, and signatures
+    are computed outside it.
+    """
+
+    def __init__(
+        self,
+        signer: OrderSigner,
+        maker: str,
+        prices: Sequence[float],
+        sizes: Sequence[float] = (),
+        notional: Optional[float] = None,
+        sides: Sequence[str] = ("BUY",),
+        limit_offset: float = 0.0,
+        tick_size: float = 0.01,
+        fee_rate_bps: int = 0,
+        band: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            signer: Signer used for all orders
+            maker: Maker (Safe/Proxy) address
+            prices: Grid prices to pre-sign
+            sizes: Share sizes to pre-sign at every price
+            notional: USDC amount per order (size = notional / price)
+            sides: Order sides to pre-sign
+            limit_offset: Slippage allowance; BUY limits are signed at
+                price + offset and SELL limits at price - offset
+            tick_size: Price tick used to match prices
+            fee_rate_bps: Fee rate in basis points
+            band: Pre-sign only prices within this distance of the mid
+                (None = every grid price)
+            executor: Where prepares and refills sign (None = the event
+                loop's default thread pool)
+        """
+        if not sizes and notional is None:
+            raise ValueError("Provide sizes or notional")
+
+        self.signer = signer
+        self.maker = maker
+        self.tick_size = tick_size
+        self.prices = sorted({self._ticks(p) for p in prices if 0 < p <= 1})
+        self.sizes = [round(s, 6) for s in sizes]
+        self.notional = notional
+        self.sides = [side.upper() for side in sides]
+        self.limit_offset = limit_offset
+        self.fee_rate_bps = fee_rate_bps
+        self.band = band
+        self.executor = executor
+        self.stats = OrderPoolStats()
+
+        self.token_ids: List[str] = []
+        self.centers: Dict[str, int] = {}  # token_id -> band center in ticks
+        self._orders: Dict[PoolKey, Dict[str, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._prepare_task: Optional["asyncio.Future[int]"] = None
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def _ticks(self, price: float) -> int:
+        """Price as a whole number of ticks."""
+        return round(price / self.tick_size)
+
+    def _centers(self, mids: Optional[Dict[str, float]]) -> Dict[str, int]:
+        """Band centers in ticks for the tokens with a known mid."""
+        if self.band is None or not mids:
+            return {}
+        return {token_id: self._ticks(mid) for token_id, mid in mids.items() if mid > 0}
+
+    def _prices_for(self, token_id: str, centers: Dict[str, int]) -> List[int]:
+        """Grid prices (ticks) to sign for a token."""
+        center = centers.get(token_id)
+        if center is None:
+            return self.prices
+        width = self._ticks(self.band)
+        return [ticks for ticks in self.prices if abs(ticks - center) <= width]
+
+    def _keys(self, token_ids: Iterable[str], centers: Dict[str, int]) -> List[PoolKey]:
+        """All pool keys for a set of tokens."""
+        size_keys: List[Optional[float]] = list(self.sizes)
+        if self.notional is not None:
+            size_keys.append(None)
+        return [
+            (token_id, side, ticks, size)
+            for token_id in token_ids
+            for side in self.sides
+            for ticks in self._prices_for(token_id, centers)
+            for size in size_keys
+        ]
+
+    def _sign(self, key: PoolKey) -> Dict[str, Any]:
+        """Sign the order for a pool key."""
+        token_id, side, ticks, size = key
+        price = ticks * self.tick_size
+        if size is None:
+            size = self.notional / price
+
+        offset = self.limit_offset if side == "BUY" else -self.limit_offset
+        limit = min(max(price + offset, self.tick_size), 1 - self.tick_size)
+
+        order = Order(
+            token_id=token_id,
+            price=round(limit, 6),
+            size=size,
+            side=side,
+            maker=self.maker,
+            fee_rate_bps=self.fee_rate_bps,
+        )
+        signed = self.signer.sign_order(order)
+        with self._lock:
+            self.stats.signed += 1
+        return signed
+
+    def prepare(self, token_ids: Iterable[str], mids: Optional[Dict[str, float]] = None) -> int:
+        """
+        Replace the pool with freshly signed orders for token_ids.
+
+        Args:
+            token_ids: Tokens to pre-sign for (e.g. current up/down tokens)
+            mids: Current mid per token, centering each token's band
+
+        Returns:
+            Number of orders signed
+        """
+        token_ids = [t for t in token_ids if t]
+        centers = self._centers(mids)
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        start = time.monotonic()
+        orders = {key: self._sign(key) for key in self._keys(token_ids, centers)}
+
+        with self._lock:
+            self.stats.prepare_seconds = time.monotonic() - start
+            # A newer prepare() finished first; keep its orders
+            if generation == self._generation:
+                self.token_ids = token_ids
+                self.centers = centers
+                self._orders = orders
+        return len(orders)
+
+    async def prepare_async(
+        self,
+        token_ids: Iterable[str],
+        mids: Optional[Dict[str, float]] = None
+    ) -> int:
+        """prepare() in a worker thread so the event loop keeps running."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.prepare, list(token_ids), mids)
+
+    def needs_recenter(self, mids: Dict[str, float]) -> bool:
+        """Whether any token's mid moved half a band away from its center."""
+        if self.band is None:
+            return False
+        half = max(self._ticks(self.band) // 2, 1)
+        with self._lock:
+            token_ids = list(self.token_ids)
+            centers = dict(self.centers)
+        for token_id, center in self._centers(mids).items():
+            if token_id not in token_ids:
+                continue
+            old = centers.get(token_id)
+            if old is None or abs(center - old) >= half:
+                return True
+        return False
+
+    def recenter(self, mids: Dict[str, float]) -> int:
+        """
+        Move bands to the new mids, signing only the prices they gain.
+
+        Orders that fall outside a token's new band are dropped. Orders
+        taken while the new prices are being signed are not put back.
+
+        Args:
+            mids: Current mid per token
+
+        Returns:
+            Number of orders signed
+        """
+        if not self.needs_recenter(mids):
+            return 0
+
+        with self._lock:
+            generation = self._generation
+            token_ids = list(self.token_ids)
+
+        signed = 0
+        for token_id, center in self._centers(mids).items():
+            if token_id not in token_ids:
+                continue
+            keys = self._keys([token_id], {token_id: center})
+            with self._lock:
+                missing = [key for key in keys if key not in self._orders]
+            fresh = {key: self._sign(key) for key in missing}
+            signed += len(fresh)
+
+            with self._lock:
+                # The pool moved on to other tokens meanwhile
+                if generation != self._generation:
+                    break
+                wanted = set(keys)
+                for key in list(self._orders):
+                    if key[0] == token_id and key not in wanted:
+                        del self._orders[key]
+                # Keys held at the snapshot and taken since stay out
+                for key, entry in fresh.items():
+                    self._orders.setdefault(key, entry)
+                self.centers[token_id] = center
+        return signed
+
+    async def recenter_async(self, mids: Dict[str, float]) -> int:
+        """recenter() in a worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.recenter, dict(mids))
+
+    def take(
+        self,
+        token_id: str,
+        side: str,
+        price: float,
+        size: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Hand out a ready order and schedule its replacement.
+
+        Args:
+            token_id: Token to trade
+            side: "BUY" or "SELL"
+            price: Limit price (rounded to the nearest tick)
+            size: Share size (omit for notional sizing)
+
+        Returns:
+            Signed order for TradingBot.submit_signed_order, or None if
+            no order is ready for this token/side/price/size
+        """
+        key: PoolKey = (
+            token_id,
+            side.upper(),
+            self._ticks(price),
+            round(size, 6) if size is not None else None,
+        )
+        with self._lock:
+            entry = self._orders.pop(key, None)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            generation = self._generation
+
+        self._schedule_refill(key, generation)
+        return entry
+
+    def _schedule_refill(self, key: PoolKey, generation: int) -> None:
+        """Re-sign a taken order off the event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._refill(key, generation)
+            return
+        loop.run_in_executor(self.executor, self._refill, key, generation)
+
+    def _refill(self, key: PoolKey, generation: int) -> None:
+        """Re-sign one order unless the pool moved on or its band did."""
+        with self._lock:
+            if generation != self._generation or key in self._orders:
+                return
+        entry = self._sign(key)
+        with self._lock:
+            if generation == self._generation and self._in_band(key):
+                self._orders.setdefault(key, entry)
+
+    def _in_band(self, key: PoolKey) -> bool:
+        """Whether a key is still within its token's band (lock held)."""
+        return key[2] in self._prices_for(key[0], self.centers)
+
+    def attach(self, market: Any) -> None:
+        """
+        Re-prepare whenever a MarketManager switches markets.
+
+        Args:
+            market: MarketManager (uses on_market_change, token_ids and
+                get_mid_price)
+        """
+        @market.on_market_change
+        def handle_market_change(old_slug: str, new_slug: str):  # pyright: ignore[reportUnusedFunction]
+            # Drop orders for expired tokens right away
+            with self._lock:
+                self._generation += 1
+                self._orders = {}
+            mids = {
+                token_id: market.get_mid_price(side)
+                for side, token_id in market.token_ids.items()
+            }
+            self._prepare_task = asyncio.ensure_future(
+                self.prepare_async(market.token_ids.values(), mids)
+            )
+            self._prepare_task.add_done_callback(self._log_prepare_failure)
+
+    @staticmethod
+    def _log_prepare_failure(task: "asyncio.Future[int]") -> None:
+        """Report a re-prepare that failed after a market change."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Order pool re-prepare failed: {task.exception()}")
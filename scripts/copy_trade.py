@@ -10,6 +10,7 @@ USAGE:
     python scripts/copy_trade.py                          # Default $0.50/trade
     python scripts/copy_trade.py --size 1.00              # $1.00/trade
     python scripts/copy_trade.py --size 2.00 --delay 0    # $2/trade, 0ms delay
+    python scripts/copy_trade.py --presign BTC,ETH        # Pre-sign BTC/ETH 15m entries
 
 REQUIREMENTS:
     - .env with POLY_PRIVATE_KEY + POLY_SAFE_ADDRESS
@@ -29,6 +30,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src import create_bot_from_env
 from src.gamma_client import GammaClient
+from lib.order_pool import PreSignedOrderPool
 
 
 # ============================================================
@@ -47,6 +49,10 @@ CLOB_API = "https://clob.polymarket.com"
 # Poll interval in seconds (lower = faster detection, but more API calls)
 POLL_INTERVAL_MS = 500  # 500ms = 0.5 seconds
 
+# How often to check whether pre-signed markets rolled over
+PRESIGN_REFRESH_SECONDS = 30
+PRESIGN_BAND = 0.10  # Pre-sign only prices within 10c of the mid
+
 
 # ============================================================
 # TRADE MONITOR
@@ -64,7 +70,8 @@ class CopyTradeBot:
     """
     
     def __init__(self, bot, size_usd: float = 0.50, delay_ms: int = 0,
-                 max_daily_loss: float = 2.00, min_balance: float = 8.00):
+                 max_daily_loss: float = 2.00, min_balance: float = 8.00,
+                 presign_coins: Optional[List[str]] = None):
         self.bot = bot
         self.size_usd = size_usd
         self.delay_ms = delay_ms
@@ -72,6 +79,21 @@ class CopyTradeBot:
         self.min_balance = min_balance
         
         self.gamma = GammaClient()
+        
+        # Pre-signed BUYs for the current 15m markets of these coins
+        self.presign_coins = [c.upper() for c in presign_coins or []]
+        self.order_pool: Optional[PreSignedOrderPool] = None
+        if self.presign_coins and getattr(bot, "signer", None):
+            self.order_pool = PreSignedOrderPool(
+                signer=bot.signer,
+                maker=bot.config.safe_address,
+                prices=[cents / 100 for cents in range(1, 100)],
+                notional=size_usd,
+                band=PRESIGN_BAND,
+            )
+        self._presigned_tokens: List[str] = []
+        self._presign_task: Optional[asyncio.Task] = None
+        self._last_presign_check = 0.0
         self.balance = 10.0
         self.seen_trades: Set[str] = set()
         self.last_trade_id: Optional[str] = None
@@ -259,6 +281,63 @@ class CopyTradeBot:
             self.log(f"[ERROR] Parse trade: {e}")
             return None
     
+    # ========================================
+    # PRE-SIGNED ORDERS
+    # ========================================
+    
+    def schedule_presign_refresh(self):
+        """Run refresh_presigned in the background, replacing a running one."""
+        if self.order_pool is None:
+            return
+        
+        self._last_presign_check = time.time()
+        if self._presign_task is not None and not self._presign_task.done():
+            self._presign_task.cancel()
+        self._presign_task = asyncio.create_task(self.refresh_presigned())
+    
+    async def refresh_presigned(self):
+        """
+        Re-sign the order pool when a pre-signed coin's market rolls over,
+        and move its price band after the mids in between.
+        """
+        if self.order_pool is None:
+            return
+        
+        infos = await asyncio.gather(
+            *(
+                self.gamma.get_market_info_async(coin, max_age=self.gamma.price_max_age)
+                for coin in self.presign_coins
+            ),
+            return_exceptions=True,
+        )
+        token_ids = []
+        mids = {}
+        for info in infos:
+            if not isinstance(info, dict):
+                continue
+            for side, token_id in info["token_ids"].items():
+                token_ids.append(token_id)
+                mids[token_id] = info["prices"].get(side, 0.0)
+        if not token_ids:
+            return
+        
+        if token_ids == self._presigned_tokens:
+            await self.order_pool.recenter_async(mids)
+            return
+        
+        count = await self.order_pool.prepare_async(token_ids, mids)
+        self._presigned_tokens = token_ids
+        self.log(
+            f"[PRESIGN] {count} orders ready for {','.join(self.presign_coins)} "
+            f"({self.order_pool.stats.prepare_seconds:.1f}s)"
+        )
+    
+    def take_presigned(self, token_id: str, price: float) -> Optional[Dict]:
+        """Pre-signed BUY for token_id at price, if price is on the cent grid."""
+        if self.order_pool is None or abs(price * 100 - round(price * 100)) > 1e-6:
+            return None
+        return self.order_pool.take(token_id, "BUY", price)
+    
     # ========================================
     # EXECUTE COPY TRADE
     # ========================================
@@ -327,12 +406,16 @@ class CopyTradeBot:
         t_start = time.time()
         
         try:
-            result = await self.bot.place_order(
-                token_id=token_id,
-                price=price,
-                size=shares,
-                side="BUY",
-            )
+            signed = self.take_presigned(token_id, price)
+            if signed is not None:
+                result = await self.bot.submit_signed_order(signed)
+            else:
+                result = await self.bot.place_order(
+                    token_id=token_id,
+                    price=price,
+                    size=shares,
+                    side="BUY",
+                )
             
             t_ms = (time.time() - t_start) * 1000
             
@@ -368,8 +451,12 @@ class CopyTradeBot:
         self.log(f"  Poll: {POLL_INTERVAL_MS}ms")
         self.log(f"  Delay: {self.delay_ms}ms")
         self.log(f"  Balance: ${self.balance:.2f}")
+        if self.order_pool is not None:
+            self.log(f"  Pre-sign: {', '.join(self.presign_coins)}")
         self.log("=" * 60)
         
+        self.schedule_presign_refresh()
+        
         # Initial load — mark existing trades as "seen"
         self.log("[INIT] Loading existing trades...")
         initial = self.fetch_whale_trades(limit=20)
@@ -437,6 +524,9 @@ class CopyTradeBot:
                     )
                     last_report = now
                 
+                if self.order_pool is not None and now - self._last_presign_check >= PRESIGN_REFRESH_SECONDS:
+                    self.schedule_presign_refresh()
+                
                 # Wait before next poll
                 await asyncio.sleep(POLL_INTERVAL_MS / 1000)
                 
@@ -472,6 +562,7 @@ def parse_args():
     parser.add_argument("--poll", type=int, default=500, help="Poll interval ms (default: 500)")
     parser.add_argument("--max-daily-loss", type=float, default=2.00, help="Max daily loss (default: 2.00)")
     parser.add_argument("--target", type=str, default=TARGET_ADDRESS, help="Target wallet to copy")
+    parser.add_argument("--presign", type=str, default="", help="Coins to pre-sign entries for, e.g. BTC,ETH")
     return parser.parse_args()
 
 
@@ -502,6 +593,7 @@ async def main():
         size_usd=args.size,
         delay_ms=args.delay,
         max_daily_loss=args.max_daily_loss,
+        presign_coins=[c for c in args.presign.split(",") if c],
     )
     copier.balance = args.balance
     
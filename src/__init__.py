@@ -37,6 +37,7 @@ from .crypto import KeyManager
 from .config import Config, BuilderConfig
 from .gamma_client import GammaClient
 from .websocket_client import MarketWebSocket, OrderbookManager, OrderbookSnapshot
+from .websocket_pool import MarketWebSocketPool
 
 # Utility functions
 from .utils import (
@@ -67,6 +68,7 @@ __all__ = [
     "MarketWebSocket",
     "OrderbookManager",
     "OrderbookSnapshot",
+    "MarketWebSocketPool",
     # Utility functions
     "create_bot_from_env",
     "validate_address",
@@ -32,7 +32,7 @@ Example:
 import os
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List, Callable, TypeVar
+from typing import Optional, Dict, Any, List, Callable, Tuple, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -40,6 +40,9 @@ from .config import Config, BuilderConfig
 from .signer import OrderSigner, Order
 from .client import ClobClient, RelayerClient, ApiCredentials
 from .crypto import KeyManager, CryptoError, InvalidPasswordError
+from .http import AsyncHttpTransport
+from .rate_limit import PRIORITY_NORMAL
+from .signing_pool import SigningExecutor
 
 
 # Configure logging
@@ -113,6 +116,8 @@ class TradingBot:
         signer: Order signer instance
         clob_client: CLOB API client
         relayer_client: Relayer API client (if gasless enabled)
+        signing_executor: Process pool signing orders off the event loop
+            (None until start_signing_pool() is called)
     """
 
     def __init__(
@@ -185,7 +190,10 @@ class TradingBot:
         self.signer: Optional[OrderSigner] = None
         self.clob_client: Optional[ClobClient] = None
         self.relayer_client: Optional[RelayerClient] = None
+        self.http_transport: Optional[AsyncHttpTransport] = None
         self._api_creds: Optional[ApiCredentials] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self.signing_executor: Optional[SigningExecutor] = None
 
         # Load private key
         if private_key:
@@ -245,6 +253,13 @@ class TradingBot:
 
     def _init_clients(self) -> None:
         """Initialize API clients."""
+        http_config = self.config.http
+        self.http_transport = AsyncHttpTransport(
+            max_connections_per_host=http_config.pool_maxsize,
+            max_keepalive_connections=http_config.pool_maxsize,
+            http_config=http_config,
+        )
+
         # CLOB client
         self.clob_client = ClobClient(
             host=self.config.clob.host,
@@ -253,6 +268,8 @@ class TradingBot:
             funder=self.config.safe_address,
             api_creds=self._api_creds,
             builder_creds=self.config.builder if self.config.use_gasless else None,
+            async_transport=self.http_transport,
+            http_config=http_config,
         )
 
         # Relayer client (for gasless)
@@ -262,6 +279,7 @@ class TradingBot:
                 chain_id=self.config.clob.chain_id,
                 builder_creds=self.config.builder,
                 tx_type=self.config.relayer.tx_type,
+                http_config=http_config,
             )
             logger.info("Relayer client initialized (gasless enabled)")
 
@@ -269,6 +287,70 @@ class TradingBot:
         """Run a blocking call in a worker thread to avoid event loop stalls."""
         return await asyncio.to_thread(func, *args, **kwargs)
 
+    async def warm_up(self) -> int:
+        """
+        Pre-open CLOB connections and start keep-alive pings.
+
+        Controlled by config.http (prewarm, prewarm_connections,
+        keepalive_interval). Avoids paying TCP+TLS setup on the first order.
+
+        Returns:
+            Number of connections that answered
+        """
+        http_config = self.config.http
+        if not self.clob_client or not self.http_transport:
+            return 0
+
+        opened = 0
+        url = self.clob_client.base_url + "/"
+        if http_config.prewarm:
+            opened = await self.http_transport.prewarm(url, http_config.prewarm_connections)
+            logger.debug(f"Pre-warmed {opened} CLOB connection(s)")
+
+        if http_config.keepalive_interval > 0 and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(
+                self.http_transport.keepalive(url, http_config.keepalive_interval)
+            )
+        return opened
+
+    async def start_signing_pool(self, max_workers: Optional[int] = None) -> int:
+        """
+        Sign orders in worker processes instead of on the event loop.
+
+        The private key is loaded once per worker. Afterwards place_order
+        and place_orders sign through the pool, so bursts sign in parallel
+        while WebSocket processing continues.
+
+        Args:
+            max_workers: Worker processes (default: CPU count, at most 8)
+
+        Returns:
+            Number of workers started
+        """
+        signer = self.require_signer()
+        if self.signing_executor is None:
+            self.signing_executor = SigningExecutor(signer, max_workers=max_workers)
+        workers = await self.signing_executor.warm_up()
+        logger.info(f"Signing pool started ({workers} workers)")
+        return workers
+
+    async def close(self) -> None:
+        """Stop keep-alive pings, the signing pool and async connection pools."""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+
+        if self.signing_executor:
+            await asyncio.to_thread(self.signing_executor.shutdown)
+            self.signing_executor = None
+
+        if self.http_transport:
+            await self.http_transport.aclose()
+
     def is_initialized(self) -> bool:
         """Check if bot is properly initialized."""
         return (
@@ -311,29 +393,49 @@ class TradingBot:
         signer = self.require_signer()
 
         try:
-            # Create order
-            order = Order(
-                token_id=token_id,
-                price=price,
-                size=size,
-                side=side,
-                maker=self.config.safe_address,
-                fee_rate_bps=fee_rate_bps,
+            if self.signing_executor:
+                order = self._build_order(token_id, price, size, side, fee_rate_bps)
+                signed = await self.signing_executor.sign_order(order)
+            else:
+                signed = self._sign_order(signer, token_id, price, size, side, fee_rate_bps)
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            return OrderResult(
+                success=False,
+                message=str(e)
             )
 
-            # Sign order
-            signed = signer.sign_order(order)
+        return await self.submit_signed_order(signed, order_type)
+
+    async def submit_signed_order(
+        self,
+        signed: Dict[str, Any],
+        order_type: str = "GTC"
+    ) -> OrderResult:
+        """
+        Submit an order that has already been signed.
+
+        Used with lib.order_pool.PreSignedOrderPool so latency-critical
+        entries skip signing entirely.
+
+        Args:
+            signed: Output of OrderSigner.sign_order
+            order_type: Order type (GTC, GTD, FOK)
 
+        Returns:
+            OrderResult with order status
+        """
+        order = signed.get("order", {})
+        try:
             # Submit to CLOB
-            response = await self._run_in_thread(
-                self.clob_client.post_order,
+            response = await self.clob_client.post_order_async(
                 signed,
                 order_type,
             )
 
             logger.info(
-                f"Order placed: {side} {size}@{price} "
-                f"(token: {token_id[:16]}...)"
+                f"Order placed: {order.get('side')} {order.get('size')}@{order.get('price')} "
+                f"(token: {str(order.get('tokenId', ''))[:16]}...)"
             )
 
             return OrderResult.from_response(response)
@@ -345,13 +447,50 @@ class TradingBot:
                 message=str(e)
             )
 
+    def _sign_order(
+        self,
+        signer: OrderSigner,
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,
+        fee_rate_bps: int = 0
+    ) -> Dict[str, Any]:
+        """Create and sign an order for the configured Safe."""
+        order = self._build_order(token_id, price, size, side, fee_rate_bps)
+        return signer.sign_order(order)
+
+    def _build_order(
+        self,
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,
+        fee_rate_bps: int = 0
+    ) -> Order:
+        """Create an order for the configured Safe."""
+        return Order(
+            token_id=token_id,
+            price=price,
+            size=size,
+            side=side,
+            maker=self.config.safe_address,
+            fee_rate_bps=fee_rate_bps,
+        )
+
     async def place_orders(
         self,
         orders: List[Dict[str, Any]],
-        order_type: str = "GTC"
+        order_type: str = "GTC",
+        use_batch_endpoint: bool = True
     ) -> List[OrderResult]:
         """
-        Place multiple orders.
+        Place multiple orders concurrently.
+
+        All orders are signed up front (in parallel when the signing pool
+        is running) and submitted under the shared CLOB_ORDER rate limit, either
+        via the multi-order endpoint in chunks of MAX_BATCH_ORDERS or as
+        concurrent single-order requests.
 
         Args:
             orders: List of order dictionaries with keys:
@@ -359,27 +498,125 @@ class TradingBot:
                 - price: Price per share
                 - size: Number of shares
                 - side: 'BUY' or 'SELL'
+                - fee_rate_bps: Fee rate in basis points (optional)
             order_type: Order type (GTC, GTD, FOK)
+            use_batch_endpoint: Submit via POST /orders (False = one request each)
 
         Returns:
-            List of OrderResults
-        """
-        results = []
-        for order_data in orders:
-            result = await self.place_order(
-                token_id=order_data["token_id"],
-                price=order_data["price"],
-                size=order_data["size"],
-                side=order_data["side"],
-                order_type=order_type,
-            )
-            results.append(result)
+            List of OrderResults in input order
+        """
+        signer = self.require_signer()
+
+        results: List[Optional[OrderResult]] = [None] * len(orders)
+        built: List[Tuple[int, Order]] = []
+        for index, order_data in enumerate(orders):
+            try:
+                built.append((index, self._build_order(
+                    token_id=order_data["token_id"],
+                    price=order_data["price"],
+                    size=order_data["size"],
+                    side=order_data["side"],
+                    fee_rate_bps=order_data.get("fee_rate_bps", 0),
+                )))
+            except Exception as e:
+                logger.error(f"Invalid order {index}: {e}")
+                results[index] = OrderResult(success=False, message=str(e))
+
+        signed = await self._sign_built_orders(signer, built, results)
 
-            # Small delay between orders to avoid rate limits
-            await asyncio.sleep(0.1)
+        if use_batch_endpoint:
+            chunk_size = ClobClient.MAX_BATCH_ORDERS
+            await asyncio.gather(*(
+                self._submit_order_batch(signed[start:start + chunk_size], order_type, results)
+                for start in range(0, len(signed), chunk_size)
+            ))
+        else:
+            await asyncio.gather(*(
+                self._submit_order(index, signed_order, order_type, results)
+                for index, signed_order in signed
+            ))
 
+        placed = sum(1 for result in results if result and result.success)
+        logger.info(f"Placed {placed}/{len(orders)} orders")
         return results
 
+    async def _sign_built_orders(
+        self,
+        signer: OrderSigner,
+        built: List[Tuple[int, Order]],
+        results: List[Optional[OrderResult]]
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Sign orders (through the signing pool if running, else a worker thread), recording failures."""
+        if self.signing_executor and built:
+            try:
+                signed_orders = await self.signing_executor.sign_orders_batch(
+                    [order for _, order in built]
+                )
+            except Exception as e:
+                logger.error(f"Failed to sign order batch: {e}")
+                for index, _ in built:
+                    results[index] = OrderResult(success=False, message=str(e))
+                return []
+            return [(index, signed) for (index, _), signed in zip(built, signed_orders)]
+
+        # Keep the event loop free while the batch is signed
+        return await asyncio.to_thread(self._sign_orders_sync, signer, built, results)
+
+    @staticmethod
+    def _sign_orders_sync(
+        signer: OrderSigner,
+        built: List[Tuple[int, Order]],
+        results: List[Optional[OrderResult]]
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Sign orders one by one in the calling thread, recording failures."""
+        signed: List[Tuple[int, Dict[str, Any]]] = []
+        for index, order in built:
+            try:
+                signed.append((index, signer.sign_order(order)))
+            except Exception as e:
+                logger.error(f"Failed to sign order {index}: {e}")
+                results[index] = OrderResult(success=False, message=str(e))
+        return signed
+
+    async def _submit_order(
+        self,
+        index: int,
+        signed_order: Dict[str, Any],
+        order_type: str,
+        results: List[Optional[OrderResult]]
+    ) -> None:
+        """Submit one signed order, storing its result at index."""
+        try:
+            response = await self.clob_client.post_order_async(signed_order, order_type)
+            results[index] = OrderResult.from_response(response)
+        except Exception as e:
+            logger.error(f"Failed to place order {index}: {e}")
+            results[index] = OrderResult(success=False, message=str(e))
+
+    async def _submit_order_batch(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        order_type: str,
+        results: List[Optional[OrderResult]]
+    ) -> None:
+        """Submit a chunk via the multi-order endpoint, storing results by index."""
+        try:
+            responses = await self.clob_client.post_orders_async(
+                [signed_order for _, signed_order in chunk],
+                order_type,
+            )
+        except Exception as e:
+            logger.error(f"Failed to place order batch: {e}")
+            for index, _ in chunk:
+                results[index] = OrderResult(success=False, message=str(e))
+            return
+
+        for position, (index, _) in enumerate(chunk):
+            if position < len(responses):
+                results[index] = OrderResult.from_response(responses[position])
+            else:
+                results[index] = OrderResult(success=False, message="No response for order")
+
     async def cancel_order(self, order_id: str) -> OrderResult:
         """
         Cancel a specific order.
@@ -391,7 +628,7 @@ class TradingBot:
             OrderResult with cancellation status
         """
         try:
-            response = await self._run_in_thread(self.clob_client.cancel_order, order_id)
+            response = await self.clob_client.cancel_order_async(order_id)
             logger.info(f"Order cancelled: {order_id}")
             return OrderResult(
                 success=True,
@@ -415,7 +652,7 @@ class TradingBot:
             OrderResult with cancellation status
         """
         try:
-            response = await self._run_in_thread(self.clob_client.cancel_all_orders)
+            response = await self.clob_client.cancel_all_orders_async()
             logger.info("All orders cancelled")
             return OrderResult(
                 success=True,
@@ -442,8 +679,7 @@ class TradingBot:
             OrderResult with cancellation status
         """
         try:
-            response = await self._run_in_thread(
-                self.clob_client.cancel_market_orders,
+            response = await self.clob_client.cancel_market_orders_async(
                 market,
                 asset_id,
             )
@@ -457,15 +693,18 @@ class TradingBot:
             logger.error(f"Failed to cancel market orders: {e}")
             return OrderResult(success=False, message=str(e))
 
-    async def get_open_orders(self) -> List[Dict[str, Any]]:
+    async def get_open_orders(self, priority: int = PRIORITY_NORMAL) -> List[Dict[str, Any]]:
         """
         Get all open orders.
 
+        Args:
+            priority: Rate limiter priority (PRIORITY_LOW for background polling)
+
         Returns:
             List of open orders
         """
         try:
-            orders = await self._run_in_thread(self.clob_client.get_open_orders)
+            orders = await self.clob_client.get_open_orders_async(priority=priority)
             logger.debug(f"Retrieved {len(orders)} open orders")
             return orders
         except Exception as e:
@@ -483,7 +722,7 @@ class TradingBot:
             Order details or None
         """
         try:
-            return await self._run_in_thread(self.clob_client.get_order, order_id)
+            return await self.clob_client.get_order_async(order_id)
         except Exception as e:
             logger.error(f"Failed to get order {order_id}: {e}")
             return None
@@ -504,7 +743,7 @@ class TradingBot:
             List of trades
         """
         try:
-            trades = await self._run_in_thread(self.clob_client.get_trades, token_id, limit)
+            trades = await self.clob_client.get_trades_async(token_id, limit)
             logger.debug(f"Retrieved {len(trades)} trades")
             return trades
         except Exception as e:
@@ -522,7 +761,7 @@ class TradingBot:
             Order book data
         """
         try:
-            return await self._run_in_thread(self.clob_client.get_order_book, token_id)
+            return await self.clob_client.get_order_book_async(token_id)
         except Exception as e:
             logger.error(f"Failed to get order book: {e}")
             return {}
@@ -538,7 +777,7 @@ class TradingBot:
             Price data
         """
         try:
-            return await self._run_in_thread(self.clob_client.get_market_price, token_id)
+            return await self.clob_client.get_market_price_async(token_id)
         except Exception as e:
             logger.error(f"Failed to get market price: {e}")
             return {}
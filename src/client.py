@@ -8,7 +8,8 @@ Provides clients for interacting with:
 Features:
 - Gasless transactions via Builder Program
 - HMAC authentication for Builder APIs
-- Automatic retry and error handling
+- Retries by error class with jittered backoff and a shared retry budget
+- Async variants (*_async) on a shared keep-alive transport
 
 Example:
     from src.client import ClobClient, RelayerClient
@@ -25,20 +26,58 @@ Example:
         chain_id=137,
         builder_creds=builder_creds
     )
+
+    # From a coroutine: no worker thread per call
+    book = await clob.get_order_book_async(token_id)
 """
 
+import asyncio
 import time
 import hmac
 import hashlib
 import base64
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 import requests
 
-from .config import BuilderConfig
-from .http import ThreadLocalSessionMixin
+from .codec import get_dumps
+from .config import BuilderConfig, HttpConfig
+from .rate_limit import (
+    CLOB_ORDER,
+    CLOB_READ,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    RELAYER,
+    RateLimiter,
+    get_rate_limiter,
+)
+from .retry import RetryBudget, RetryPolicy, classify_error, get_retry_budget, retry_after_from
+from .http import (
+    AsyncHttpTransport,
+    ThreadLocalSessionMixin,
+    TransportError,
+    get_async_transport,
+)
+
+
+# Compact JSON encoder for request bodies (orjson/msgspec when installed)
+_dumps_body = get_dumps()
+
+
+def encode_body(body: Any) -> Tuple[bytes, str]:
+    """
+    Serialize a request body once for signing and sending.
+
+    Args:
+        body: JSON-serializable body
+
+    Returns:
+        (bytes to send, the same bytes as text for the HMAC message)
+    """
+    data = _dumps_body(body)
+    return data, data.decode("utf-8")
 
 
 class ApiError(Exception):
@@ -79,6 +118,137 @@ class ApiCredentials:
         return bool(self.api_key and self.secret and self.passphrase)
 
 
+@dataclass
+class PreparedRequest:
+    """Endpoint call ready to send, shared by sync and async methods."""
+    method: str
+    endpoint: str
+    data: Optional[Any] = None
+    headers: Optional[Dict[str, str]] = None
+    params: Optional[Dict[str, Any]] = None
+    rate_class: Optional[str] = None  # Endpoint class (default: client's RATE_CLASS)
+    priority: int = PRIORITY_NORMAL
+    signed_body: Optional[str] = None  # Body to HMAC-sign per attempt (None = unsigned)
+
+
+class HmacHeaders:
+    """
+    Precomputed HMAC key and header template for one set of credentials.
+
+    The secret is decoded and keyed into an hmac object once; each request
+    copies it, hashes its own message and fills in the timestamp and
+    signature of a copy of the static headers.
+    """
+
+    def __init__(
+        self,
+        source: Tuple[str, ...],
+        key: bytes,
+        headers: Dict[str, str],
+        timestamp_header: str,
+        signature_header: str,
+        base64_digest: bool
+    ):
+        """
+        Args:
+            source: Credential fields the template was built from
+            key: HMAC key bytes
+            headers: Headers in send order (timestamp/signature filled per request)
+            timestamp_header: Name of the timestamp header
+            signature_header: Name of the signature header
+            base64_digest: URL-safe base64 digest (False = hex digest)
+        """
+        self.source = source
+        self._mac = hmac.new(key, digestmod=hashlib.sha256)
+        self._headers = headers
+        self._timestamp_header = timestamp_header
+        self._signature_header = signature_header
+        self._base64_digest = base64_digest
+
+    @classmethod
+    def for_builder(cls, creds: BuilderConfig) -> "HmacHeaders":
+        """Builder HMAC headers (hex digest of the raw secret)."""
+        return cls(
+            source=(creds.api_key, creds.api_secret, creds.api_passphrase),
+            key=creds.api_secret.encode(),
+            headers={
+                "POLY_BUILDER_API_KEY": creds.api_key,
+                "POLY_BUILDER_TIMESTAMP": "",
+                "POLY_BUILDER_PASSPHRASE": creds.api_passphrase,
+                "POLY_BUILDER_SIGNATURE": "",
+            },
+            timestamp_header="POLY_BUILDER_TIMESTAMP",
+            signature_header="POLY_BUILDER_SIGNATURE",
+            base64_digest=False,
+        )
+
+    @classmethod
+    def for_api_creds(cls, creds: ApiCredentials, address: str) -> "HmacHeaders":
+        """
+        L2 API headers.
+
+        The secret is URL-safe base64; if it does not decode, the raw
+        secret is used with a hex digest instead.
+        """
+        try:
+            key = base64.urlsafe_b64decode(creds.secret)
+            base64_digest = True
+        except Exception:
+            # Fallback: use secret directly if not base64 encoded
+            key = creds.secret.encode()
+            base64_digest = False
+
+        return cls(
+            source=(creds.api_key, creds.secret, creds.passphrase, address),
+            key=key,
+            headers={
+                "POLY_ADDRESS": address,
+                "POLY_API_KEY": creds.api_key,
+                "POLY_TIMESTAMP": "",
+                "POLY_PASSPHRASE": creds.passphrase,
+                "POLY_SIGNATURE": "",
+            },
+            timestamp_header="POLY_TIMESTAMP",
+            signature_header="POLY_SIGNATURE",
+            base64_digest=base64_digest,
+        )
+
+    def sign(self, timestamp: str, message: str) -> Dict[str, str]:
+        """
+        Headers for one request.
+
+        Args:
+            timestamp: Timestamp included in the message
+            message: timestamp + method + path + body
+
+        Returns:
+            New header dictionary
+        """
+        mac = self._mac.copy()
+        mac.update(message.encode("utf-8"))
+        if self._base64_digest:
+            signature = base64.urlsafe_b64encode(mac.digest()).decode("utf-8")
+        else:
+            signature = mac.hexdigest()
+
+        headers = self._headers.copy()
+        headers[self._timestamp_header] = timestamp
+        headers[self._signature_header] = signature
+        return headers
+
+
+def _builder_hmac(
+    cached: Optional[HmacHeaders],
+    creds: Optional[BuilderConfig]
+) -> Optional[HmacHeaders]:
+    """Cached builder headers, rebuilt if the credentials changed."""
+    if not creds or not creds.is_configured():
+        return None
+    if cached is None or cached.source != (creds.api_key, creds.api_secret, creds.api_passphrase):
+        return HmacHeaders.for_builder(creds)
+    return cached
+
+
 class ApiClient(ThreadLocalSessionMixin):
     """
     Base HTTP client with common functionality.
@@ -87,13 +257,22 @@ class ApiClient(ThreadLocalSessionMixin):
     - Automatic JSON handling
     - Request/response logging
     - Error handling
+    - Async requests through an AsyncHttpTransport
     """
 
+    # Rate limiter endpoint class for requests (None = not limited)
+    RATE_CLASS: Optional[str] = None
+
     def __init__(
         self,
         base_url: str,
         timeout: int = 30,
-        retry_count: int = 3
+        retry_count: int = 3,
+        async_transport: Optional[AsyncHttpTransport] = None,
+        http_config: Optional[HttpConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None
     ):
         """
         Initialize API client.
@@ -101,12 +280,72 @@ class ApiClient(ThreadLocalSessionMixin):
         Args:
             base_url: Base URL for all requests
             timeout: Request timeout in seconds
-            retry_count: Number of retries on failure
+            retry_count: Attempts per request (ignored if retry_policy is given)
+            async_transport: Transport for async requests (default: shared)
+            http_config: Connection pool settings for sync sessions
+            retry_policy: Retry rules (default: RetryPolicy(max_attempts=retry_count))
+            retry_budget: Retry budget (default: shared process-wide budget)
+            rate_limiter: Request limiter (default: shared process-wide limiter)
         """
-        super().__init__()
+        super().__init__(http_config=http_config)
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.retry_count = retry_count
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=retry_count)
+        self._retry_budget = retry_budget
+        self._rate_limiter = rate_limiter
+        self._async_transport = async_transport
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Limiter every request (and retry) waits on."""
+        return self._rate_limiter or get_rate_limiter()
+
+    @property
+    def retry_budget(self) -> RetryBudget:
+        """Budget that retries are spent from."""
+        return self._retry_budget or get_retry_budget()
+
+    def _retry_delay(self, method: str, attempt: int, error: Exception) -> Optional[float]:
+        """Seconds to wait before retrying a failed attempt, or None to give up."""
+        return self.retry_policy.next_delay(
+            method,
+            attempt,
+            classify_error(error),
+            retry_after=retry_after_from(error),
+            budget=self.retry_budget,
+        )
+
+    @property
+    def async_transport(self) -> AsyncHttpTransport:
+        """Transport used by async requests."""
+        return self._async_transport or get_async_transport()
+
+    def _build_headers(
+        self,
+        method: str,
+        path: str,
+        body: str = ""
+    ) -> Dict[str, str]:
+        """Authentication headers for one request (none by default)."""
+        return {}
+
+    def _attempt_headers(
+        self,
+        headers: Dict[str, str],
+        method: str,
+        endpoint: str,
+        signed_body: Optional[str]
+    ) -> Dict[str, str]:
+        """
+        Headers for one attempt.
+
+        Auth headers are signed only once the rate limiter let the attempt
+        through, so their timestamp is never older than the send.
+        """
+        if signed_body is None:
+            return headers
+        return {**headers, **self._build_headers(method.upper(), endpoint, signed_body)}
 
     def _request(
         self,
@@ -114,17 +353,27 @@ class ApiClient(ThreadLocalSessionMixin):
         endpoint: str,
         data: Optional[Any] = None,
         headers: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        rate_class: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        signed_body: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request with error handling.
 
+        Failures are retried according to retry_policy: non-idempotent
+        requests only when the server cannot have processed them.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
-            data: Request body data
+            data: Request body (bytes are sent as-is, e.g. from encode_body)
             headers: Additional headers
             params: Query parameters
+            rate_class: Endpoint class for the rate limiter (default: RATE_CLASS)
+            priority: Rate limiter priority
+            signed_body: Body to sign into fresh auth headers on each
+                attempt ("" for no body; None sends the request unsigned)
 
         Returns:
             Response JSON data
@@ -133,29 +382,35 @@ class ApiClient(ThreadLocalSessionMixin):
             ApiError: On request failure
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        body = {"data": data} if isinstance(data, bytes) else {"json": data}
         request_headers = {"Content-Type": "application/json"}
 
         if headers:
             request_headers.update(headers)
 
-        last_error = None
-        for attempt in range(self.retry_count):
+        rate_class = rate_class or self.RATE_CLASS
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            self.rate_limiter.acquire_sync(rate_class, priority)
+            attempt_headers = self._attempt_headers(request_headers, method, endpoint, signed_body)
             try:
                 session = self.session
                 if method.upper() == "GET":
                     response = session.get(
-                        url, headers=request_headers,
+                        url, headers=attempt_headers,
                         params=params, timeout=self.timeout
                     )
                 elif method.upper() == "POST":
                     response = session.post(
-                        url, headers=request_headers,
-                        json=data, params=params, timeout=self.timeout
+                        url, headers=attempt_headers,
+                        params=params, timeout=self.timeout, **body
                     )
                 elif method.upper() == "DELETE":
                     response = session.delete(
-                        url, headers=request_headers,
-                        json=data, params=params, timeout=self.timeout
+                        url, headers=attempt_headers,
+                        params=params, timeout=self.timeout, **body
                     )
                 else:
                     raise ApiError(f"Unsupported method: {method}")
@@ -164,11 +419,98 @@ class ApiClient(ThreadLocalSessionMixin):
                 return response.json() if response.text else {}
 
             except requests.exceptions.RequestException as e:
-                last_error = e
-                if attempt < self.retry_count - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                delay = self._retry_delay(method, attempt, e)
+                if delay is None:
+                    raise ApiError(f"Request failed after {attempt} attempts: {e}") from e
+                time.sleep(delay)
 
-        raise ApiError(f"Request failed after {self.retry_count} attempts: {last_error}")
+    async def _request_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        rate_class: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        signed_body: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of _request using the async transport.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            data: Request body (bytes are sent as-is, e.g. from encode_body)
+            headers: Additional headers
+            params: Query parameters
+            rate_class: Endpoint class for the rate limiter (default: RATE_CLASS)
+            priority: Rate limiter priority
+            signed_body: Body to sign into fresh auth headers on each
+                attempt ("" for no body; None sends the request unsigned)
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            ApiError: On request failure
+        """
+        if method.upper() not in ("GET", "POST", "DELETE"):
+            raise ApiError(f"Unsupported method: {method}")
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        request_headers = {"Content-Type": "application/json"}
+
+        if headers:
+            request_headers.update(headers)
+
+        rate_class = rate_class or self.RATE_CLASS
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire(rate_class, priority)
+            attempt_headers = self._attempt_headers(request_headers, method, endpoint, signed_body)
+            try:
+                response = await self.async_transport.request(
+                    method, url, headers=attempt_headers, params=params,
+                    json_data=data if method.upper() != "GET" else None,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                return response.json() if response.text else {}
+
+            except TransportError as e:
+                delay = self._retry_delay(method, attempt, e)
+                if delay is None:
+                    raise ApiError(f"Request failed after {attempt} attempts: {e}") from e
+                await asyncio.sleep(delay)
+
+    def _send(self, request: PreparedRequest) -> Dict[str, Any]:
+        """Send a prepared request."""
+        return self._request(
+            request.method,
+            request.endpoint,
+            data=request.data,
+            headers=request.headers,
+            params=request.params,
+            rate_class=request.rate_class,
+            priority=request.priority,
+            signed_body=request.signed_body
+        )
+
+    async def _send_async(self, request: PreparedRequest) -> Dict[str, Any]:
+        """Send a prepared request asynchronously."""
+        return await self._request_async(
+            request.method,
+            request.endpoint,
+            data=request.data,
+            headers=request.headers,
+            params=request.params,
+            rate_class=request.rate_class,
+            priority=request.priority,
+            signed_body=request.signed_body
+        )
 
 
 class ClobClient(ApiClient):
@@ -190,6 +532,11 @@ class ClobClient(ApiClient):
         )
     """
 
+    # Orders accepted per POST /orders request
+    MAX_BATCH_ORDERS = 15
+
+    RATE_CLASS = CLOB_READ
+
     def __init__(
         self,
         host: str = "https://clob.polymarket.com",
@@ -198,7 +545,12 @@ class ClobClient(ApiClient):
         funder: str = "",
         api_creds: Optional[ApiCredentials] = None,
         builder_creds: Optional[BuilderConfig] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        async_transport: Optional[AsyncHttpTransport] = None,
+        http_config: Optional[HttpConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None
     ):
         """
         Initialize CLOB client.
@@ -211,8 +563,21 @@ class ClobClient(ApiClient):
             api_creds: User API credentials (optional)
             builder_creds: Builder credentials for attribution (optional)
             timeout: Request timeout
+            async_transport: Transport for *_async methods (default: shared)
+            http_config: Connection pool settings for sync sessions
+            retry_policy: Retry rules (default: 3 attempts, jittered backoff)
+            retry_budget: Retry budget (default: shared process-wide budget)
+            rate_limiter: Request limiter (default: shared process-wide limiter)
         """
-        super().__init__(base_url=host, timeout=timeout)
+        super().__init__(
+            base_url=host,
+            timeout=timeout,
+            async_transport=async_transport,
+            http_config=http_config,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+        )
         self.host = host
         self.chain_id = chain_id
         self.signature_type = signature_type
@@ -220,6 +585,20 @@ class ClobClient(ApiClient):
         self.api_creds = api_creds
         self.builder_creds = builder_creds
 
+        # HMAC keys and header templates, built on first use
+        self._builder_hmac: Optional[HmacHeaders] = None
+        self._api_hmac: Optional[HmacHeaders] = None
+
+    def _api_creds_hmac(self) -> Optional[HmacHeaders]:
+        """Cached L2 headers, rebuilt if the credentials or funder changed."""
+        creds = self.api_creds
+        if not creds or not creds.is_valid():
+            return None
+        cached = self._api_hmac
+        if cached is None or cached.source != (creds.api_key, creds.secret, creds.passphrase, self.funder):
+            cached = self._api_hmac = HmacHeaders.for_api_creds(creds, self.funder)
+        return cached
+
     def _build_headers(
         self,
         method: str,
@@ -240,54 +619,18 @@ class ClobClient(ApiClient):
             Dictionary of headers
         """
         headers = {}
+        timestamp = str(int(time.time()))
+        message = f"{timestamp}{method}{path}{body}"
 
         # Builder HMAC authentication
-        if self.builder_creds and self.builder_creds.is_configured():
-            timestamp = str(int(time.time()))
-
-            message = f"{timestamp}{method}{path}{body}"
-            signature = hmac.new(
-                self.builder_creds.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256
-            ).hexdigest()
-
-            headers.update({
-                "POLY_BUILDER_API_KEY": self.builder_creds.api_key,
-                "POLY_BUILDER_TIMESTAMP": timestamp,
-                "POLY_BUILDER_PASSPHRASE": self.builder_creds.api_passphrase,
-                "POLY_BUILDER_SIGNATURE": signature,
-            })
+        self._builder_hmac = _builder_hmac(self._builder_hmac, self.builder_creds)
+        if self._builder_hmac:
+            headers.update(self._builder_hmac.sign(timestamp, message))
 
         # User API credentials (L2 authentication)
-        if self.api_creds and self.api_creds.is_valid():
-            timestamp = str(int(time.time()))
-
-            # Build message: timestamp + method + path + body
-            message = f"{timestamp}{method}{path}"
-            if body:
-                message += body
-
-            # Decode base64 secret and create HMAC signature
-            try:
-                base64_secret = base64.urlsafe_b64decode(self.api_creds.secret)
-                h = hmac.new(base64_secret, message.encode("utf-8"), hashlib.sha256)
-                signature = base64.urlsafe_b64encode(h.digest()).decode("utf-8")
-            except Exception:
-                # Fallback: use secret directly if not base64 encoded
-                signature = hmac.new(
-                    self.api_creds.secret.encode(),
-                    message.encode(),
-                    hashlib.sha256
-                ).hexdigest()
-
-            headers.update({
-                "POLY_ADDRESS": self.funder,
-                "POLY_API_KEY": self.api_creds.api_key,
-                "POLY_TIMESTAMP": timestamp,
-                "POLY_PASSPHRASE": self.api_creds.passphrase,
-                "POLY_SIGNATURE": signature,
-            })
+        api_hmac = self._api_creds_hmac()
+        if api_hmac:
+            headers.update(api_hmac.sign(timestamp, message))
 
         return headers
 
@@ -380,6 +723,10 @@ class ClobClient(ApiClient):
         """Set API credentials for authenticated requests."""
         self.api_creds = creds
 
+    def _get_order_book_request(self, token_id: str) -> PreparedRequest:
+        """Build GET /book."""
+        return PreparedRequest("GET", "/book", params={"token_id": token_id})
+
     def get_order_book(self, token_id: str) -> Dict[str, Any]:
         """
         Get order book for a token.
@@ -390,11 +737,15 @@ class ClobClient(ApiClient):
         Returns:
             Order book data
         """
-        return self._request(
-            "GET",
-            "/book",
-            params={"token_id": token_id}
-        )
+        return self._send(self._get_order_book_request(token_id))
+
+    async def get_order_book_async(self, token_id: str) -> Dict[str, Any]:
+        """Async version of get_order_book."""
+        return await self._send_async(self._get_order_book_request(token_id))
+
+    def _get_market_price_request(self, token_id: str) -> PreparedRequest:
+        """Build GET /price."""
+        return PreparedRequest("GET", "/price", params={"token_id": token_id})
 
     def get_market_price(self, token_id: str) -> Dict[str, Any]:
         """
@@ -406,33 +757,44 @@ class ClobClient(ApiClient):
         Returns:
             Price data
         """
-        return self._request(
-            "GET",
-            "/price",
-            params={"token_id": token_id}
-        )
+        return self._send(self._get_market_price_request(token_id))
+
+    async def get_market_price_async(self, token_id: str) -> Dict[str, Any]:
+        """Async version of get_market_price."""
+        return await self._send_async(self._get_market_price_request(token_id))
 
-    def get_open_orders(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _unwrap_list(result: Any) -> List[Dict[str, Any]]:
+        """Extract the item list from a possibly paginated response."""
+        if isinstance(result, dict) and "data" in result:
+            return result.get("data", [])
+        return result if isinstance(result, list) else []
+
+    def _get_open_orders_request(self, priority: int) -> PreparedRequest:
+        """Build GET /data/orders."""
+        endpoint = "/data/orders"
+        return PreparedRequest("GET", endpoint, priority=priority, signed_body="")
+
+    def get_open_orders(self, priority: int = PRIORITY_NORMAL) -> List[Dict[str, Any]]:
         """
         Get all open orders for the funder.
 
+        Args:
+            priority: Rate limiter priority (PRIORITY_LOW for background polling)
+
         Returns:
             List of open orders
         """
-        endpoint = "/data/orders"
+        return self._unwrap_list(self._send(self._get_open_orders_request(priority)))
 
-        headers = self._build_headers("GET", endpoint)
+    async def get_open_orders_async(self, priority: int = PRIORITY_NORMAL) -> List[Dict[str, Any]]:
+        """Async version of get_open_orders."""
+        return self._unwrap_list(await self._send_async(self._get_open_orders_request(priority)))
 
-        result = self._request(
-            "GET",
-            endpoint,
-            headers=headers
-        )
-
-        # Handle paginated response
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
+    def _get_order_request(self, order_id: str) -> PreparedRequest:
+        """Build GET /data/order/{id}."""
+        endpoint = f"/data/order/{order_id}"
+        return PreparedRequest("GET", endpoint, signed_body="")
 
     def get_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -444,9 +806,19 @@ class ClobClient(ApiClient):
         Returns:
             Order details
         """
-        endpoint = f"/data/order/{order_id}"
-        headers = self._build_headers("GET", endpoint)
-        return self._request("GET", endpoint, headers=headers)
+        return self._send(self._get_order_request(order_id))
+
+    async def get_order_async(self, order_id: str) -> Dict[str, Any]:
+        """Async version of get_order."""
+        return await self._send_async(self._get_order_request(order_id))
+
+    def _get_trades_request(self, token_id: Optional[str], limit: int) -> PreparedRequest:
+        """Build GET /data/trades."""
+        endpoint = "/data/trades"
+        params: Dict[str, Any] = {"limit": limit}
+        if token_id:
+            params["token_id"] = token_id
+        return PreparedRequest("GET", endpoint, params=params, signed_body="")
 
     def get_trades(
         self,
@@ -463,23 +835,49 @@ class ClobClient(ApiClient):
         Returns:
             List of trades
         """
-        endpoint = "/data/trades"
-        headers = self._build_headers("GET", endpoint)
-        params: Dict[str, Any] = {"limit": limit}
-        if token_id:
-            params["token_id"] = token_id
+        return self._unwrap_list(self._send(self._get_trades_request(token_id, limit)))
 
-        result = self._request(
-            "GET",
-            endpoint,
-            headers=headers,
-            params=params
+    async def get_trades_async(
+        self,
+        token_id: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Async version of get_trades."""
+        return self._unwrap_list(
+            await self._send_async(self._get_trades_request(token_id, limit))
         )
 
-        # Handle paginated response
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
+    def _order_payload(
+        self,
+        signed_order: Dict[str, Any],
+        order_type: str
+    ) -> Dict[str, Any]:
+        """Build the request body for one signed order."""
+        body = {
+            "order": signed_order.get("order", signed_order),
+            "owner": self.funder,
+            "orderType": order_type,
+        }
+
+        # Add signature
+        if "signature" in signed_order:
+            body["signature"] = signed_order["signature"]
+
+        return body
+
+    def _post_order_request(
+        self,
+        signed_order: Dict[str, Any],
+        order_type: str
+    ) -> PreparedRequest:
+        """Build POST /order."""
+        endpoint = "/order"
+        body = self._order_payload(signed_order, order_type)
+        data, body_json = encode_body(body)
+        return PreparedRequest(
+            "POST", endpoint, data=data, signed_body=body_json,
+            rate_class=CLOB_ORDER, priority=PRIORITY_HIGH,
+        )
 
     def post_order(
         self,
@@ -496,27 +894,65 @@ class ClobClient(ApiClient):
         Returns:
             Response with order ID and status
         """
-        endpoint = "/order"
+        return self._send(self._post_order_request(signed_order, order_type))
 
-        # Build request body
-        body = {
-            "order": signed_order.get("order", signed_order),
-            "owner": self.funder,
-            "orderType": order_type,
-        }
+    async def post_order_async(
+        self,
+        signed_order: Dict[str, Any],
+        order_type: str = "GTC"
+    ) -> Dict[str, Any]:
+        """Async version of post_order."""
+        return await self._send_async(self._post_order_request(signed_order, order_type))
 
-        # Add signature
-        if "signature" in signed_order:
-            body["signature"] = signed_order["signature"]
+    def _post_orders_request(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: str
+    ) -> PreparedRequest:
+        """Build POST /orders."""
+        endpoint = "/orders"
+        body = [self._order_payload(order, order_type) for order in signed_orders]
+        data, body_json = encode_body(body)
+        return PreparedRequest(
+            "POST", endpoint, data=data, signed_body=body_json,
+            rate_class=CLOB_ORDER, priority=PRIORITY_HIGH,
+        )
 
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
+    def post_orders(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: str = "GTC"
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit several signed orders in one request.
 
-        return self._request(
-            "POST",
-            endpoint,
-            data=body,
-            headers=headers
+        Args:
+            signed_orders: Orders with signatures (at most MAX_BATCH_ORDERS)
+            order_type: Order type applied to every order (GTC, GTD, FOK)
+
+        Returns:
+            One response per order, in request order
+        """
+        return self._unwrap_list(self._send(self._post_orders_request(signed_orders, order_type)))
+
+    async def post_orders_async(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: str = "GTC"
+    ) -> List[Dict[str, Any]]:
+        """Async version of post_orders."""
+        return self._unwrap_list(
+            await self._send_async(self._post_orders_request(signed_orders, order_type))
+        )
+
+    def _cancel_order_request(self, order_id: str) -> PreparedRequest:
+        """Build DELETE /order."""
+        endpoint = "/order"
+        body = {"orderID": order_id}
+        data, body_json = encode_body(body)
+        return PreparedRequest(
+            "DELETE", endpoint, data=data, signed_body=body_json,
+            rate_class=CLOB_ORDER, priority=PRIORITY_HIGH,
         )
 
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
@@ -529,16 +965,19 @@ class ClobClient(ApiClient):
         Returns:
             Cancellation response
         """
-        endpoint = "/order"
-        body = {"orderID": order_id}
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("DELETE", endpoint, body_json)
+        return self._send(self._cancel_order_request(order_id))
 
-        return self._request(
-            "DELETE",
-            endpoint,
-            data=body,
-            headers=headers
+    async def cancel_order_async(self, order_id: str) -> Dict[str, Any]:
+        """Async version of cancel_order."""
+        return await self._send_async(self._cancel_order_request(order_id))
+
+    def _cancel_orders_request(self, order_ids: List[str]) -> PreparedRequest:
+        """Build DELETE /orders."""
+        endpoint = "/orders"
+        data, body_json = encode_body(order_ids)
+        return PreparedRequest(
+            "DELETE", endpoint, data=data, signed_body=body_json,
+            rate_class=CLOB_ORDER, priority=PRIORITY_HIGH,
         )
 
     def cancel_orders(self, order_ids: List[str]) -> Dict[str, Any]:
@@ -551,15 +990,18 @@ class ClobClient(ApiClient):
         Returns:
             Cancellation response with canceled and not_canceled lists
         """
-        endpoint = "/orders"
-        body_json = json.dumps(order_ids, separators=(',', ':'))
-        headers = self._build_headers("DELETE", endpoint, body_json)
+        return self._send(self._cancel_orders_request(order_ids))
 
-        return self._request(
-            "DELETE",
-            endpoint,
-            data=order_ids,
-            headers=headers
+    async def cancel_orders_async(self, order_ids: List[str]) -> Dict[str, Any]:
+        """Async version of cancel_orders."""
+        return await self._send_async(self._cancel_orders_request(order_ids))
+
+    def _cancel_all_orders_request(self) -> PreparedRequest:
+        """Build DELETE /cancel-all."""
+        endpoint = "/cancel-all"
+        return PreparedRequest(
+            "DELETE", endpoint, signed_body="",
+            rate_class=CLOB_ORDER, priority=PRIORITY_HIGH,
         )
 
     def cancel_all_orders(self) -> Dict[str, Any]:
@@ -569,13 +1011,30 @@ class ClobClient(ApiClient):
         Returns:
             Cancellation response with canceled and not_canceled lists
         """
-        endpoint = "/cancel-all"
-        headers = self._build_headers("DELETE", endpoint)
+        return self._send(self._cancel_all_orders_request())
 
-        return self._request(
-            "DELETE",
-            endpoint,
-            headers=headers
+    async def cancel_all_orders_async(self) -> Dict[str, Any]:
+        """Async version of cancel_all_orders."""
+        return await self._send_async(self._cancel_all_orders_request())
+
+    def _cancel_market_orders_request(
+        self,
+        market: Optional[str],
+        asset_id: Optional[str]
+    ) -> PreparedRequest:
+        """Build DELETE /cancel-market-orders."""
+        endpoint = "/cancel-market-orders"
+        body = {}
+
+        if market:
+            body["market"] = market
+        if asset_id:
+            body["asset_id"] = asset_id
+
+        data, body_json = encode_body(body) if body else (None, "")
+        return PreparedRequest(
+            "DELETE", endpoint, data=data, signed_body=body_json,
+            rate_class=CLOB_ORDER, priority=PRIORITY_HIGH,
         )
 
     def cancel_market_orders(
@@ -593,23 +1052,15 @@ class ClobClient(ApiClient):
         Returns:
             Cancellation response with canceled and not_canceled lists
         """
-        endpoint = "/cancel-market-orders"
-        body = {}
-
-        if market:
-            body["market"] = market
-        if asset_id:
-            body["asset_id"] = asset_id
+        return self._send(self._cancel_market_orders_request(market, asset_id))
 
-        body_json = json.dumps(body, separators=(',', ':')) if body else ""
-        headers = self._build_headers("DELETE", endpoint, body_json)
-
-        return self._request(
-            "DELETE",
-            endpoint,
-            data=body if body else None,
-            headers=headers
-        )
+    async def cancel_market_orders_async(
+        self,
+        market: Optional[str] = None,
+        asset_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async version of cancel_market_orders."""
+        return await self._send_async(self._cancel_market_orders_request(market, asset_id))
 
 
 class RelayerClient(ApiClient):
@@ -627,13 +1078,16 @@ class RelayerClient(ApiClient):
         )
     """
 
+    RATE_CLASS = RELAYER
+
     def __init__(
         self,
         host: str = "https://relayer-v2.polymarket.com",
         chain_id: int = 137,
         builder_creds: Optional[BuilderConfig] = None,
         tx_type: str = "SAFE",
-        timeout: int = 60
+        timeout: int = 60,
+        http_config: Optional[HttpConfig] = None
     ):
         """
         Initialize Relayer client.
@@ -644,11 +1098,13 @@ class RelayerClient(ApiClient):
             builder_creds: Builder credentials
             tx_type: Transaction type (SAFE or PROXY)
             timeout: Request timeout
+            http_config: Connection pool settings for sync sessions
         """
-        super().__init__(base_url=host, timeout=timeout)
+        super().__init__(base_url=host, timeout=timeout, http_config=http_config)
         self.chain_id = chain_id
         self.builder_creds = builder_creds
         self.tx_type = tx_type
+        self._builder_hmac: Optional[HmacHeaders] = None
 
     def _build_headers(
         self,
@@ -657,24 +1113,12 @@ class RelayerClient(ApiClient):
         body: str = ""
     ) -> Dict[str, str]:
         """Build Builder HMAC authentication headers."""
-        if not self.builder_creds or not self.builder_creds.is_configured():
+        self._builder_hmac = _builder_hmac(self._builder_hmac, self.builder_creds)
+        if not self._builder_hmac:
             raise AuthenticationError("Builder credentials required for relayer")
 
         timestamp = str(int(time.time()))
-
-        message = f"{timestamp}{method}{path}{body}"
-        signature = hmac.new(
-            self.builder_creds.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-
-        return {
-            "POLY_BUILDER_API_KEY": self.builder_creds.api_key,
-            "POLY_BUILDER_TIMESTAMP": timestamp,
-            "POLY_BUILDER_PASSPHRASE": self.builder_creds.api_passphrase,
-            "POLY_BUILDER_SIGNATURE": signature,
-        }
+        return self._builder_hmac.sign(timestamp, f"{timestamp}{method}{path}{body}")
 
     def deploy_safe(self, safe_address: str) -> Dict[str, Any]:
         """
@@ -688,14 +1132,12 @@ class RelayerClient(ApiClient):
         """
         endpoint = "/deploy"
         body = {"safeAddress": safe_address}
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
-
+        data, body_json = encode_body(body)
         return self._request(
             "POST",
             endpoint,
-            data=body,
-            headers=headers
+            data=data,
+            signed_body=body_json
         )
 
     def approve_usdc(
@@ -721,14 +1163,12 @@ class RelayerClient(ApiClient):
             "spender": spender,
             "amount": str(amount),
         }
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
-
+        data, body_json = encode_body(body)
         return self._request(
             "POST",
             endpoint,
-            data=body,
-            headers=headers
+            data=data,
+            signed_body=body_json
         )
 
     def approve_token(
@@ -757,12 +1197,10 @@ class RelayerClient(ApiClient):
             "spender": spender,
             "amount": str(amount),
         }
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
-
+        data, body_json = encode_body(body)
         return self._request(
             "POST",
             endpoint,
-            data=body,
-            headers=headers
+            data=data,
+            signed_body=body_json
         )
@@ -0,0 +1,129 @@
+"""
+Codec Module - Pluggable JSON Backends
+
+Resolves the fastest installed JSON implementation for hot paths
+such as WebSocket frame decoding and signed request bodies:
+- orjson (optional)
+- msgspec (optional)
+- json (stdlib fallback, always available)
+
+Example:
+    from src.codec import get_loads, resolve_backend
+
+    backend = resolve_backend("auto")   # "orjson" if installed
+    loads = get_loads(backend)
+    data = loads('{"event_type": "book"}')
+
+    dumps = get_dumps(backend)
+    body = dumps({"orderID": "0x123"})   # b'{"orderID":"0x123"}'
+"""
+
+import json
+import importlib
+import logging
+from typing import Any, Callable, List, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Preference order used by "auto"
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+JsonInput = Union[str, bytes]
+
+
+def _import_backend(name: str) -> Any:
+    """Import a backend module, returning None if it is not installed."""
+    if name == "json":
+        return json
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def available_backends() -> List[str]:
+    """List installed JSON backends in preference order."""
+    return [name for name in JSON_BACKENDS if _import_backend(name) is not None]
+
+
+def resolve_backend(name: str = "auto") -> str:
+    """
+    Resolve a backend name to an installed backend.
+
+    Args:
+        name: "auto", "orjson", "msgspec" or "json"
+
+    Returns:
+        Name of the backend that will be used
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    name = (name or "auto").lower()
+    if name == "auto":
+        return available_backends()[0]
+
+    if name not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend: {name}. Use: {['auto', *JSON_BACKENDS]}"
+        )
+
+    if _import_backend(name) is None:
+        logger.warning(f"JSON backend '{name}' is not installed, falling back to stdlib json")
+        return "json"
+
+    return name
+
+
+def get_loads(backend: str = "auto") -> Callable[[JsonInput], Any]:
+    """
+    Get a loads() function for a backend.
+
+    Args:
+        backend: Backend name (see resolve_backend)
+
+    Returns:
+        Callable decoding str/bytes JSON into Python objects
+    """
+    backend = resolve_backend(backend)
+    if backend == "orjson":
+        return _import_backend("orjson").loads
+    if backend == "msgspec":
+        return _import_backend("msgspec").json.decode
+    return json.loads
+
+
+def _json_dumps_compact(obj: Any) -> bytes:
+    """Stdlib compact encoding (same separators the fast backends use)."""
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def get_dumps(backend: str = "auto") -> Callable[[Any], bytes]:
+    """
+    Get a compact dumps() function for a backend.
+
+    The output has no insignificant whitespace and keeps dict insertion
+    order, so it can be signed and sent as the same bytes.
+
+    Args:
+        backend: Backend name (see resolve_backend)
+
+    Returns:
+        Callable encoding Python objects into UTF-8 JSON bytes
+    """
+    backend = resolve_backend(backend)
+    if backend == "orjson":
+        return _import_backend("orjson").dumps
+    if backend == "msgspec":
+        return _import_backend("msgspec").json.encode
+    return _json_dumps_compact
+
+
+def decode_errors(backend: str = "auto") -> Tuple[Type[Exception], ...]:
+    """Exception types raised by a backend on malformed input."""
+    backend = resolve_backend(backend)
+    if backend == "msgspec":
+        return (_import_backend("msgspec").DecodeError,)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return (json.JSONDecodeError,)
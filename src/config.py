@@ -125,6 +125,17 @@ class RelayerConfig:
         return bool(self.host)
 
 
+@dataclass
+class HttpConfig:
+    """HTTP connection pool configuration."""
+    pool_connections: int = 10  # Hosts cached per session
+    pool_maxsize: int = 10  # Connections kept per host
+    max_retries: int = 0  # Connect-level retries inside the adapter
+    prewarm: bool = True  # Open CLOB connections at bot start
+    prewarm_connections: int = 2  # Connections opened per host when pre-warming
+    keepalive_interval: float = 20.0  # Ping pools idle this long (0 = off)
+
+
 @dataclass
 class Config:
     """
@@ -136,6 +147,7 @@ class Config:
         clob: CLOB API configuration
         relayer: Relayer configuration for gasless transactions
         builder: Builder Program credentials
+        http: HTTP connection pool settings
         default_token_id: Default token ID for trading
         data_dir: Directory for storing credentials and data
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -149,6 +161,7 @@ class Config:
     clob: ClobConfig = field(default_factory=ClobConfig)
     relayer: RelayerConfig = field(default_factory=RelayerConfig)
     builder: BuilderConfig = field(default_factory=BuilderConfig)
+    http: HttpConfig = field(default_factory=HttpConfig)
 
     # Trading defaults
     default_token_id: str = ""
@@ -230,6 +243,23 @@ class Config:
                 api_passphrase=builder_data.get("api_passphrase", ""),
             )
 
+        # HTTP pool config
+        if "http" in data:
+            http_data = data["http"]
+            defaults = HttpConfig()
+            config.http = HttpConfig(
+                pool_connections=int(http_data.get("pool_connections", defaults.pool_connections)),
+                pool_maxsize=int(http_data.get("pool_maxsize", defaults.pool_maxsize)),
+                max_retries=int(http_data.get("max_retries", defaults.max_retries)),
+                prewarm=bool(http_data.get("prewarm", defaults.prewarm)),
+                prewarm_connections=int(
+                    http_data.get("prewarm_connections", defaults.prewarm_connections)
+                ),
+                keepalive_interval=float(
+                    http_data.get("keepalive_interval", defaults.keepalive_interval)
+                ),
+            )
+
         # Trading defaults
         if "default_token_id" in data:
             config.default_token_id = data["default_token_id"]
@@ -395,6 +425,7 @@ class Config:
             "clob": asdict(self.clob),
             "relayer": asdict(self.relayer),
             "builder": asdict(self.builder),
+            "http": asdict(self.http),
             "default_token_id": self.default_token_id,
             "default_size": self.default_size,
             "default_price": self.default_price,
@@ -0,0 +1,184 @@
+"""
+Event Queue Module - Bounded Callback Queues
+
+Decouples WebSocket receive from callback execution:
+- Bounded per-event-type queues drained by their own worker
+- Overflow policies: drop oldest, coalesce per asset, or block
+- Queue-latency metrics on every dispatched event
+
+Example:
+    from src.event_queue import BoundedEventQueue, QueuedEvent, current_event
+
+    queue = BoundedEventQueue(maxsize=1000, policy="coalesce")
+    await queue.put(QueuedEvent(kind="book", args=(snapshot,), key=snapshot.asset_id))
+    event = await queue.get()
+    print(event.latency, event.coalesced)
+
+    # Inside a callback run by a MarketWebSocket dispatch worker:
+    event = current_event()
+    if event and event.latency > 0.5:
+        ...  # acting on old data
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+
+# Overflow policies
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST, COALESCE, BLOCK)
+
+
+@dataclass
+class QueuedEvent:
+    """
+    Callback invocation waiting in a queue.
+
+    Attributes:
+        kind: Event type ("book", "price_change", "trade")
+        args: Callback arguments
+        key: Coalescing key (asset_id for books), None if not coalescible
+        enqueued_at: time.monotonic() when the oldest merged event arrived
+        coalesced: Number of superseded events merged into this one
+        latency: Seconds spent queued (set when dequeued)
+    """
+    kind: str
+    args: Tuple[Any, ...]
+    key: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    coalesced: int = 0
+    latency: float = 0.0
+
+
+@dataclass
+class QueueStats:
+    """Counters and latency metrics for one queue."""
+    enqueued: int = 0
+    dispatched: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    max_depth: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """Mean queue latency of dispatched events."""
+        return self.total_latency / self.dispatched if self.dispatched else 0.0
+
+    def record_latency(self, latency: float) -> None:
+        """Record queue latency for a dispatched event."""
+        self.dispatched += 1
+        self.last_latency = latency
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+
+_current_event: ContextVar[Optional[QueuedEvent]] = ContextVar("current_event", default=None)
+
+
+def current_event() -> Optional[QueuedEvent]:
+    """Event being dispatched in the current worker (None when called inline)."""
+    return _current_event.get()
+
+
+@contextmanager
+def dispatching(event: QueuedEvent) -> Iterator[QueuedEvent]:
+    """Expose `event` through current_event() for the duration of a callback."""
+    token = _current_event.set(event)
+    try:
+        yield event
+    finally:
+        _current_event.reset(token)
+
+
+class BoundedEventQueue:
+    """
+    Bounded FIFO with a configurable overflow policy.
+
+    Policies:
+        drop_oldest: Discard the oldest queued event to make room
+        coalesce: Replace a queued event with the same key in place
+            (the newest args win, the slot keeps its queue position);
+            falls back to drop_oldest when still full
+        block: put() waits for the consumer to make room
+    """
+
+    def __init__(self, maxsize: int, policy: str = DROP_OLDEST):
+        """
+        Args:
+            maxsize: Maximum queued events (must be positive)
+            policy: Overflow policy (drop_oldest, coalesce, block)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}. Use: {list(OVERFLOW_POLICIES)}")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.stats = QueueStats()
+
+        self._items: Deque[QueuedEvent] = deque()
+        self._by_key: Dict[str, QueuedEvent] = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _forget(self, event: QueuedEvent) -> None:
+        """Remove an event from the coalescing index."""
+        if event.key is not None and self._by_key.get(event.key) is event:
+            del self._by_key[event.key]
+
+    async def put(self, event: QueuedEvent) -> None:
+        """Enqueue an event according to the overflow policy."""
+        if self.policy == COALESCE and event.key is not None:
+            pending = self._by_key.get(event.key)
+            if pending is not None:
+                pending.args = event.args
+                pending.coalesced += 1 + event.coalesced
+                self.stats.coalesced += 1
+                return
+
+        while len(self._items) >= self.maxsize:
+            if self.policy == BLOCK:
+                self._not_full.clear()
+                await self._not_full.wait()
+            else:
+                self._forget(self._items.popleft())
+                self.stats.dropped += 1
+
+        self._items.append(event)
+        if self.policy == COALESCE and event.key is not None:
+            self._by_key[event.key] = event
+
+        self.stats.enqueued += 1
+        if len(self._items) > self.stats.max_depth:
+            self.stats.max_depth = len(self._items)
+        self._not_empty.set()
+
+    async def get(self) -> QueuedEvent:
+        """Dequeue the next event, stamping its queue latency."""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        event = self._items.popleft()
+        self._forget(event)
+        self._not_full.set()
+
+        event.latency = time.monotonic() - event.enqueued_at
+        self.stats.record_latency(event.latency)
+        return event
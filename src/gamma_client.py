@@ -10,13 +10,24 @@ Example:
     client = GammaClient()
     market = client.get_current_15m_market("ETH")
     print(market["slug"], market["clobTokenIds"])
+
+    # Lookups are cached (see src.market_cache); callers that read the
+    # prices bound their age
+    info = client.get_market_info("ETH")
+    info = client.get_market_info("ETH", max_age=client.price_max_age)
+
+    # From a coroutine
+    info = await client.get_market_info_async("ETH")
 """
 
 import json
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 
-from .http import ThreadLocalSessionMixin
+from .config import HttpConfig
+from .http import AsyncHttpTransport, ThreadLocalSessionMixin, get_async_transport
+from .market_cache import MarketCache, get_market_cache
+from .rate_limit import GAMMA, PRIORITY_LOW, RateLimiter, get_rate_limiter
 
 
 class GammaClient(ThreadLocalSessionMixin):
@@ -36,24 +47,63 @@ class GammaClient(ThreadLocalSessionMixin):
         "XRP": "xrp-updown-15m",
     }
 
-    def __init__(self, host: str = DEFAULT_HOST, timeout: int = 10):
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        timeout: int = 10,
+        async_transport: Optional[AsyncHttpTransport] = None,
+        http_config: Optional[HttpConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        priority: int = PRIORITY_LOW,
+        cache: Optional[MarketCache] = None,
+        price_max_age: float = 5.0,
+    ):
         """
         Initialize Gamma client.
 
         Args:
             host: Gamma API host URL
             timeout: Request timeout in seconds
+            async_transport: Transport for *_async methods (default: shared)
+            http_config: Connection pool settings for sync sessions
+            rate_limiter: Request limiter (default: shared process-wide limiter)
+            priority: Rate limiter priority (discovery is background work)
+            cache: Market lookup cache (default: shared process-wide cache)
+            price_max_age: Suggested max_age for callers that read prices
+                from get_market_info (discovery itself needs none)
         """
-        super().__init__()
+        super().__init__(http_config=http_config)
         self.host = host.rstrip("/")
         self.timeout = timeout
-
-    def get_market_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        self.priority = priority
+        self._async_transport = async_transport
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self.price_max_age = price_max_age
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Limiter every request waits on."""
+        return self._rate_limiter or get_rate_limiter()
+
+    @property
+    def cache(self) -> MarketCache:
+        """Cache shared by slug lookups."""
+        return self._cache or get_market_cache()
+
+    @property
+    def async_transport(self) -> AsyncHttpTransport:
+        """Transport used by async requests."""
+        return self._async_transport or get_async_transport()
+
+    def get_market_by_slug(self, slug: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Get market data by slug.
 
         Args:
             slug: Market slug (e.g., "eth-updown-15m-1766671200")
+            max_age: Refetch cached data older than this many seconds
+                (price fields are as old as the cached entry)
 
         Returns:
             Market data dictionary or None if not found
@@ -61,22 +111,52 @@ class GammaClient(ThreadLocalSessionMixin):
         url = f"{self.host}/markets/slug/{slug}"
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            if response.status_code == 200:
-                return response.json()
+            return self.cache.load(url, slug, lambda: self._fetch_market(url), max_age)
+        except Exception:
             return None
+
+    async def get_market_by_slug_async(
+        self,
+        slug: str,
+        max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async version of get_market_by_slug."""
+        url = f"{self.host}/markets/slug/{slug}"
+
+        try:
+            return await self.cache.load_async(
+                url, slug, lambda: self._fetch_market_async(url), max_age
+            )
         except Exception:
             return None
 
-    def get_current_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
+    def _fetch_market(self, url: str) -> Optional[Dict[str, Any]]:
+        """Request one market; None if it does not exist, raises on failure."""
+        self.rate_limiter.acquire_sync(GAMMA, self.priority)
+        response = self.session.get(url, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    async def _fetch_market_async(self, url: str) -> Optional[Dict[str, Any]]:
+        """Async version of _fetch_market."""
+        await self.rate_limiter.acquire(GAMMA, self.priority)
+        response = await self.async_transport.request("GET", url, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def _window_slugs(self, coin: str) -> List[str]:
         """
-        Get the current active 15-minute market for a coin.
+        Candidate slugs for the current 15-minute market, in lookup order.
 
         Args:
             coin: Coin symbol (BTC, ETH, SOL, XRP)
 
         Returns:
-            Market data for the current 15-minute window, or None
+            Slugs for the current, next and previous windows
         """
         coin = coin.upper()
         if coin not in self.COIN_SLUGS:
@@ -92,59 +172,117 @@ class GammaClient(ThreadLocalSessionMixin):
         current_window = now.replace(minute=minute, second=0, microsecond=0)
         current_ts = int(current_window.timestamp())
 
-        # Try current window
-        slug = f"{prefix}-{current_ts}"
-        market = self.get_market_by_slug(slug)
-
-        if market and market.get("acceptingOrders"):
-            return market
+        # Current window, next (in case current just ended),
+        # previous (might still be active)
+        return [
+            f"{prefix}-{current_ts}",
+            f"{prefix}-{current_ts + 900}",
+            f"{prefix}-{current_ts - 900}",
+        ]
+
+    def get_current_15m_market(
+        self,
+        coin: str,
+        max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the current active 15-minute market for a coin.
 
-        # Try next window (in case current just ended)
-        next_ts = current_ts + 900  # 15 minutes
-        slug = f"{prefix}-{next_ts}"
-        market = self.get_market_by_slug(slug)
+        Args:
+            coin: Coin symbol (BTC, ETH, SOL, XRP)
+            max_age: Refetch cached data older than this many seconds
 
-        if market and market.get("acceptingOrders"):
-            return market
+        Returns:
+            Market data for the current 15-minute window, or None
+        """
+        for slug in self._window_slugs(coin):
+            market = self.get_market_by_slug(slug, max_age)
+            if market and market.get("acceptingOrders"):
+                return market
 
-        # Try previous window (might still be active)
-        prev_ts = current_ts - 900
-        slug = f"{prefix}-{prev_ts}"
-        market = self.get_market_by_slug(slug)
+        return None
 
-        if market and market.get("acceptingOrders"):
-            return market
+    async def get_current_15m_market_async(
+        self,
+        coin: str,
+        max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async version of get_current_15m_market."""
+        for slug in self._window_slugs(coin):
+            market = await self.get_market_by_slug_async(slug, max_age)
+            if market and market.get("acceptingOrders"):
+                return market
 
         return None
 
-    def get_next_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
+    def _next_window_slug(self, coin: str, window_start: Optional[int] = None) -> str:
         """
-        Get the next upcoming 15-minute market for a coin.
+        Slug of an upcoming 15-minute window.
 
         Args:
             coin: Coin symbol (BTC, ETH, SOL, XRP)
+            window_start: Window start timestamp (default: the window after
+                the current one)
 
         Returns:
-            Market data for the next 15-minute window, or None
+            Market slug
         """
         coin = coin.upper()
         if coin not in self.COIN_SLUGS:
             raise ValueError(f"Unsupported coin: {coin}")
 
-        prefix = self.COIN_SLUGS[coin]
-        now = datetime.now(timezone.utc)
+        if window_start is None:
+            now = int(datetime.now(timezone.utc).timestamp())
+            window_start = now - now % 900 + 900
 
-        # Calculate next 15-minute window
-        minute = ((now.minute // 15) + 1) * 15
-        if minute >= 60:
-            next_window = now.replace(hour=now.hour + 1, minute=0, second=0, microsecond=0)
-        else:
-            next_window = now.replace(minute=minute, second=0, microsecond=0)
+        return f"{self.COIN_SLUGS[coin]}-{window_start}"
+
+    def get_next_15m_market(
+        self,
+        coin: str,
+        window_start: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the next upcoming 15-minute market for a coin.
+
+        Args:
+            coin: Coin symbol (BTC, ETH, SOL, XRP)
+            window_start: Window start timestamp (default: the window after
+                the current one)
+
+        Returns:
+            Market data for the next 15-minute window, or None
+        """
+        return self.get_market_by_slug(self._next_window_slug(coin, window_start))
+
+    async def get_next_15m_market_async(
+        self,
+        coin: str,
+        window_start: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async version of get_next_15m_market."""
+        return await self.get_market_by_slug_async(self._next_window_slug(coin, window_start))
+
+    async def get_next_market_info_async(
+        self,
+        coin: str,
+        window_start: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get market info for the next 15-minute window (see get_market_info).
 
-        next_ts = int(next_window.timestamp())
-        slug = f"{prefix}-{next_ts}"
+        Args:
+            coin: Coin symbol
+            window_start: Window start timestamp (default: the window after
+                the current one)
 
-        return self.get_market_by_slug(slug)
+        Returns:
+            Dictionary with market info, or None if not created yet
+        """
+        market = await self.get_next_15m_market_async(coin, window_start)
+        if not market:
+            return None
+        return self._market_info(market)
 
     def parse_token_ids(self, market: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -202,20 +340,36 @@ class GammaClient(ThreadLocalSessionMixin):
                 result[str(outcome).lower()] = cast(values[i])
         return result
 
-    def get_market_info(self, coin: str) -> Optional[Dict[str, Any]]:
+    def get_market_info(self, coin: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive market info for current 15-minute market.
 
         Args:
             coin: Coin symbol
+            max_age: Refetch cached data older than this many seconds
+                (e.g. price_max_age when reading the prices)
 
         Returns:
             Dictionary with market info including token IDs and prices
         """
-        market = self.get_current_15m_market(coin)
+        market = self.get_current_15m_market(coin, max_age)
+        if not market:
+            return None
+        return self._market_info(market)
+
+    async def get_market_info_async(
+        self,
+        coin: str,
+        max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async version of get_market_info."""
+        market = await self.get_current_15m_market_async(coin, max_age)
         if not market:
             return None
+        return self._market_info(market)
 
+    def _market_info(self, market: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize raw market data for get_market_info."""
         token_ids = self.parse_token_ids(market)
         prices = self.parse_prices(market)
 
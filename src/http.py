@@ -1,13 +1,85 @@
 """
 HTTP Utilities - Shared HTTP session helpers.
 
-Provides a thread-local requests.Session mixin to avoid cross-thread reuse.
+Provides:
+- A thread-local requests.Session mixin to avoid cross-thread reuse,
+  with tunable pool sizes and per-session pool stats
+- An asyncio HTTP transport with shared keep-alive pools per host
+  (httpx with HTTP/2, aiohttp, or a worker-thread fallback)
+
+Example:
+    from src.http import AsyncHttpTransport
+
+    transport = AsyncHttpTransport(max_connections_per_host=50)
+    response = await transport.request("GET", "https://clob.polymarket.com/book",
+                                       params={"token_id": "123"})
+    response.raise_for_status()
+    print(response.json())
+    await transport.aclose()
+
+    # Pre-open connections and keep them from idling out
+    await transport.prewarm("https://clob.polymarket.com", connections=2)
+    asyncio.create_task(transport.keepalive("https://clob.polymarket.com", interval=20.0))
 """
 
+import asyncio
+import importlib
+import importlib.util
+import json
+import logging
 import threading
-from typing import Any
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .config import HttpConfig
+from .retry import CONNECT, CONNECTION_LOST, READ_TIMEOUT, classify_error
+
+logger = logging.getLogger(__name__)
+
+
+# Preference order used by "auto"
+HTTP_BACKENDS = ("httpx", "aiohttp", "thread")
+
+
+class TransportError(Exception):
+    """Raised when an async HTTP request fails (connection, timeout, status)."""
+
+    def __init__(self, message: str = "", kind: Optional[str] = None):
+        """
+        Args:
+            message: Error description
+            kind: Failure class from src.retry (CONNECT, READ_TIMEOUT, ...)
+        """
+        super().__init__(message)
+        self.kind = kind
+
+
+class HttpStatusError(TransportError):
+    """Raised by AsyncHttpResponse.raise_for_status on 4xx/5xx."""
+
+    def __init__(self, response: "AsyncHttpResponse"):
+        super().__init__(f"{response.status_code} Error for url: {response.url}")
+        self.response = response
+
+
+@dataclass
+class SessionStats:
+    """Usage counters for a thread-local session or an async host pool."""
+    name: str  # Thread name (sessions) or origin (async hosts)
+    created_at: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    last_used: float = 0.0
+
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the last response (since creation if unused)."""
+        return time.monotonic() - (self.last_used or self.created_at)
 
 
 class ThreadLocalSessionMixin:
@@ -15,17 +87,47 @@ class ThreadLocalSessionMixin:
     Mixin providing a thread-local requests.Session.
 
     Each thread gets its own Session instance to keep connections isolated.
+    Sessions mount an HTTPAdapter sized by HttpConfig and record usage
+    for pool_stats().
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(self, *args: Any, http_config: Optional[HttpConfig] = None, **kwargs: Any) -> None:
         self._session_local = threading.local()
+        self.http_config = http_config or HttpConfig()
+        self._session_stats: "weakref.WeakKeyDictionary[requests.Session, SessionStats]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._session_stats_lock = threading.Lock()
         super().__init__(*args, **kwargs)
 
+    def _new_session(self) -> requests.Session:
+        """Create a session with a pool sized by http_config."""
+        config = self.http_config
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=config.max_retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        stats = SessionStats(name=threading.current_thread().name)
+
+        def record(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+            stats.requests += 1
+            stats.last_used = time.monotonic()
+
+        session.hooks["response"].append(record)
+        with self._session_stats_lock:
+            self._session_stats[session] = stats
+        return session
+
     def _get_session(self) -> requests.Session:
         """Get a thread-local session to avoid cross-thread reuse."""
         session = getattr(self._session_local, "session", None)
         if session is None:
-            session = requests.Session()
+            session = self._new_session()
             self._session_local.session = session
         return session
 
@@ -33,3 +135,425 @@ class ThreadLocalSessionMixin:
     def session(self) -> requests.Session:
         """Expose the thread-local session for internal use."""
         return self._get_session()
+
+    def pool_stats(self) -> List[Dict[str, Any]]:
+        """
+        Usage and connection counts for every live thread-local session.
+
+        Returns:
+            One dict per session with thread, requests, idle_seconds and
+            per-host connections_opened / idle_connections
+        """
+        with self._session_stats_lock:
+            sessions = list(self._session_stats.items())
+
+        result = []
+        for session, stats in sessions:
+            hosts: Dict[str, Dict[str, int]] = {}
+            for adapter in set(session.adapters.values()):
+                pools = getattr(adapter, "poolmanager", None)
+                if pools is None:
+                    continue
+                for key in list(pools.pools.keys()):
+                    pool = pools.pools.get(key)
+                    if pool is None:
+                        continue
+                    hosts[f"{key.key_scheme}://{key.key_host}"] = {
+                        "connections_opened": pool.num_connections,
+                        # Unopened slots are queued as None
+                        "idle_connections": sum(
+                            1 for conn in list(pool.pool.queue) if conn is not None
+                        ) if pool.pool else 0,
+                    }
+            result.append({
+                "thread": stats.name,
+                "requests": stats.requests,
+                "idle_seconds": stats.idle_seconds,
+                "hosts": hosts,
+            })
+        return result
+
+
+@dataclass
+class AsyncHttpResponse:
+    """Backend-independent HTTP response."""
+    status_code: int
+    text: str
+    url: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True for non-error status codes."""
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        """Raise HttpStatusError for 4xx/5xx responses."""
+        if not self.ok:
+            raise HttpStatusError(self)
+
+
+def available_http_backends() -> List[str]:
+    """List usable async HTTP backends in preference order."""
+    return [
+        name for name in HTTP_BACKENDS
+        if name == "thread" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def resolve_http_backend(name: str = "auto") -> str:
+    """
+    Resolve a backend name to an installed backend.
+
+    Args:
+        name: "auto", "httpx", "aiohttp" or "thread"
+
+    Returns:
+        Name of the backend that will be used
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    name = (name or "auto").lower()
+    if name == "auto":
+        backend = available_http_backends()[0]
+        if backend == "thread":
+            logger.warning(
+                "No async HTTP library installed (pip install 'httpx[http2]'), "
+                "falling back to worker threads"
+            )
+        return backend
+
+    if name not in HTTP_BACKENDS:
+        raise ValueError(f"Unknown HTTP backend: {name}. Use: {['auto', *HTTP_BACKENDS]}")
+
+    if name not in available_http_backends():
+        logger.warning(f"HTTP backend '{name}' is not installed, falling back to worker threads")
+        return "thread"
+
+    return name
+
+
+class AsyncHttpTransport(ThreadLocalSessionMixin):
+    """
+    Asyncio HTTP transport with shared keep-alive connection pools.
+
+    One pool is kept per (event loop, host), so limits apply per host and
+    every client talking to the same host reuses the same connections.
+
+    Backends:
+        httpx: HTTP/2 when the h2 package is installed, HTTP/1.1 otherwise
+        aiohttp: HTTP/1.1 with keep-alive
+        thread: Blocking requests in asyncio.to_thread (no extra deps); all
+            worker threads share one requests.Session, so connections opened
+            by prewarm/keepalive are the ones later requests reuse
+    """
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        max_connections_per_host: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        http_config: Optional[HttpConfig] = None,
+    ):
+        """
+        Args:
+            backend: "auto", "httpx", "aiohttp" or "thread"
+            max_connections_per_host: Concurrent connections per host
+            max_keepalive_connections: Idle connections kept per host
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Negotiate HTTP/2 when supported (httpx + h2)
+            http_config: Pool settings for the thread backend's sessions
+        """
+        super().__init__(http_config=http_config)
+        self.backend = resolve_http_backend(backend)
+        self.max_connections_per_host = max_connections_per_host
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and self.backend == "httpx" and importlib.util.find_spec("h2") is not None
+
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._host_stats: Dict[str, SessionStats] = {}
+        self._shared_session: Optional[requests.Session] = None
+        self._shared_session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """
+        Session of the thread backend, shared by every worker thread.
+
+        urllib3 pools are thread-safe; a per-thread session would leave a
+        connection warmed on one asyncio.to_thread worker unused by the
+        others.
+        """
+        session = self._shared_session
+        if session is None:
+            with self._shared_session_lock:
+                if self._shared_session is None:
+                    self._shared_session = self._new_session()
+                session = self._shared_session
+        return session
+
+    @property
+    def is_native(self) -> bool:
+        """True if requests run on the event loop (no worker threads)."""
+        return self.backend != "thread"
+
+    def _new_pool(self) -> Any:
+        """Create a connection pool for one host."""
+        if self.backend == "httpx":
+            httpx = importlib.import_module("httpx")
+            return httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+
+        aiohttp = importlib.import_module("aiohttp")
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_expiry,
+            ),
+        )
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """scheme://host[:port] of a URL."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _pool_for(self, url: str) -> Any:
+        """Get the connection pool for url's host on the running loop."""
+        origin = self._origin(url)
+
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        pool = pools.get(origin)
+        if pool is None:
+            pool = self._new_pool()
+            pools[origin] = pool
+        return pool
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
+        timeout: float = 30.0,
+    ) -> AsyncHttpResponse:
+        """
+        Send a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            headers: Request headers
+            params: Query parameters
+            json_data: Body; bytes are sent as-is, other values are
+                serialized as compact JSON (None = no body)
+            timeout: Total request timeout in seconds
+
+        Returns:
+            AsyncHttpResponse (check raise_for_status)
+
+        Raises:
+            TransportError: On connection errors and timeouts
+        """
+        method = method.upper()
+        content = None
+        if isinstance(json_data, bytes):
+            content = json_data
+        elif json_data is not None:
+            content = json.dumps(json_data, separators=(",", ":")).encode()
+
+        if self.backend == "thread":
+            response = await asyncio.to_thread(
+                self._thread_request, method, url, headers, params, content, timeout
+            )
+        elif self.backend == "httpx":
+            response = await self._httpx_request(method, url, headers, params, content, timeout)
+        else:
+            response = await self._aiohttp_request(method, url, headers, params, content, timeout)
+
+        origin = self._origin(url)
+        stats = self._host_stats.get(origin)
+        if stats is None:
+            stats = self._host_stats[origin] = SessionStats(name=origin)
+        stats.requests += 1
+        stats.last_used = time.monotonic()
+        return response
+
+    async def prewarm(self, url: str, connections: int = 1, timeout: float = 5.0) -> int:
+        """
+        Open connections to url's host ahead of the first real request.
+
+        Args:
+            url: URL to HEAD (any status counts)
+            connections: Concurrent requests, i.e. connections to open
+            timeout: Request timeout in seconds
+
+        Returns:
+            Number of requests that got an answer
+        """
+        results = await asyncio.gather(
+            *(self.request("HEAD", url, timeout=timeout) for _ in range(max(1, connections))),
+            return_exceptions=True,
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            logger.debug(f"Warm-up of {url}: {len(failures)} of {len(results)} failed: {failures[0]}")
+        return len(results) - len(failures)
+
+    async def keepalive(
+        self,
+        url: str,
+        interval: float = 20.0,
+        max_backoff: float = 300.0
+    ) -> None:
+        """
+        Ping url whenever its host has been idle for interval seconds.
+
+        Runs until cancelled. While pings fail, the wait between them
+        doubles up to max_backoff.
+
+        Args:
+            url: URL to HEAD
+            interval: Idle seconds before a ping
+            max_backoff: Longest wait between failed pings
+        """
+        origin = self._origin(url)
+        failures = 0
+        while True:
+            stats = self._host_stats.get(origin)
+            idle = stats.idle_seconds if stats else interval
+            if idle < interval:
+                await asyncio.sleep(interval - idle)
+                continue
+            failures = 0 if await self.prewarm(url) else failures + 1
+            await asyncio.sleep(min(interval * 2 ** failures, max(max_backoff, interval)))
+
+    def host_stats(self) -> Dict[str, Dict[str, float]]:
+        """Requests and idle time per host."""
+        return {
+            origin: {"requests": stats.requests, "idle_seconds": stats.idle_seconds}
+            for origin, stats in self._host_stats.items()
+        }
+
+    async def _httpx_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        timeout: float,
+    ) -> AsyncHttpResponse:
+        """Send a request with httpx."""
+        httpx = importlib.import_module("httpx")
+        try:
+            response = await self._pool_for(url).request(
+                method, url, headers=headers, params=params,
+                content=content, timeout=timeout,
+            )
+        except httpx.HTTPError as e:
+            if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+                kind = CONNECT
+            elif isinstance(e, httpx.ReadTimeout):
+                kind = READ_TIMEOUT
+            else:
+                kind = CONNECTION_LOST
+            raise TransportError(str(e) or type(e).__name__, kind=kind) from e
+        return AsyncHttpResponse(
+            status_code=response.status_code,
+            text=response.text,
+            url=str(response.url),
+            headers=dict(response.headers),
+        )
+
+    async def _aiohttp_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        timeout: float,
+    ) -> AsyncHttpResponse:
+        """Send a request with aiohttp."""
+        aiohttp = importlib.import_module("aiohttp")
+        try:
+            async with self._pool_for(url).request(
+                method, url, headers=headers, params=params, data=content,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                text = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if isinstance(e, aiohttp.ClientConnectorError):
+                kind = CONNECT
+            elif isinstance(e, asyncio.TimeoutError):
+                kind = READ_TIMEOUT
+            else:
+                kind = CONNECTION_LOST
+            raise TransportError(str(e) or type(e).__name__, kind=kind) from e
+        return AsyncHttpResponse(
+            status_code=response.status,
+            text=text,
+            url=str(response.url),
+            headers=dict(response.headers),
+        )
+
+    def _thread_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        timeout: float,
+    ) -> AsyncHttpResponse:
+        """Send a blocking request (runs in a worker thread)."""
+        try:
+            response = self.session.request(
+                method, url, headers=headers, params=params,
+                data=content, timeout=timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e), kind=classify_error(e)) from e
+        return AsyncHttpResponse(
+            status_code=response.status_code,
+            text=response.text,
+            url=response.url,
+            headers=dict(response.headers),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pools owned by the running event loop."""
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        for pool in pools.values():
+            if self.backend == "httpx":
+                await pool.aclose()
+            else:
+                await pool.close()
+
+
+_default_transport: Optional[AsyncHttpTransport] = None
+
+
+def get_async_transport() -> AsyncHttpTransport:
+    """Shared transport used by clients that were not given one."""
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = AsyncHttpTransport()
+    return _default_transport
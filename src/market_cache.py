@@ -0,0 +1,271 @@
+"""
+Market Cache Module - Gamma Market Metadata Cache
+
+Market discovery looks up the same few slugs (current, next and previous
+15-minute window) over and over. MarketCache keeps those lookups in
+process:
+- Live markets are cached until their end time
+- Slugs that do not exist yet are cached briefly (negative caching),
+  never past the window they name opening
+- Concurrent lookups of one slug share a single request (single-flight)
+- Callers get their own copy of the market dict
+
+Prices in a cached market are as old as the entry; callers that read
+prices bound that with max_age. max_age never shortens a "not found"
+entry, which already expires within negative_ttl.
+
+GammaClient uses the shared cache by default, so every client in the
+process benefits.
+
+Example:
+    from src.market_cache import get_market_cache
+
+    cache = get_market_cache()
+    market = cache.load(url, slug, fetch=lambda: fetch_market(url))
+    market = await cache.load_async(url, slug, fetch=fetch_market_async)
+    print(cache.stats())
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def slug_timestamp(slug: str) -> Optional[int]:
+    """Window start encoded in a slug like "eth-updown-15m-1766671200"."""
+    suffix = slug.rsplit("-", 1)[-1]
+    return int(suffix) if suffix.isdigit() else None
+
+
+def parse_end_date(value: Any) -> Optional[float]:
+    """Unix time of a Gamma endDate ("2025-12-25T14:15:00Z"), if parseable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class MarketCache:
+    """
+    Thread- and async-safe TTL cache of market lookups.
+
+    Entries hold the market dict, or None for a slug Gamma does not know.
+    Failed requests are never cached. Results are deep copies, so callers
+    may modify them without corrupting the cache.
+    """
+
+    def __init__(
+        self,
+        negative_ttl: float = 15.0,
+        max_ttl: float = 900.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            negative_ttl: Seconds to remember a missing or closed market
+            max_ttl: Upper bound for any entry
+            clock: Wall-clock source (end dates are wall-clock times)
+        """
+        self.negative_ttl = negative_ttl
+        self.max_ttl = max_ttl
+        self._clock = clock
+        self._entries: Dict[str, Tuple[Optional[Dict[str, Any]], float, float]] = {}
+        self._loading: Dict[str, threading.Event] = {}
+        self._loading_async: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.shared = 0  # Lookups that waited on another caller's request
+
+    def expires_at(self, slug: str, market: Optional[Dict[str, Any]], now: float) -> float:
+        """
+        Expiry time for a lookup result.
+
+        Args:
+            slug: Market slug
+            market: Market data, or None if not found
+            now: Current time
+
+        Returns:
+            Unix time after which the entry is refetched
+        """
+        if market is None:
+            # Not created yet: check again soon, and as soon as its window opens
+            expires = now + self.negative_ttl
+            start = slug_timestamp(slug)
+            if start is not None and start > now:
+                expires = min(expires, start)
+            return expires
+
+        if not market.get("acceptingOrders"):
+            # Closed, or not open yet (may flip to accepting)
+            return now + self.negative_ttl
+
+        end = parse_end_date(market.get("endDate"))
+        if end is None or end <= now:
+            return now + min(self.negative_ttl, self.max_ttl)
+        return min(end, now + self.max_ttl)
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Cache key (request URL)
+            max_age: Treat markets older than this many seconds as expired
+                (cached "not found" entries keep their own expiry)
+
+        Returns:
+            (found, market) - market is None for a cached "not found"
+        """
+        with self._lock:
+            return self._get_locked(key, max_age)
+
+    def _get_locked(self, key: str, max_age: Optional[float]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        market, expires, stored = entry
+        now = self._clock()
+        stale = max_age is not None and market is not None and now - stored > max_age
+        if now >= expires or stale:
+            del self._entries[key]
+            return False, None
+
+        if market is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, copy.deepcopy(market)
+
+    def put(self, key: str, slug: str, market: Optional[Dict[str, Any]]) -> None:
+        """Store a lookup result with its computed expiry."""
+        now = self._clock()
+        entry = (copy.deepcopy(market), self.expires_at(slug, market, now), now)
+        with self._lock:
+            self._entries[key] = entry
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or everything when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def load(
+        self,
+        key: str,
+        slug: str,
+        fetch: Callable[[], Optional[Dict[str, Any]]],
+        max_age: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cached lookup; concurrent callers for one key share one fetch.
+
+        Args:
+            key: Cache key (request URL)
+            slug: Market slug (used for the expiry)
+            fetch: Performs the request; returns the market or None if
+                not found, raises on failure (failures are not cached)
+            max_age: Refetch entries older than this many seconds
+
+        Returns:
+            Market data, or None if not found
+        """
+        while True:
+            with self._lock:
+                found, market = self._get_locked(key, max_age)
+                if found:
+                    return market
+                event = self._loading.get(key)
+                leader = event is None
+                if leader:
+                    event = self._loading[key] = threading.Event()
+                    self.misses += 1
+                else:
+                    self.shared += 1
+
+            if not leader:
+                # The leader stored a fresh entry (or failed, and we retry)
+                event.wait()
+                max_age = None
+                continue
+
+            try:
+                market = fetch()
+                self.put(key, slug, market)
+                return market
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+                event.set()
+
+    async def load_async(
+        self,
+        key: str,
+        slug: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        max_age: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Async version of load (fetch is a coroutine function)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                found, market = self._get_locked(key, max_age)
+                if found:
+                    return market
+                pending = self._loading_async.get(key)
+                if pending is not None and pending.get_loop() is not loop:
+                    pending = None
+                leader = pending is None
+                if leader:
+                    pending = self._loading_async[key] = loop.create_future()
+                    self.misses += 1
+                else:
+                    self.shared += 1
+
+            if not leader:
+                await asyncio.shield(pending)
+                max_age = None
+                continue
+
+            try:
+                market = await fetch()
+                self.put(key, slug, market)
+                return market
+            finally:
+                with self._lock:
+                    if self._loading_async.get(key) is pending:
+                        del self._loading_async[key]
+                pending.set_result(None)
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters and current size."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "shared": self.shared,
+            }
+
+
+_default_cache: Optional[MarketCache] = None
+
+
+def get_market_cache() -> MarketCache:
+    """Shared cache used by GammaClient by default."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MarketCache()
+    return _default_cache
@@ -0,0 +1,477 @@
+"""
+Price Feed Module - Streaming Reference Prices from Binance
+
+Keeps rolling 1-minute candles per coin in memory so strategies can read
+the recent price change without a REST call:
+- BinanceKlineFeed: Binance kline WebSocket (one combined stream for all
+  coins), seeded from REST klines on start and after every reconnect,
+  reconnects with backoff
+- ReplayPriceFeed: feeds recorded kline messages through the same code
+  path (tests, backtests, offline runs)
+
+Example:
+    from src.price_feed import BinanceKlineFeed
+
+    feed = BinanceKlineFeed(["BTC", "ETH", "SOL", "XRP"])
+    await feed.start()
+
+    change = feed.get_change("BTC", lookback=5)  # % over the last 5 candles
+    price = feed.get_price("BTC")
+
+    await feed.stop()
+"""
+
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from .codec import decode_errors, get_loads
+from .http import get_async_transport
+from .websocket_client import _load_websockets
+
+logger = logging.getLogger(__name__)
+
+
+BINANCE_STREAM_URL = "wss://stream.binance.com:9443/stream"
+BINANCE_REST_URL = "https://api.binance.com"
+
+BINANCE_SYMBOLS = {
+    "BTC": "BTCUSDT",
+    "ETH": "ETHUSDT",
+    "SOL": "SOLUSDT",
+    "XRP": "XRPUSDT",
+}
+
+# Kline interval units ("1m", "15m", "1h", ...) in milliseconds
+INTERVAL_UNITS_MS = {"s": 1_000, "m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def interval_ms(interval: str) -> int:
+    """Length of a kline interval like "1m" in milliseconds."""
+    count, unit = interval[:-1], interval[-1:]
+    if not count.isdigit() or unit not in INTERVAL_UNITS_MS:
+        raise ValueError(f"Unsupported kline interval: {interval}")
+    return int(count) * INTERVAL_UNITS_MS[unit]
+
+
+@dataclass
+class Candle:
+    """One kline."""
+    open_time: int  # ms
+    open: float
+    high: float
+    low: float
+    close: float
+    closed: bool = False
+
+
+class CandleHistory:
+    """
+    Rolling candles for one symbol, oldest first.
+
+    The newest candle is updated in place until it closes, matching what
+    the REST klines endpoint returns for `limit=N`. Candles missed while
+    the stream was down leave a gap until merged in from REST.
+    """
+
+    def __init__(self, maxlen: int = 60, candle_ms: int = 60_000):
+        """
+        Args:
+            maxlen: Candles kept (must cover the longest lookback)
+            candle_ms: Candle length (spacing of open times)
+        """
+        self.candles: Deque[Candle] = deque(maxlen=maxlen)
+        self.candle_ms = candle_ms
+        self.updated_at = 0.0  # time.monotonic() of the last update
+
+    def __len__(self) -> int:
+        return len(self.candles)
+
+    def update(self, candle: Candle) -> None:
+        """Add a candle, or replace the newest one if it has the same open time."""
+        if self.candles and self.candles[-1].open_time == candle.open_time:
+            self.candles[-1] = candle
+        elif not self.candles or candle.open_time > self.candles[-1].open_time:
+            self.candles.append(candle)
+        else:
+            return  # Out of order (use merge to fill in older candles)
+        self.updated_at = time.monotonic()
+
+    def merge(self, candles: Iterable[Candle]) -> None:
+        """
+        Fill in candles from REST, e.g. ones missed during a disconnect.
+
+        A candle already held wins unless it is still open and the merged
+        one has closed.
+        """
+        by_time = {candle.open_time: candle for candle in candles}
+        if not by_time:
+            return
+        for candle in self.candles:
+            merged = by_time.get(candle.open_time)
+            if merged is None or candle.closed or not merged.closed:
+                by_time[candle.open_time] = candle
+        self.candles.clear()
+        # The deque keeps the newest maxlen
+        self.candles.extend(sorted(by_time.values(), key=lambda candle: candle.open_time))
+        self.updated_at = time.monotonic()
+
+    def change(self, lookback: int) -> Optional[float]:
+        """
+        Percent change from the close `lookback - 1` candles ago to the latest close.
+
+        Args:
+            lookback: Number of candles, including the current one
+
+        Returns:
+            Change in percent rounded to 4 places, or None without enough
+            data (including when candles in the window are missing)
+        """
+        if lookback < 2 or len(self.candles) < lookback:
+            return None
+        first = self.candles[-lookback]
+        if first.open_time != self.candles[-1].open_time - (lookback - 1) * self.candle_ms:
+            return None  # Gap in the window
+        first_close = first.close
+        if first_close == 0:
+            return None
+        return round((self.candles[-1].close - first_close) / first_close * 100, 4)
+
+
+def candle_from_kline(kline: Dict[str, Any]) -> Candle:
+    """Candle from the "k" object of a kline stream event."""
+    return Candle(
+        open_time=int(kline["t"]),
+        open=float(kline["o"]),
+        high=float(kline["h"]),
+        low=float(kline["l"]),
+        close=float(kline["c"]),
+        closed=bool(kline.get("x", False)),
+    )
+
+
+def candle_from_rest(row: List[Any]) -> Candle:
+    """Candle from one row of GET /api/v3/klines."""
+    return Candle(
+        open_time=int(row[0]),
+        open=float(row[1]),
+        high=float(row[2]),
+        low=float(row[3]),
+        close=float(row[4]),
+        closed=True,
+    )
+
+
+class ReferencePriceFeed(ABC):
+    """
+    In-memory candles per coin, filled by a subclass.
+
+    Lookups are O(1) and never touch the network.
+    """
+
+    def __init__(
+        self,
+        coins: Iterable[str],
+        history: int = 60,
+        max_age: float = 10.0,
+        candle_ms: int = 60_000,
+    ):
+        """
+        Args:
+            coins: Coin symbols (BINANCE_SYMBOLS keys)
+            history: Candles kept per coin
+            max_age: Seconds without an update before a coin's data is
+                treated as unavailable
+            candle_ms: Candle length in milliseconds
+        """
+        self.coins = [coin.upper() for coin in coins]
+        for coin in self.coins:
+            if coin not in BINANCE_SYMBOLS:
+                raise ValueError(f"Unsupported coin: {coin}. Use: {list(BINANCE_SYMBOLS)}")
+
+        self.max_age = max_age
+        self._histories: Dict[str, CandleHistory] = {
+            BINANCE_SYMBOLS[coin]: CandleHistory(history, candle_ms) for coin in self.coins
+        }
+        self.messages = 0
+
+    def history(self, coin: str) -> Optional[CandleHistory]:
+        """Candle history for coin (None if the coin is not tracked)."""
+        symbol = BINANCE_SYMBOLS.get(coin.upper())
+        return self._histories.get(symbol) if symbol else None
+
+    def is_fresh(self, coin: str) -> bool:
+        """Whether coin's candles were updated within max_age."""
+        history = self.history(coin)
+        if history is None or not len(history):
+            return False
+        return time.monotonic() - history.updated_at <= self.max_age
+
+    def get_change(self, coin: str, lookback: int = 5) -> Optional[float]:
+        """
+        Percent change over the last `lookback` 1-minute candles.
+
+        Same result as get_binance_change's REST call, from memory.
+
+        Args:
+            coin: Coin symbol
+            lookback: Candles, including the current one
+
+        Returns:
+            Change in percent, or None if data is missing or stale
+        """
+        if not self.is_fresh(coin):
+            return None
+        return self.history(coin).change(lookback)
+
+    def get_price(self, coin: str) -> Optional[float]:
+        """Latest close for coin, or None if missing or stale."""
+        if not self.is_fresh(coin):
+            return None
+        return self.history(coin).candles[-1].close
+
+    def handle_message(self, message: Dict[str, Any]) -> bool:
+        """
+        Apply a kline event (raw or wrapped in a combined-stream envelope).
+
+        Args:
+            message: Decoded WebSocket message
+
+        Returns:
+            True if a tracked symbol was updated
+        """
+        data = message.get("data", message)
+        if data.get("e") != "kline":
+            return False
+        history = self._histories.get(data.get("s", ""))
+        if history is None:
+            return False
+        history.update(candle_from_kline(data["k"]))
+        self.messages += 1
+        return True
+
+    @abstractmethod
+    async def start(self) -> bool:
+        """
+        Start filling candles.
+
+        Returns:
+            True if every coin has data to start with
+        """
+        pass
+
+    async def stop(self) -> None:
+        """Stop filling candles."""
+
+
+class BinanceKlineFeed(ReferencePriceFeed):
+    """Binance combined kline stream for all coins on one connection."""
+
+    def __init__(
+        self,
+        coins: Iterable[str],
+        interval: str = "1m",
+        history: int = 60,
+        max_age: float = 10.0,
+        url: str = BINANCE_STREAM_URL,
+        rest_url: str = BINANCE_REST_URL,
+        reconnect_interval: float = 1.0,
+        max_reconnect_interval: float = 30.0,
+        json_backend: str = "auto",
+    ):
+        """
+        Args:
+            coins: Coin symbols (BINANCE_SYMBOLS keys)
+            interval: Kline interval
+            history: Candles kept per coin (also the REST seed size)
+            max_age: Seconds without an update before data is unavailable
+            url: Combined stream endpoint
+            rest_url: REST endpoint used to seed history
+            reconnect_interval: Base delay of the reconnect backoff
+            max_reconnect_interval: Cap on the reconnect backoff
+            json_backend: JSON decoder for frames (see src.codec)
+        """
+        super().__init__(coins, history=history, max_age=max_age, candle_ms=interval_ms(interval))
+        self.interval = interval
+        self.history_size = history
+        self.url = url
+        self.rest_url = rest_url.rstrip("/")
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self._loads = get_loads(json_backend)
+        self._decode_errors = decode_errors(json_backend)
+        self._ws_connect, self._connection_closed = _load_websockets()
+        self._task: Optional[asyncio.Task] = None
+        self._seed_task: Optional[asyncio.Task] = None
+        self._running = False
+        self.reconnects = 0
+
+    @property
+    def stream_url(self) -> str:
+        """Combined stream URL for every tracked symbol."""
+        streams = "/".join(
+            f"{symbol.lower()}@kline_{self.interval}" for symbol in self._histories
+        )
+        return f"{self.url}?streams={streams}"
+
+    async def seed(self) -> int:
+        """
+        Load recent candles for every coin from REST, concurrently.
+
+        Candles already held are kept, so this also fills gaps left by a
+        disconnect.
+
+        Returns:
+            Number of coins seeded
+        """
+        transport = get_async_transport()
+
+        async def seed_symbol(symbol: str) -> bool:
+            try:
+                response = await transport.request(
+                    "GET", f"{self.rest_url}/api/v3/klines",
+                    params={"symbol": symbol, "interval": self.interval, "limit": self.history_size},
+                    timeout=10,
+                )
+                response.raise_for_status()
+                self._histories[symbol].merge(candle_from_rest(row) for row in response.json())
+                return True
+            except Exception as e:
+                logger.warning(f"Kline seed failed for {symbol}: {e}")
+                return False
+
+        results = await asyncio.gather(*(seed_symbol(symbol) for symbol in self._histories))
+        return sum(results)
+
+    async def start(self) -> bool:
+        """
+        Seed history, then stream klines in the background.
+
+        Returns:
+            True if every coin was seeded
+        """
+        seeded = await self.seed()
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        return seeded == len(self._histories)
+
+    async def stop(self) -> None:
+        """Stop streaming."""
+        self._running = False
+        if self._seed_task:
+            self._seed_task.cancel()
+            self._seed_task = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _reconnect_delay(self, attempt: int) -> float:
+        """Immediate first retry, then full-jitter exponential backoff."""
+        if attempt <= 1:
+            return 0.0
+        ceiling = min(self.max_reconnect_interval, self.reconnect_interval * 2 ** (attempt - 2))
+        return random.uniform(0, ceiling)
+
+    async def _run(self) -> None:
+        """Connect, read frames, reconnect."""
+        if self._ws_connect is None:
+            logger.error("websockets is not installed; kline stream disabled")
+            return
+
+        attempt = 0
+        while self._running:
+            received = False
+            try:
+                async with self._ws_connect(self.stream_url) as ws:
+                    logger.info(f"Kline stream connected ({len(self._histories)} symbols)")
+                    if self.reconnects and (self._seed_task is None or self._seed_task.done()):
+                        # Fill in the candles missed while disconnected
+                        self._seed_task = asyncio.create_task(self.seed())
+                    async for frame in ws:
+                        received = True
+                        try:
+                            self.handle_message(self._loads(frame))
+                        except self._decode_errors as e:
+                            logger.error(f"Failed to parse kline frame: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Kline stream disconnected: {e}")
+
+            if not self._running:
+                break
+            attempt = 1 if received else attempt + 1
+            self.reconnects += 1
+            await asyncio.sleep(self._reconnect_delay(attempt))
+
+
+class ReplayPriceFeed(ReferencePriceFeed):
+    """
+    Local stand-in for BinanceKlineFeed.
+
+    Replays recorded kline messages (decoded dicts, in stream order)
+    through the same handler, instantly or paced by `interval` seconds.
+    Freshness is judged on replay time, so replayed data counts as live.
+    """
+
+    def __init__(
+        self,
+        coins: Iterable[str],
+        messages: Iterable[Dict[str, Any]] = (),
+        interval: float = 0.0,
+        history: int = 60,
+        max_age: float = 10.0,
+    ):
+        """
+        Args:
+            coins: Coin symbols (BINANCE_SYMBOLS keys)
+            messages: Kline events to replay
+            interval: Seconds between messages (0 = all at once)
+            history: Candles kept per coin
+            max_age: Seconds without an update before data is unavailable
+        """
+        super().__init__(coins, history=history, max_age=max_age)
+        self._messages = list(messages)
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def replay(self) -> int:
+        """
+        Feed every message through handle_message.
+
+        Returns:
+            Number of messages that updated a tracked symbol
+        """
+        applied = 0
+        for message in self._messages:
+            applied += self.handle_message(message)
+            if self.interval > 0:
+                await asyncio.sleep(self.interval)
+        return applied
+
+    async def start(self) -> bool:
+        """Replay instantly, or in the background when paced."""
+        if self.interval > 0:
+            self._task = asyncio.create_task(self.replay())
+        else:
+            await self.replay()
+        return True
+
+    async def stop(self) -> None:
+        """Stop a paced replay."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
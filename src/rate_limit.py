@@ -0,0 +1,238 @@
+"""
+Rate Limit Module - Token Buckets and the Shared API Rate Limiter
+
+Paces outgoing API requests without fixed sleeps: a burst up to the
+bucket capacity goes out immediately, after which requests are spaced
+at the refill rate.
+
+- PriorityTokenBucket: thread- and async-safe bucket where waiting
+  high-priority requests go before lower-priority ones
+- RateLimiter: process-wide buckets per endpoint class, used by
+  ClobClient, GammaClient and RelayerClient on every request
+
+Example:
+    # Shared limiter: orders pre-empt background polling
+    from src.rate_limit import CLOB_ORDER, PRIORITY_HIGH, get_rate_limiter
+
+    limiter = get_rate_limiter()
+    await limiter.acquire(CLOB_ORDER, PRIORITY_HIGH)
+    print(limiter.stats())
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+
+# Request priorities (lower value goes first)
+PRIORITY_HIGH = 0  # Order placement and cancels
+PRIORITY_NORMAL = 1  # Interactive reads
+PRIORITY_LOW = 2  # Background refreshes and market discovery
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+
+class PriorityTokenBucket:
+    """
+    Token bucket shared by threads and event loops, with priorities.
+
+    A request yields while any higher-priority request is waiting, so
+    orders and cancels are served first once the bucket runs low.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiting = [0] * len(PRIORITIES)
+        self._acquired = [0] * len(PRIORITIES)
+        self._waited = 0.0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_take(self, tokens: float, priority: int) -> Optional[float]:
+        """Take tokens now, or return how long to wait before trying again."""
+        with self._lock:
+            self._refill()
+            if any(self._waiting[:priority]):
+                # Let the higher-priority waiter take the next token first
+                return max(tokens - self._tokens, 0.0) / self.rate + 1.0 / self.rate
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                self._acquired[priority] += 1
+                return None
+            return (tokens - self._tokens) / self.rate
+
+    def _set_waiting(self, priority: int, delta: int, waited: float = 0.0) -> None:
+        with self._lock:
+            self._waiting[priority] += delta
+            self._waited += waited
+
+    def _check(self, tokens: float, priority: int) -> None:
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens (capacity {self.capacity})")
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+
+    async def acquire(self, tokens: float = 1.0, priority: int = PRIORITY_NORMAL) -> float:
+        """
+        Wait until `tokens` are available and take them.
+
+        Args:
+            tokens: Tokens to take (at most capacity)
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+
+        Returns:
+            Seconds spent waiting
+        """
+        self._check(tokens, priority)
+        delay = self._try_take(tokens, priority)
+        if delay is None:
+            return 0.0
+
+        start = time.monotonic()
+        self._set_waiting(priority, 1)
+        try:
+            while delay is not None:
+                await asyncio.sleep(delay)
+                delay = self._try_take(tokens, priority)
+        finally:
+            waited = time.monotonic() - start
+            self._set_waiting(priority, -1, waited)
+        return waited
+
+    def acquire_sync(self, tokens: float = 1.0, priority: int = PRIORITY_NORMAL) -> float:
+        """Blocking acquire() for synchronous clients (sleeps the calling thread)."""
+        self._check(tokens, priority)
+        delay = self._try_take(tokens, priority)
+        if delay is None:
+            return 0.0
+
+        start = time.monotonic()
+        self._set_waiting(priority, 1)
+        try:
+            while delay is not None:
+                time.sleep(delay)
+                delay = self._try_take(tokens, priority)
+        finally:
+            waited = time.monotonic() - start
+            self._set_waiting(priority, -1, waited)
+        return waited
+
+    def stats(self) -> Dict[str, object]:
+        """Current level and counters."""
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": round(self._tokens, 3),
+                "capacity": self.capacity,
+                "rate": self.rate,
+                "waiting": list(self._waiting),
+                "acquired": list(self._acquired),
+                "waited_seconds": round(self._waited, 3),
+            }
+
+
+# Endpoint classes
+CLOB_READ = "clob_read"  # Books, prices, open orders, trades
+CLOB_ORDER = "clob_order"  # Order placement and cancels
+GAMMA = "gamma"  # Market discovery
+RELAYER = "relayer"  # Gasless transactions
+
+# Bucket (rate/s, burst), kept well under Polymarket's published limits
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "clob": (50.0, 100),  # Every CLOB request
+    "clob_order": (20.0, 40),  # Order/cancel endpoints on top of "clob"
+    "gamma": (20.0, 40),
+    "relayer": (1.0, 5),
+}
+
+# Buckets each endpoint class draws from, in order
+DEFAULT_CLASSES: Dict[str, Tuple[str, ...]] = {
+    CLOB_READ: ("clob",),
+    CLOB_ORDER: ("clob", "clob_order"),
+    GAMMA: ("gamma",),
+    RELAYER: ("relayer",),
+}
+
+
+class RateLimiter:
+    """
+    Process-wide request limiter keyed by endpoint class.
+
+    Each endpoint class draws one token from each of its buckets, so
+    order endpoints count against both the CLOB-wide and the order limit.
+    Unknown classes are not limited.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Tuple[float, float]]] = None,
+        classes: Optional[Mapping[str, Sequence[str]]] = None,
+    ):
+        """
+        Args:
+            limits: Bucket name -> (rate per second, burst)
+            classes: Endpoint class -> bucket names
+        """
+        limits = DEFAULT_LIMITS if limits is None else limits
+        classes = DEFAULT_CLASSES if classes is None else classes
+        self.buckets: Dict[str, PriorityTokenBucket] = {
+            name: PriorityTokenBucket(rate, capacity) for name, (rate, capacity) in limits.items()
+        }
+        self._classes = {
+            endpoint_class: [self.buckets[name] for name in names if name in self.buckets]
+            for endpoint_class, names in classes.items()
+        }
+
+    async def acquire(self, endpoint_class: str, priority: int = PRIORITY_NORMAL) -> float:
+        """
+        Wait for a request slot.
+
+        Args:
+            endpoint_class: CLOB_READ, CLOB_ORDER, GAMMA or RELAYER
+            priority: Request priority
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        for bucket in self._classes.get(endpoint_class, ()):
+            waited += await bucket.acquire(1, priority)
+        return waited
+
+    def acquire_sync(self, endpoint_class: str, priority: int = PRIORITY_NORMAL) -> float:
+        """Blocking acquire() for synchronous clients."""
+        waited = 0.0
+        for bucket in self._classes.get(endpoint_class, ()):
+            waited += bucket.acquire_sync(1, priority)
+        return waited
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """Current bucket levels and counters, by bucket name."""
+        return {name: bucket.stats() for name, bucket in self.buckets.items()}
+
+
+_default_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Shared limiter used by API clients by default."""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = RateLimiter()
+    return _default_limiter
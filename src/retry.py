@@ -0,0 +1,220 @@
+"""
+Retry Module - Error Classification, Backoff and Retry Budgets
+
+Decides whether a failed API request is retried and how long to wait:
+- Failures are classified (connect, read timeout, lost connection,
+  429, 5xx); other errors are not retried
+- Non-idempotent requests (POST /order) are only retried when the
+  server cannot have acted on them (connect failure, 429)
+- Full-jitter exponential backoff, or the server's Retry-After
+- A process-wide retry budget stops retry storms during an outage
+
+Example:
+    from src.retry import RetryPolicy, classify_error, get_retry_budget
+
+    policy = RetryPolicy(max_attempts=3)
+    budget = get_retry_budget()
+
+    budget.record_request()
+    try:
+        response = send()
+    except Exception as e:
+        delay = policy.next_delay(
+            "POST", attempt=1, kind=classify_error(e),
+            retry_after=retry_after_from(e), budget=budget,
+        )
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+
+# Failure classes
+CONNECT = "connect"  # Connection never established; request not sent
+READ_TIMEOUT = "read_timeout"  # Request sent, no response in time
+CONNECTION_LOST = "connection_lost"  # Request sent, connection dropped
+RATE_LIMITED = "rate_limited"  # 429
+SERVER_ERROR = "server_error"  # 5xx
+
+# Failures where the server did not act on the request
+NOT_PROCESSED = (CONNECT, RATE_LIMITED)
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+def classify_status(status_code: int) -> Optional[str]:
+    """Failure class for an HTTP status (None = not retryable)."""
+    if status_code == 429:
+        return RATE_LIMITED
+    if 500 <= status_code < 600:
+        return SERVER_ERROR
+    return None
+
+
+def classify_error(error: BaseException) -> Optional[str]:
+    """
+    Failure class for a request exception.
+
+    Understands requests exceptions and TransportError/HttpStatusError
+    from the async transport.
+
+    Args:
+        error: Exception raised while sending a request
+
+    Returns:
+        Failure class, or None if the error should not be retried
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        return classify_status(response.status_code)
+
+    kind = getattr(error, "kind", None)
+    if kind is not None:
+        return kind
+
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return CONNECT
+    if isinstance(error, requests.exceptions.ReadTimeout):
+        return READ_TIMEOUT
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        if isinstance(reason, (NewConnectionError, ConnectTimeoutError)):
+            return CONNECT
+        return CONNECTION_LOST
+    return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_from(error: BaseException) -> Optional[float]:
+    """Retry-After of the response attached to an exception, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries.
+
+    Every request earns `ratio` of a retry, up to `burst` saved retries;
+    each retry spends one. When an exchange is failing, retries stop once
+    the budget is spent instead of multiplying the load.
+    """
+
+    def __init__(self, ratio: float = 0.2, burst: float = 10.0):
+        """
+        Args:
+            ratio: Retries earned per request
+            burst: Maximum saved retries (also the starting balance)
+        """
+        self.ratio = ratio
+        self.burst = burst
+        self.retries = 0
+        self.denied = 0
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Retries currently available."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Credit the budget for a new request."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if it is spent."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+
+_default_budget: Optional[RetryBudget] = None
+
+
+def get_retry_budget() -> RetryBudget:
+    """Shared retry budget used by API clients by default."""
+    global _default_budget
+    if _default_budget is None:
+        _default_budget = RetryBudget()
+    return _default_budget
+
+
+@dataclass
+class RetryPolicy:
+    """Backoff and retry rules for one client."""
+    max_attempts: int = 3  # Including the first attempt
+    base_delay: float = 0.25  # Backoff ceiling for the first retry
+    max_delay: float = 2.0  # Backoff ceiling cap
+    max_retry_after: float = 5.0  # Give up if the server asks for longer
+
+    def should_retry(self, method: str, kind: Optional[str]) -> bool:
+        """Whether a failure class may be retried for this method."""
+        if kind is None:
+            return False
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return kind in NOT_PROCESSED
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay after the given (1-based) attempt."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        kind: Optional[str],
+        retry_after: Optional[float] = None,
+        budget: Optional[RetryBudget] = None,
+    ) -> Optional[float]:
+        """
+        Delay before the next attempt.
+
+        Args:
+            method: HTTP method of the failed request
+            attempt: Attempts made so far (1-based)
+            kind: Failure class from classify_error
+            retry_after: Server-requested delay in seconds
+            budget: Retry budget to spend from
+
+        Returns:
+            Seconds to wait, or None to give up
+        """
+        if attempt >= self.max_attempts or not self.should_retry(method, kind):
+            return None
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if budget is not None and not budget.try_spend():
+            return None
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
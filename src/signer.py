@@ -4,6 +4,10 @@ Signer Module - EIP-712 Order Signing
 Provides EIP-712 signature functionality for Polymarket orders
 and authentication messages.
 
+Order signing takes a fast path: the EIP-712 domain separator and Order
+type hash are computed once per signer, so each order only costs one
+struct hash, one digest and the ECDSA signature.
+
 EIP-712 is a standard for structured data hashing and signing
 that provides better security and user experience than plain
 message signing.
@@ -26,12 +30,21 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from eth_account import Account
 from eth_account.messages import encode_typed_data
-from eth_utils import to_checksum_address
+from eth_utils import keccak, to_checksum_address
 
 
 # USDC has 6 decimal places
 USDC_DECIMALS = 6
 
+# Canonical EIP712Domain field order and types
+EIP712_DOMAIN_FIELDS = (
+    ("name", "string"),
+    ("version", "string"),
+    ("chainId", "uint256"),
+    ("verifyingContract", "address"),
+    ("salt", "bytes32"),
+)
+
 
 @dataclass
 class Order:
@@ -142,6 +155,51 @@ class OrderSigner:
 
         self.address = self.wallet.address
 
+        # EIP-712 constants, hashed once per signer
+        self._domain_separator = self._hash_domain(self.DOMAIN)
+        self._order_fields = self.ORDER_TYPES["Order"]
+        self._order_type_hash = keccak(text=self._encode_type("Order", self._order_fields))
+        self._sign_hash = getattr(self.wallet, "unsafe_sign_hash", None) or self.wallet.signHash
+
+    @staticmethod
+    def _encode_type(name: str, fields: list) -> str:
+        """EIP-712 type string, e.g. "Order(uint256 salt,address maker,...)"."""
+        params = ",".join(f"{field['type']} {field['name']}" for field in fields)
+        return f"{name}({params})"
+
+    @staticmethod
+    def _encode_value(field_type: str, value: Any) -> bytes:
+        """ABI-encode one atomic EIP-712 value as a 32-byte word."""
+        if field_type == "address":
+            return bytes.fromhex(value[2:].rjust(64, "0"))
+        if field_type == "string":
+            return keccak(text=value)
+        if field_type == "bytes32":
+            return bytes(value)
+        if field_type.startswith("uint"):
+            return int(value).to_bytes(32, "big")
+        raise SignerError(f"Unsupported EIP-712 type: {field_type}")
+
+    @classmethod
+    def _hash_domain(cls, domain: Dict[str, Any]) -> bytes:
+        """Compute the EIP-712 domain separator."""
+        fields = [
+            {"name": name, "type": field_type}
+            for name, field_type in EIP712_DOMAIN_FIELDS
+            if name in domain
+        ]
+        encoded = keccak(text=cls._encode_type("EIP712Domain", fields))
+        for field in fields:
+            encoded += cls._encode_value(field["type"], domain[field["name"]])
+        return keccak(encoded)
+
+    def _order_digest(self, order_message: Dict[str, Any]) -> bytes:
+        """EIP-712 digest of an order message using the cached hashes."""
+        encoded = self._order_type_hash
+        for field in self._order_fields:
+            encoded += self._encode_value(field["type"], order_message[field["name"]])
+        return keccak(b"\x19\x01" + self._domain_separator + keccak(encoded))
+
     @classmethod
     def from_encrypted(
         cls,
@@ -213,6 +271,23 @@ class OrderSigner:
         signed = self.wallet.sign_message(signable)
         return "0x" + signed.signature.hex()
 
+    def _order_message(self, order: Order) -> Dict[str, Any]:
+        """Build the EIP-712 Order message."""
+        return {
+            "salt": 0,
+            "maker": to_checksum_address(order.maker),
+            "signer": self.address,
+            "taker": "0x0000000000000000000000000000000000000000",
+            "tokenId": int(order.token_id),
+            "makerAmount": int(order.maker_amount),
+            "takerAmount": int(order.taker_amount),
+            "expiration": 0,
+            "nonce": order.nonce,
+            "feeRateBps": order.fee_rate_bps,
+            "side": order.side_value,
+            "signatureType": order.signature_type,
+        }
+
     def sign_order(self, order: Order) -> Dict[str, Any]:
         """
         Sign a Polymarket order.
@@ -227,30 +302,10 @@ class OrderSigner:
             SignerError: If signing fails
         """
         try:
-            # Build order message for EIP-712
-            order_message = {
-                "salt": 0,
-                "maker": to_checksum_address(order.maker),
-                "signer": self.address,
-                "taker": "0x0000000000000000000000000000000000000000",
-                "tokenId": int(order.token_id),
-                "makerAmount": int(order.maker_amount),
-                "takerAmount": int(order.taker_amount),
-                "expiration": 0,
-                "nonce": order.nonce,
-                "feeRateBps": order.fee_rate_bps,
-                "side": order.side_value,
-                "signatureType": order.signature_type,
-            }
-
-            # Sign the order using new API format
-            signable = encode_typed_data(
-                domain_data=self.DOMAIN,
-                message_types=self.ORDER_TYPES,
-                message_data=order_message
-            )
+            order_message = self._order_message(order)
 
-            signed = self.wallet.sign_message(signable)
+            # Sign the EIP-712 digest (same bytes as encode_typed_data)
+            signed = self._sign_hash(self._order_digest(order_message))
 
             return {
                 "order": {
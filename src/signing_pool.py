@@ -0,0 +1,131 @@
+"""
+Signing Pool Module - Parallel Order Signing in Worker Processes
+
+ECDSA signing is CPU-bound and holds the GIL, so signing a burst of
+orders on the event loop stalls WebSocket processing. SigningExecutor
+moves signing into a process pool:
+- The private key is sent once, when each worker starts
+- Calls only carry Order objects and return signed order dicts
+- A batch is split into one chunk per worker and signed in parallel
+
+Workers use the "spawn" start method, so entry scripts need the usual
+`if __name__ == "__main__":` guard.
+
+Example:
+    from src.signer import Order, OrderSigner
+    from src.signing_pool import SigningExecutor
+
+    signer = OrderSigner("0x...")
+    executor = SigningExecutor(signer, max_workers=4)
+    await executor.warm_up()
+
+    orders = [Order(token_id, 0.40 + i * 0.01, 5.0, "BUY", maker) for i in range(50)]
+    signed = await executor.sign_orders_batch(orders)
+
+    executor.shutdown()
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from .signer import Order, OrderSigner
+
+
+# Signer owned by each worker process (set by _init_worker)
+_worker_signer: Optional[OrderSigner] = None
+
+
+def _init_worker(private_key: str) -> None:
+    """Worker initializer: build the signer once per process."""
+    global _worker_signer
+    _worker_signer = OrderSigner(private_key)
+
+
+def _worker_address() -> str:
+    """Address of the worker's signer (used to start and check workers)."""
+    return _worker_signer.address
+
+
+def _sign_chunk(orders: List[Order]) -> List[Dict[str, Any]]:
+    """Sign a chunk of orders in a worker process."""
+    return [_worker_signer.sign_order(order) for order in orders]
+
+
+class SigningExecutor:
+    """
+    Process pool that signs orders for one key.
+
+    Workers are spawned (not forked) so they do not inherit the parent's
+    event loop, sockets or threads.
+    """
+
+    def __init__(
+        self,
+        signer: OrderSigner,
+        max_workers: Optional[int] = None,
+        mp_context: str = "spawn",
+    ):
+        """
+        Args:
+            signer: Signer whose key the workers load
+            max_workers: Worker processes (default: CPU count, at most 8)
+            mp_context: multiprocessing start method
+        """
+        self.address = signer.address
+        self.max_workers = max_workers or min(os.cpu_count() or 1, 8)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(signer.wallet.key.hex(),),
+        )
+
+    async def warm_up(self) -> int:
+        """
+        Start every worker so the first burst does not pay process startup.
+
+        Returns:
+            Number of workers that answered
+        """
+        loop = asyncio.get_running_loop()
+        addresses = await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _worker_address)
+            for _ in range(self.max_workers)
+        ))
+        return sum(1 for address in addresses if address == self.address)
+
+    async def sign_order(self, order: Order) -> Dict[str, Any]:
+        """Sign one order in a worker process."""
+        loop = asyncio.get_running_loop()
+        signed = await loop.run_in_executor(self._pool, _sign_chunk, [order])
+        return signed[0]
+
+    async def sign_orders_batch(self, orders: Sequence[Order]) -> List[Dict[str, Any]]:
+        """
+        Sign orders in parallel across the workers.
+
+        Args:
+            orders: Orders to sign
+
+        Returns:
+            Signed orders in input order
+        """
+        orders = list(orders)
+        if not orders:
+            return []
+
+        # One chunk per worker keeps the number of round trips small
+        chunk_size = -(-len(orders) // self.max_workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _sign_chunk, orders[start:start + chunk_size])
+            for start in range(0, len(orders), chunk_size)
+        ))
+        return [signed for chunk in chunks for signed in chunk]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -3,6 +3,11 @@ WebSocket Client Module - Real-time Market Data
 
 Provides WebSocket connectivity for Polymarket CLOB API:
 - Real-time orderbook updates
+- Local book maintenance from price_change deltas (REST resync on drift)
+- Reconnects with an immediate first retry and jittered exponential
+  backoff; books are flagged stale while disconnected and backfilled
+  from REST snapshots on reconnect
+- Optional bounded callback queues so slow callbacks never stall recv()
 - Price change notifications
 - Trade events
 
@@ -16,16 +21,29 @@ Example:
     ws.on_book = on_book_update
     await ws.subscribe(["token_id_1", "token_id_2"])
     await ws.run()
+
+    # Refuse to act on books that missed updates during a reconnect
+    book = ws.get_orderbook("token_id_1")
+    if book.stale or book.age > 5.0:
+        return
 """
 
 import json
+import time
+import random
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List, Callable, Set, Union, Awaitable, TYPE_CHECKING
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_left
+from typing import Optional, Dict, Any, List, Callable, Set, Tuple, Union, Awaitable, TYPE_CHECKING
+from dataclasses import dataclass
+
+from .codec import decode_errors, get_loads, resolve_backend
+from .event_queue import BoundedEventQueue, QueuedEvent, QueueStats, COALESCE, dispatching
 
 if TYPE_CHECKING:
     from websockets.client import WebSocketClientProtocol
+    from .client import ClobClient
 
 logger = logging.getLogger(__name__)
 
@@ -56,60 +74,225 @@ class OrderbookLevel:
     size: float
 
 
-@dataclass
+class BookSide:
+    """
+    One side of an orderbook backed by parallel price/size arrays.
+
+    Prices are kept sorted from worst to best so the best level is always
+    the last element: O(1) best price, O(log n) lookup by price, and
+    updates at the top of book only shift the tail of the arrays.
+
+    Bids are stored by price, asks by negated price, so both sides share
+    the same ascending-key bisect logic.
+    """
+
+    __slots__ = ("_sign", "_keys", "_sizes")
+
+    def __init__(self, descending: bool):
+        """
+        Args:
+            descending: True for bids (best = highest), False for asks
+        """
+        self._sign = 1.0 if descending else -1.0
+        self._keys = array("d")
+        self._sizes = array("d")
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def best_price(self) -> Optional[float]:
+        """Best price on this side, or None if empty."""
+        if not self._keys:
+            return None
+        return self._keys[-1] * self._sign
+
+    def load(self, levels: List[Dict[str, Any]]) -> None:
+        """Replace all levels from raw {"price", "size"} dicts."""
+        self.load_pairs([(float(lvl["price"]), float(lvl["size"])) for lvl in levels])
+
+    def load_pairs(self, pairs: List[Tuple[float, float]]) -> None:
+        """Replace all levels from (price, size) float pairs."""
+        sign = self._sign
+        keyed = [(price * sign, size) for price, size in pairs] if sign < 0 else list(pairs)
+        # Timsort is linear on input that is already ordered either way
+        keyed.sort()
+        self._keys = array("d", [k for k, _ in keyed])
+        self._sizes = array("d", [sz for _, sz in keyed])
+
+    def set(self, price: float, size: float) -> None:
+        """Insert, update, or delete (size <= 0) the level at price."""
+        keys = self._keys
+        key = price * self._sign
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            if size > 0:
+                self._sizes[i] = size
+            else:
+                del keys[i]
+                del self._sizes[i]
+        elif size > 0:
+            keys.insert(i, key)
+            self._sizes.insert(i, size)
+
+    def size_at(self, price: float) -> float:
+        """Aggregate size at price (0.0 if no level)."""
+        keys = self._keys
+        key = price * self._sign
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return self._sizes[i]
+        return 0.0
+
+    def levels(self, depth: Optional[int] = None) -> List[OrderbookLevel]:
+        """Levels best-first, optionally limited to depth."""
+        n = len(self._keys)
+        count = n if depth is None else min(depth, n)
+        sign = self._sign
+        keys = self._keys
+        sizes = self._sizes
+        return [
+            OrderbookLevel(price=keys[i] * sign, size=sizes[i])
+            for i in range(n - 1, n - 1 - count, -1)
+        ]
+
+
 class OrderbookSnapshot:
-    """Complete orderbook snapshot."""
-    asset_id: str
-    market: str
-    timestamp: int
-    bids: List[OrderbookLevel] = field(default_factory=list)
-    asks: List[OrderbookLevel] = field(default_factory=list)
-    hash: str = ""
+    """
+    Orderbook for a single asset.
+
+    Bids and asks are held in BookSide arrays; `bids`/`asks` materialize
+    OrderbookLevel lists best-first for display code, while best_bid,
+    best_ask and the cached mid_price are O(1).
+
+    `stale` is set when the connection that maintained the book dropped
+    (updates may have been missed); `age` is the time since the book was
+    last updated.
+    """
+
+    __slots__ = (
+        "asset_id", "market", "timestamp", "hash", "_bids", "_asks", "_mid",
+        "stale", "updated_at",
+    )
+
+    def __init__(
+        self,
+        asset_id: str,
+        market: str,
+        timestamp: int,
+        bids: Optional[List[OrderbookLevel]] = None,
+        asks: Optional[List[OrderbookLevel]] = None,
+        hash: str = "",
+    ):
+        self.asset_id = asset_id
+        self.market = market
+        self.timestamp = timestamp
+        self.hash = hash
+        self._bids = BookSide(descending=True)
+        self._asks = BookSide(descending=False)
+        self._mid: Optional[float] = None
+        self.stale = False
+        self.updated_at = time.monotonic()
+        if bids:
+            self._bids.load([{"price": lvl.price, "size": lvl.size} for lvl in bids])
+        if asks:
+            self._asks.load([{"price": lvl.price, "size": lvl.size} for lvl in asks])
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderbookSnapshot(asset_id={self.asset_id!r}, market={self.market!r}, "
+            f"timestamp={self.timestamp}, bids={len(self._bids)}, asks={len(self._asks)}, "
+            f"hash={self.hash!r}, stale={self.stale})"
+        )
+
+    @property
+    def age(self) -> float:
+        """Seconds since the book was last updated."""
+        return time.monotonic() - self.updated_at
+
+    @property
+    def bids(self) -> List[OrderbookLevel]:
+        """Bid levels, best (highest) first."""
+        return self._bids.levels()
+
+    @property
+    def asks(self) -> List[OrderbookLevel]:
+        """Ask levels, best (lowest) first."""
+        return self._asks.levels()
+
+    def top_bids(self, depth: int) -> List[OrderbookLevel]:
+        """Top `depth` bid levels without materializing the whole side."""
+        return self._bids.levels(depth)
+
+    def top_asks(self, depth: int) -> List[OrderbookLevel]:
+        """Top `depth` ask levels without materializing the whole side."""
+        return self._asks.levels(depth)
 
     @property
     def best_bid(self) -> float:
         """Get best bid price."""
-        return self.bids[0].price if self.bids else 0.0
+        price = self._bids.best_price
+        return price if price is not None else 0.0
 
     @property
     def best_ask(self) -> float:
         """Get best ask price."""
-        return self.asks[0].price if self.asks else 1.0
+        price = self._asks.best_price
+        return price if price is not None else 1.0
 
     @property
     def mid_price(self) -> float:
-        """Get mid price."""
-        if self.best_bid > 0 and self.best_ask < 1:
-            return (self.best_bid + self.best_ask) / 2
-        elif self.best_bid > 0:
-            return self.best_bid
-        elif self.best_ask < 1:
-            return self.best_ask
-        return 0.5
+        """Get mid price (cached until the book changes)."""
+        if self._mid is None:
+            best_bid = self.best_bid
+            best_ask = self.best_ask
+            if best_bid > 0 and best_ask < 1:
+                self._mid = (best_bid + best_ask) / 2
+            elif best_bid > 0:
+                self._mid = best_bid
+            elif best_ask < 1:
+                self._mid = best_ask
+            else:
+                self._mid = 0.5
+        return self._mid
+
+    def apply_change(self, price: float, size: float, side: str) -> None:
+        """
+        Apply an aggregate level update in place.
+
+        Args:
+            price: Price level affected
+            size: New aggregate size at that level (0 removes the level)
+            side: "BUY" updates bids, "SELL" updates asks
+        """
+        side = side.upper()
+        if side == "BUY":
+            self._bids.set(price, size)
+        elif side == "SELL":
+            self._asks.set(price, size)
+        else:
+            return
+        self._mid = None
+
+    def matches_top_of_book(self, best_bid: float, best_ask: float, tolerance: float = 1e-9) -> bool:
+        """Check local best bid/ask against values reported by the server."""
+        return (
+            abs(self.best_bid - best_bid) <= tolerance
+            and abs(self.best_ask - best_ask) <= tolerance
+        )
 
     @classmethod
     def from_message(cls, msg: Dict[str, Any]) -> "OrderbookSnapshot":
-        """Create from WebSocket book message."""
-        bids = [
-            OrderbookLevel(price=float(b["price"]), size=float(b["size"]))
-            for b in msg.get("bids", [])
-        ]
-        asks = [
-            OrderbookLevel(price=float(a["price"]), size=float(a["size"]))
-            for a in msg.get("asks", [])
-        ]
-        # Sort bids descending, asks ascending
-        bids.sort(key=lambda x: x.price, reverse=True)
-        asks.sort(key=lambda x: x.price)
-
-        return cls(
+        """Create from WebSocket book message (or REST /book response)."""
+        snapshot = cls(
             asset_id=msg.get("asset_id", ""),
             market=msg.get("market", ""),
             timestamp=int(msg.get("timestamp", 0)),
-            bids=bids,
-            asks=asks,
             hash=msg.get("hash", ""),
         )
+        snapshot._bids.load(msg.get("bids", []))
+        snapshot._asks.load(msg.get("asks", []))
+        return snapshot
 
 
 @dataclass
@@ -122,6 +305,7 @@ class PriceChange:
     best_bid: float
     best_ask: float
     hash: str = ""
+    has_top_of_book: bool = True  # best_bid/best_ask were sent (not defaults)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PriceChange":
@@ -134,6 +318,7 @@ class PriceChange:
             best_bid=float(data.get("best_bid", 0)),
             best_ask=float(data.get("best_ask", 1)),
             hash=data.get("hash", ""),
+            has_top_of_book="best_bid" in data and "best_ask" in data,
         )
 
 
@@ -162,6 +347,212 @@ class LastTradePrice:
         )
 
 
+@dataclass
+class PriceChangeEvent:
+    """Batch of price changes for one market (price_change message)."""
+    market: str
+    price_changes: List[PriceChange]
+    timestamp: int = 0
+
+
+MarketEvent = Union[OrderbookSnapshot, PriceChangeEvent, LastTradePrice, Dict[str, Any]]
+
+
+def event_from_dict(data: Dict[str, Any]) -> MarketEvent:
+    """
+    Convert a decoded market channel message into a typed event.
+
+    Unhandled event types (e.g. tick_size_change) are returned as dicts.
+    """
+    event_type = data.get("event_type", "")
+    if event_type == "book":
+        return OrderbookSnapshot.from_message(data)
+    if event_type == "price_change":
+        return PriceChangeEvent(
+            market=data.get("market", ""),
+            price_changes=[PriceChange.from_dict(pc) for pc in data.get("price_changes", [])],
+            timestamp=int(data.get("timestamp", 0) or 0),
+        )
+    if event_type == "last_trade_price":
+        return LastTradePrice.from_message(data)
+    return data
+
+
+def _build_msgspec_decoder() -> Any:
+    """Build a msgspec decoder producing typed structs for known events."""
+    import msgspec
+
+    class _Level(msgspec.Struct):
+        price: float
+        size: float
+
+    class _BookMessage(msgspec.Struct, tag="book", tag_field="event_type"):
+        asset_id: str = ""
+        market: str = ""
+        timestamp: int = 0
+        hash: str = ""
+        bids: List[_Level] = []
+        asks: List[_Level] = []
+
+        def to_event(self) -> OrderbookSnapshot:
+            snapshot = OrderbookSnapshot(
+                asset_id=self.asset_id,
+                market=self.market,
+                timestamp=self.timestamp,
+                hash=self.hash,
+            )
+            snapshot._bids.load_pairs([(lvl.price, lvl.size) for lvl in self.bids])
+            snapshot._asks.load_pairs([(lvl.price, lvl.size) for lvl in self.asks])
+            return snapshot
+
+    class _PriceChangeMessage(msgspec.Struct, tag="price_change", tag_field="event_type"):
+        market: str = ""
+        timestamp: int = 0
+        price_changes: List[PriceChange] = []
+
+        def to_event(self) -> PriceChangeEvent:
+            return PriceChangeEvent(self.market, self.price_changes, self.timestamp)
+
+    class _TradeMessage(msgspec.Struct, tag="last_trade_price", tag_field="event_type"):
+        asset_id: str = ""
+        market: str = ""
+        price: float = 0.0
+        size: float = 0.0
+        side: str = ""
+        timestamp: int = 0
+        fee_rate_bps: int = 0
+
+        def to_event(self) -> LastTradePrice:
+            return LastTradePrice(
+                asset_id=self.asset_id,
+                market=self.market,
+                price=self.price,
+                size=self.size,
+                side=self.side,
+                timestamp=self.timestamp,
+                fee_rate_bps=self.fee_rate_bps,
+            )
+
+    message = Union[_BookMessage, _PriceChangeMessage, _TradeMessage]
+    # strict=False lets msgspec convert the feed's numeric strings in C
+    return msgspec.json.Decoder(Union[List[message], message], strict=False)
+
+
+class MarketMessageDecoder:
+    """
+    Decodes market channel frames into typed events.
+
+    Uses the JSON backend selected by `backend` (see src.codec). With
+    msgspec, book/price_change/last_trade_price frames are decoded
+    straight into typed structs; frames that do not fit the schema
+    (other event types, unusual number formats) fall back to a plain
+    parse followed by event_from_dict().
+
+    Example:
+        decoder = MarketMessageDecoder("auto")
+        for event in decoder.decode(frame):
+            ...
+    """
+
+    def __init__(self, backend: str = "auto"):
+        """
+        Args:
+            backend: JSON backend name ("auto", "orjson", "msgspec", "json")
+        """
+        self.backend = resolve_backend(backend)
+        self.errors = decode_errors(self.backend)
+        self._loads = get_loads(self.backend)
+        self._typed = None
+        self._validation_error: Any = ()
+        if self.backend == "msgspec":
+            import msgspec
+            self._typed = _build_msgspec_decoder()
+            self._validation_error = msgspec.ValidationError
+
+    def decode(self, frame: Union[str, bytes]) -> List[MarketEvent]:
+        """Decode one WebSocket frame (single message or array) into events."""
+        if self._typed is not None:
+            try:
+                decoded = self._typed.decode(frame)
+            except self._validation_error:
+                pass
+            else:
+                if isinstance(decoded, list):
+                    return [msg.to_event() for msg in decoded]
+                return [decoded.to_event()]
+
+        data = self._loads(frame)
+        items = data if isinstance(data, list) else [data]
+        return [event_from_dict(item) for item in items if isinstance(item, dict)]
+
+
+class WsInstrumentation:
+    """
+    Logging for the WebSocket hot path.
+
+    - Event debug logging is only formatted when DEBUG is enabled for
+      the module logger (`debug_enabled`, checked per event).
+    - Raw frame logging is sampled: the first `log_first_frames` frames,
+      then every `sample_every`-th frame, capped at
+      `max_frames_per_minute` log lines.
+
+    Example:
+        ws = MarketWebSocket(
+            instrumentation=WsInstrumentation(sample_every=0)  # no sampling
+        )
+    """
+
+    def __init__(
+        self,
+        log_first_frames: int = 5,
+        sample_every: int = 1000,
+        max_frames_per_minute: int = 30,
+        preview_chars: int = 200,
+        log: logging.Logger = logger,
+    ):
+        """
+        Args:
+            log_first_frames: Always log this many initial frames
+            sample_every: Log every N-th frame after that (0 disables)
+            max_frames_per_minute: Upper bound on logged frames per minute
+            preview_chars: Characters of each frame to include
+            log: Logger to write to
+        """
+        self.log_first_frames = log_first_frames
+        self.sample_every = sample_every
+        self.max_frames_per_minute = max_frames_per_minute
+        self.preview_chars = preview_chars
+        self.log = log
+
+        self.frame_count = 0
+        self._window_start = 0.0
+        self._window_logged = 0
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether per-event debug output should be built."""
+        return self.log.isEnabledFor(logging.DEBUG)
+
+    def on_frame(self, frame: Union[str, bytes]) -> None:
+        """Count a received frame and log it if it is sampled."""
+        self.frame_count += 1
+        n = self.frame_count
+        if n > self.log_first_frames and (self.sample_every <= 0 or n % self.sample_every):
+            return
+        if not self.log.isEnabledFor(logging.INFO):
+            return
+
+        now = time.monotonic()
+        if now - self._window_start >= 60.0:
+            self._window_start = now
+            self._window_logged = 0
+        if self._window_logged >= self.max_frames_per_minute:
+            return
+        self._window_logged += 1
+
+        self.log.info("WS message #%d: %s", n, frame[:self.preview_chars])
+
+
 # Type aliases for callbacks
 BookCallback = Callable[[OrderbookSnapshot], Union[None, Awaitable[None]]]
 PriceChangeCallback = Callable[[str, List[PriceChange]], Union[None, Awaitable[None]]]
@@ -193,22 +584,40 @@ class MarketWebSocket:
         self,
         url: str = WSS_MARKET_URL,
         reconnect_interval: float = 5.0,
+        max_reconnect_interval: float = 30.0,
         ping_interval: float = 20.0,
         ping_timeout: float = 10.0,
+        rest_client: Optional["ClobClient"] = None,
+        json_backend: str = "auto",
+        instrumentation: Optional[WsInstrumentation] = None,
+        event_queue_size: int = 0,
+        overflow_policy: str = COALESCE,
     ):
         """
         Initialize WebSocket client.
 
         Args:
             url: WebSocket endpoint URL
-            reconnect_interval: Seconds between reconnection attempts
+            reconnect_interval: Base delay of the reconnect backoff (the first
+                retry after a healthy connection drops is immediate)
+            max_reconnect_interval: Cap on the reconnect backoff
             ping_interval: Seconds between ping messages
             ping_timeout: Seconds to wait for pong response
+            rest_client: ClobClient used to resync books that drift (optional)
+            json_backend: JSON decoder for frames ("auto", "orjson", "msgspec", "json")
+            instrumentation: Hot-path logging settings (defaults to sampled frames)
+            event_queue_size: Queue callbacks per event type with this bound and
+                run them on worker tasks (0 = run callbacks inline)
+            overflow_policy: Queue overflow policy (drop_oldest, coalesce, block)
         """
         self.url = url
         self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
+        self.rest_client = rest_client
+        self._decoder = MarketMessageDecoder(json_backend)
+        self.instrumentation = instrumentation or WsInstrumentation()
 
         self._ws_connect, self._connection_closed = _load_websockets()
 
@@ -216,9 +625,21 @@ class MarketWebSocket:
         self._ws: Optional["WebSocketClientProtocol"] = None
         self._running = False
         self._subscribed_assets: Set[str] = set()
+        self.reconnects = 0
 
-        # Orderbook cache
+        # Orderbook cache (maintained from book snapshots + price_change deltas)
         self._orderbooks: Dict[str, OrderbookSnapshot] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        # Deltas received while a resync is in flight: (event timestamp, change)
+        self._resync_deltas: Dict[str, List[Tuple[int, PriceChange]]] = {}
+        self._backfill_task: Optional[asyncio.Task] = None
+
+        # Callback dispatch queues (one worker per event type)
+        self._queues: Dict[str, BoundedEventQueue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        if event_queue_size > 0:
+            for kind in ("book", "price_change", "trade"):
+                self._queues[kind] = BoundedEventQueue(event_queue_size, overflow_policy)
 
         # Callbacks
         self._on_book: Optional[BookCallback] = None
@@ -250,6 +671,56 @@ class MarketWebSocket:
         """Get cached orderbooks."""
         return self._orderbooks
 
+    @property
+    def subscribed_assets(self) -> Set[str]:
+        """Copy of the subscribed asset IDs."""
+        return set(self._subscribed_assets)
+
+    @property
+    def asset_count(self) -> int:
+        """Number of subscribed assets."""
+        return len(self._subscribed_assets)
+
+    def track_assets(self, asset_ids: List[str]) -> None:
+        """
+        Add assets to the subscription without sending anything.
+
+        They go out with the next subscribe or reconnect.
+
+        Args:
+            asset_ids: Token IDs to track
+        """
+        self._subscribed_assets.update(asset_ids)
+
+    def adopt(self, asset_id: str, book: Optional[OrderbookSnapshot] = None) -> None:
+        """
+        Track an asset handed over by another connection, with its cached book.
+
+        Like track_assets, nothing is sent. A book this connection already
+        holds for the asset is kept.
+
+        Args:
+            asset_id: Token ID to take over
+            book: The previous connection's cached book, if any
+        """
+        self._subscribed_assets.add(asset_id)
+        if book is not None:
+            self._orderbooks.setdefault(asset_id, book)
+
+    def hand_over(self, asset_id: str, other: "MarketWebSocket") -> None:
+        """
+        Move an asset and its cached book to another connection, locally.
+
+        The caller subscribes it on other and unsubscribes it here. Events
+        this connection still receives for the asset until then are ignored.
+
+        Args:
+            asset_id: Token ID to move
+            other: Connection that takes over the asset
+        """
+        self._subscribed_assets.discard(asset_id)
+        other.adopt(asset_id, self._orderbooks.pop(asset_id, None))
+
     def get_orderbook(self, asset_id: str) -> Optional[OrderbookSnapshot]:
         """Get cached orderbook for asset."""
         return self._orderbooks.get(asset_id)
@@ -259,6 +730,10 @@ class MarketWebSocket:
         ob = self._orderbooks.get(asset_id)
         return ob.mid_price if ob else 0.0
 
+    def queue_stats(self) -> Dict[str, QueueStats]:
+        """Depth/drop/latency metrics per callback queue (empty when inline)."""
+        return {kind: queue.stats for kind, queue in self._queues.items()}
+
     # Callback decorators
     def on_book(self, callback: BookCallback) -> BookCallback:
         """Decorator to set book update callback."""
@@ -319,6 +794,15 @@ class MarketWebSocket:
     async def disconnect(self) -> None:
         """Disconnect from WebSocket."""
         self._running = False
+        tasks = [*self._resync_tasks.values(), *self._workers.values()]
+        if self._backfill_task is not None:
+            tasks.append(self._backfill_task)
+            self._backfill_task = None
+        for task in tasks:
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_deltas.clear()
+        self._workers.clear()
         if self._ws:
             await self._ws.close()
             self._ws = None
@@ -332,7 +816,9 @@ class MarketWebSocket:
 
         Args:
             asset_ids: List of token IDs to subscribe to
-            replace: If True, replace existing subscriptions (clears old data)
+            replace: If True, make asset_ids the whole subscription. Only the
+                difference is sent; books of assets that stay are kept and
+                books of dropped assets are evicted
 
         Returns:
             True if subscription sent successfully
@@ -341,9 +827,14 @@ class MarketWebSocket:
             return False
 
         if replace:
-            # Clear old subscriptions and cached data
+            if self._subscribed_assets and self.is_connected:
+                return await self._apply_subscription_diff(asset_ids)
+
+            # Nothing live to diff against: send the full set (now or on connect)
+            dropped = self._subscribed_assets.difference(asset_ids)
+            for asset_id in dropped:
+                self._orderbooks.pop(asset_id, None)
             self._subscribed_assets.clear()
-            self._orderbooks.clear()
 
         self._subscribed_assets.update(asset_ids)
         logger.info(f"subscribe() called with {len(asset_ids)} assets, is_connected={self.is_connected}, ws={self._ws is not None}")
@@ -370,6 +861,31 @@ class MarketWebSocket:
                 self._on_error(e)
             return False
 
+    async def _apply_subscription_diff(self, asset_ids: List[str]) -> bool:
+        """
+        Move a live subscription to asset_ids with subscribe/unsubscribe operations.
+
+        Args:
+            asset_ids: Complete set of token IDs to stay subscribed to
+
+        Returns:
+            True if every message was sent
+        """
+        target = set(asset_ids)
+        added = [asset_id for asset_id in dict.fromkeys(asset_ids)
+                 if asset_id not in self._subscribed_assets]
+        removed = [asset_id for asset_id in self._subscribed_assets if asset_id not in target]
+
+        logger.info(f"Subscription diff: +{len(added)} -{len(removed)}, "
+                    f"{len(target) - len(added)} kept")
+
+        ok = True
+        if added:
+            ok = await self.subscribe_more(added) and ok
+        if removed:
+            ok = await self.unsubscribe(removed) and ok
+        return ok
+
     async def subscribe_more(self, asset_ids: List[str]) -> bool:
         """
         Subscribe to additional assets.
@@ -411,10 +927,16 @@ class MarketWebSocket:
         Returns:
             True if unsubscription sent successfully
         """
-        if not self.is_connected or not asset_ids:
+        if not asset_ids:
             return False
 
+        # Drop locally even when offline so reconnects don't resubscribe
         self._subscribed_assets.difference_update(asset_ids)
+        for asset_id in asset_ids:
+            self._orderbooks.pop(asset_id, None)
+
+        if not self.is_connected:
+            return False
 
         unsubscribe_msg = {
             "assets_ids": asset_ids,
@@ -430,41 +952,243 @@ class MarketWebSocket:
             return False
 
     async def _handle_message(self, data: Dict[str, Any]) -> None:
-        """Handle incoming WebSocket message."""
-        event_type = data.get("event_type", "")
-        logger.debug(f"Received event: {event_type}, keys: {list(data.keys())}")
+        """Handle an incoming WebSocket message that is already parsed to a dict."""
+        if self.instrumentation.debug_enabled:
+            logger.debug("Received event: %s, keys: %s", data.get("event_type", ""), list(data.keys()))
+        await self._handle_event(event_from_dict(data))
 
-        if event_type == "book":
-            snapshot = OrderbookSnapshot.from_message(data)
-            self._orderbooks[snapshot.asset_id] = snapshot
-            logger.debug(f"Book update for {snapshot.asset_id[:20]}...: mid={snapshot.mid_price:.4f}")
-            await self._run_callback(self._on_book, snapshot, label="book")
+    async def _handle_event(self, event: MarketEvent) -> None:
+        """
+        Dispatch a decoded market event.
 
-        elif event_type == "price_change":
-            market = data.get("market", "")
+        Events for assets that are not subscribed (e.g. in flight while an
+        unsubscribe or a hand-over takes effect) are dropped, and any book
+        they would have recreated is evicted.
+        """
+        if isinstance(event, OrderbookSnapshot):
+            if event.asset_id not in self._subscribed_assets:
+                self._orderbooks.pop(event.asset_id, None)
+                return
+            self._orderbooks[event.asset_id] = event
+            if self.instrumentation.debug_enabled:
+                logger.debug("Book update for %s...: mid=%.4f", event.asset_id[:20], event.mid_price)
+            await self._dispatch("book", event, key=event.asset_id)
+
+        elif isinstance(event, PriceChangeEvent):
             changes = [
-                PriceChange.from_dict(pc)
-                for pc in data.get("price_changes", [])
+                change for change in event.price_changes
+                if change.asset_id in self._subscribed_assets
             ]
-            await self._run_callback(
-                self._on_price_change,
-                market,
-                changes,
-                label="price_change",
-            )
+            if not changes:
+                return
+            self._apply_price_changes(changes, event.timestamp)
+            await self._dispatch("price_change", event.market, changes)
 
-        elif event_type == "last_trade_price":
-            trade = LastTradePrice.from_message(data)
-            await self._run_callback(self._on_trade, trade, label="trade")
+        elif isinstance(event, LastTradePrice):
+            if event.asset_id in self._subscribed_assets:
+                await self._dispatch("trade", event)
 
-        elif event_type == "tick_size_change":
+        elif event.get("event_type") == "tick_size_change":
             # Log but don't handle specially
-            logger.debug(f"Tick size change: {data}")
+            logger.debug("Tick size change: %s", event)
 
         else:
-            logger.debug(f"Unknown event type: {event_type}")
+            if self.instrumentation.debug_enabled:
+                logger.debug("Unknown event type: %s", event.get("event_type", ""))
+
+    def _apply_price_changes(self, changes: List[PriceChange], timestamp: int = 0) -> None:
+        """Apply price_change deltas to cached books and verify top of book."""
+        latest: Dict[str, PriceChange] = {}
+        for change in changes:
+            snapshot = self._orderbooks.get(change.asset_id)
+            if snapshot is None:
+                # No base snapshot yet - the initial book event will cover it
+                continue
+            snapshot.apply_change(change.price, change.size, change.side)
+            if change.hash:
+                snapshot.hash = change.hash
+            latest[change.asset_id] = change
+            pending = self._resync_deltas.get(change.asset_id)
+            if pending is not None:
+                pending.append((timestamp, change))
+
+        # best_bid/best_ask on the last change reflect the server book after
+        # every level in this message has been applied
+        now = time.monotonic()
+        for asset_id, change in latest.items():
+            snapshot = self._orderbooks[asset_id]
+            snapshot.updated_at = now
+            if not change.has_top_of_book:
+                continue  # Nothing to verify against
+            if not snapshot.matches_top_of_book(change.best_bid, change.best_ask):
+                logger.warning(
+                    "Orderbook drift for %s...: local %s/%s, server %s/%s",
+                    asset_id[:20], snapshot.best_bid, snapshot.best_ask,
+                    change.best_bid, change.best_ask,
+                )
+                self._schedule_resync(asset_id)
+
+    def _schedule_resync(self, asset_id: str) -> None:
+        """Schedule a REST snapshot refresh for an asset (one in flight per asset)."""
+        if self.rest_client is None:
+            return
+        task = self._resync_tasks.get(asset_id)
+        if task is not None and not task.done():
+            return
+        self._resync_tasks[asset_id] = asyncio.create_task(self._resync_orderbook(asset_id))
+
+    async def _resync_orderbook(self, asset_id: str, only_stale: bool = False) -> bool:
+        """
+        Replace a cached book with a fresh snapshot from the CLOB REST API.
 
-    async def _run_callback(self, callback: Optional[Callable[..., Any]], *args: Any, label: str) -> None:
+        Args:
+            asset_id: Asset to refresh
+            only_stale: Replace the book only while it is still stale
+                (backfill after a reconnect); otherwise deltas received
+                while the request was in flight are replayed on top of the
+                snapshot, and the snapshot is dropped only if the WebSocket
+                sent a whole new book meanwhile
+
+        Returns:
+            True if the cached book was replaced
+        """
+        before = self._orderbooks.get(asset_id)
+        deltas: List[Tuple[int, PriceChange]] = []
+        if not only_stale:
+            self._resync_deltas.setdefault(asset_id, [])
+        try:
+            data = await self.rest_client.get_order_book_async(asset_id)
+            if not data or asset_id not in self._subscribed_assets:
+                return False
+            data.setdefault("asset_id", asset_id)
+            snapshot = OrderbookSnapshot.from_message(data)
+        except Exception as e:
+            logger.error(f"Orderbook resync failed for {asset_id[:20]}...: {e}")
+            return False
+        finally:
+            if not only_stale:
+                self._resync_tasks.pop(asset_id, None)
+                deltas = self._resync_deltas.pop(asset_id, None) or []
+
+        current = self._orderbooks.get(asset_id)
+        if only_stale:
+            if current is not None and not current.stale:
+                return False
+        elif current is not before:
+            return False  # A newer full book arrived over the WebSocket
+        else:
+            self._replay_deltas(snapshot, deltas)
+
+        self._orderbooks[asset_id] = snapshot
+        logger.info(f"Orderbook resynced for {asset_id[:20]}...")
+        await self._dispatch("book", snapshot, key=asset_id)
+        return True
+
+    @staticmethod
+    def _replay_deltas(snapshot: OrderbookSnapshot, deltas: List[Tuple[int, PriceChange]]) -> int:
+        """
+        Apply deltas received during a resync on top of its REST snapshot.
+
+        Deltas stamped at or before the snapshot are already part of it.
+        Unstamped ones are replayed too: each sets an absolute level size,
+        so at worst a level lags until its next WebSocket change.
+
+        Returns:
+            Number of deltas replayed
+        """
+        replayed = 0
+        for timestamp, change in deltas:
+            if timestamp and snapshot.timestamp and timestamp <= snapshot.timestamp:
+                continue
+            snapshot.apply_change(change.price, change.size, change.side)
+            if change.hash:
+                snapshot.hash = change.hash
+            replayed += 1
+        return replayed
+
+    def _mark_books_stale(self) -> int:
+        """Flag every cached book stale after the connection drops."""
+        for snapshot in self._orderbooks.values():
+            snapshot.stale = True
+        return len(self._orderbooks)
+
+    async def _backfill_books(self) -> int:
+        """
+        Fetch REST snapshots for all stale subscribed books in parallel.
+
+        Runs next to the receive loop after a reconnect, so books recover
+        without waiting for the server to resend them. Books the
+        WebSocket refreshes first are left alone.
+
+        Returns:
+            Number of books replaced
+        """
+        stale = [
+            asset_id for asset_id in self._subscribed_assets
+            if (book := self._orderbooks.get(asset_id)) is not None and book.stale
+        ]
+        if self.rest_client is None or not stale:
+            return 0
+
+        results = await asyncio.gather(
+            *(self._resync_orderbook(asset_id, only_stale=True) for asset_id in stale)
+        )
+        recovered = sum(results)
+        logger.info(f"Backfilled {recovered}/{len(stale)} stale books from REST")
+        return recovered
+
+    def _reconnect_delay(self, attempt: int) -> float:
+        """
+        Delay before a reconnect attempt.
+
+        Args:
+            attempt: Consecutive failed attempts, 1 for the first retry
+
+        Returns:
+            0 for the first retry, then full-jitter exponential backoff
+        """
+        if attempt <= 1:
+            return 0.0
+        ceiling = min(self.max_reconnect_interval, self.reconnect_interval * 2 ** (attempt - 2))
+        return random.uniform(0, ceiling)
+
+    def _callback_for(self, kind: str) -> Optional[Callable[..., Any]]:
+        """Resolve the user callback for an event type."""
+        if kind == "book":
+            return self._on_book
+        if kind == "price_change":
+            return self._on_price_change
+        return self._on_trade
+
+    async def _dispatch(self, kind: str, *args: Any, key: Optional[str] = None) -> None:
+        """
+        Deliver an event to its callback.
+
+        Runs the callback inline when queuing is disabled; otherwise
+        enqueues it for the per-type worker so receive never waits on
+        strategy code (unless the overflow policy is "block").
+        """
+        if self._callback_for(kind) is None:
+            return
+
+        queue = self._queues.get(kind)
+        if queue is None:
+            await self.run_callback(self._callback_for(kind), *args, label=kind)
+            return
+
+        worker = self._workers.get(kind)
+        if worker is None or worker.done():
+            self._workers[kind] = asyncio.create_task(self._dispatch_worker(kind, queue))
+        await queue.put(QueuedEvent(kind=kind, args=args, key=key))
+
+    async def _dispatch_worker(self, kind: str, queue: BoundedEventQueue) -> None:
+        """Drain one callback queue, exposing each event via current_event()."""
+        while True:
+            event = await queue.get()
+            with dispatching(event):
+                await self.run_callback(self._callback_for(kind), *event.args, label=kind)
+
+    async def run_callback(self, callback: Optional[Callable[..., Any]], *args: Any, label: str) -> None:
         """Run a callback that may be sync or async, logging failures."""
         if not callback:
             return
@@ -475,41 +1199,39 @@ class MarketWebSocket:
         except Exception as e:
             logger.error(f"Error in {label} callback: {e}")
 
-    async def _run_loop(self) -> None:
-        """Main message processing loop."""
-        msg_count = 0
+    async def _run_loop(self) -> bool:
+        """
+        Main message processing loop.
+
+        Returns:
+            True if any message was received (the connection was healthy)
+        """
+        received = False
         while self._running and self.is_connected:
             try:
                 message = await asyncio.wait_for(
                     self._ws.recv(),
                     timeout=self.ping_interval + 5
                 )
-                msg_count += 1
-
-                # Log first 5 messages, then every 1000
-                if msg_count <= 5 or msg_count % 1000 == 0:
-                    logger.info(f"WS message #{msg_count}: {message[:200] if len(message) > 200 else message}")
-
-                data = json.loads(message)
+                received = True
+                self.instrumentation.on_frame(message)
 
-                # Handle array of messages
-                if isinstance(data, list):
-                    for item in data:
-                        await self._handle_message(item)
-                else:
-                    await self._handle_message(data)
+                # Frames may carry a single message or an array of them
+                for event in self._decoder.decode(message):
+                    await self._handle_event(event)
 
             except asyncio.TimeoutError:
                 logger.warning("WebSocket receive timeout")
             except self._connection_closed as e:
                 logger.warning(f"WebSocket connection closed: {e}")
                 break
-            except json.JSONDecodeError as e:
+            except self._decoder.errors as e:
                 logger.error(f"Failed to parse message: {e}")
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
                 if self._on_error:
                     self._on_error(e)
+        return received
 
     async def run(self, auto_reconnect: bool = True) -> None:
         """
@@ -519,37 +1241,45 @@ class MarketWebSocket:
             auto_reconnect: Whether to automatically reconnect on disconnect
         """
         self._running = True
+        attempt = 0
 
         while self._running:
             # Connect
             if not await self.connect():
-                if auto_reconnect:
-                    logger.info(f"Reconnecting in {self.reconnect_interval}s...")
-                    await asyncio.sleep(self.reconnect_interval)
-                    continue
-                else:
+                if not auto_reconnect:
                     break
+                attempt += 1
+                await self._wait_before_reconnect(attempt)
+                continue
 
             # Subscribe to assets
             if self._subscribed_assets:
                 logger.info(f"Sending subscription for {len(self._subscribed_assets)} assets after connect")
                 await self.subscribe(list(self._subscribed_assets))
+                if self._backfill_task is None or self._backfill_task.done():
+                    self._backfill_task = asyncio.create_task(self._backfill_books())
 
             # Run message loop
-            await self._run_loop()
+            healthy = await self._run_loop()
 
-            # Handle disconnect
+            # Handle disconnect: cached books may now miss updates
+            self._mark_books_stale()
             if self._on_disconnect:
                 self._on_disconnect()
 
-            if not self._running:
+            if not self._running or not auto_reconnect:
                 break
 
-            if auto_reconnect:
-                logger.info(f"Reconnecting in {self.reconnect_interval}s...")
-                await asyncio.sleep(self.reconnect_interval)
-            else:
-                break
+            attempt = 1 if healthy else attempt + 1
+            await self._wait_before_reconnect(attempt)
+
+    async def _wait_before_reconnect(self, attempt: int) -> None:
+        """Sleep for the backoff delay of a reconnect attempt."""
+        delay = self._reconnect_delay(attempt)
+        self.reconnects += 1
+        logger.info(f"Reconnecting in {delay:.2f}s (attempt {attempt})...")
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     async def run_until_cancelled(self) -> None:
         """Run until cancelled or stopped."""
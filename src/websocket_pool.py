@@ -0,0 +1,424 @@
+"""
+WebSocket Pool Module - Sharded Market Data Connections
+
+Spreads a large market channel subscription across several
+MarketWebSocket connections:
+- Asset IDs are sharded across N connections (least-loaded first)
+- Each connection runs its own receive loop, so one stalled socket
+  only delays its own assets
+- Book, price change and trade events are merged into one set of
+  callbacks and one orderbook lookup surface
+- Shards are rebalanced when subscriptions are removed
+
+Example:
+    from src.websocket_pool import MarketWebSocketPool
+
+    pool = MarketWebSocketPool(num_connections=4)
+
+    @pool.on_book
+    async def handle_book(snapshot):
+        print(snapshot.asset_id, snapshot.mid_price)
+
+    await pool.subscribe(all_token_ids)
+    await pool.run()
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any, Iterable, List, Callable, Set, Tuple
+
+from .websocket_client import (
+    MarketWebSocket,
+    OrderbookSnapshot,
+    PriceChange,
+    LastTradePrice,
+    BookCallback,
+    PriceChangeCallback,
+    TradeCallback,
+    ErrorCallback,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MarketWebSocketPool:
+    """
+    Pool of MarketWebSocket connections sharing one dispatch surface.
+
+    Callbacks registered on the pool receive events from every shard.
+    on_connect/on_disconnect fire once per shard connection change.
+
+    Example:
+        pool = MarketWebSocketPool(num_connections=3)
+        pool.on_price_change(handle_changes)
+        await pool.subscribe(token_ids)
+        asyncio.create_task(pool.run())
+
+        mid = pool.get_mid_price(token_ids[0])
+    """
+
+    def __init__(
+        self,
+        num_connections: int = 4,
+        rebalance_threshold: int = 2,
+        **ws_kwargs: Any,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            num_connections: Number of WebSocket connections (shards)
+            rebalance_threshold: Move assets once the largest shard holds
+                more than this many assets above the smallest
+            **ws_kwargs: Passed to each MarketWebSocket (url, rest_client, ...)
+        """
+        if num_connections < 1:
+            raise ValueError("num_connections must be at least 1")
+
+        self.rebalance_threshold = max(1, rebalance_threshold)
+        self.shards: List[MarketWebSocket] = [
+            MarketWebSocket(**ws_kwargs) for _ in range(num_connections)
+        ]
+
+        # asset_id -> shard index
+        self._shard_of: Dict[str, int] = {}
+
+        self._running = False
+        self._auto_reconnect = True
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
+
+        # Callbacks
+        self._on_book: Optional[BookCallback] = None
+        self._on_price_change: Optional[PriceChangeCallback] = None
+        self._on_trade: Optional[TradeCallback] = None
+        self._on_error: Optional[ErrorCallback] = None
+        self._on_connect: Optional[Callable[[], None]] = None
+        self._on_disconnect: Optional[Callable[[], None]] = None
+
+        for shard in self.shards:
+            self._wire_shard(shard)
+
+    def _wire_shard(self, shard: MarketWebSocket) -> None:
+        """Forward a shard's events to the pool callbacks."""
+
+        async def handle_book(snapshot: OrderbookSnapshot) -> None:
+            await shard.run_callback(self._on_book, snapshot, label="book")
+
+        async def handle_price_change(market: str, changes: List[PriceChange]) -> None:
+            await shard.run_callback(self._on_price_change, market, changes, label="price_change")
+
+        async def handle_trade(trade: LastTradePrice) -> None:
+            await shard.run_callback(self._on_trade, trade, label="trade")
+
+        def handle_error(error: Exception) -> None:
+            if self._on_error:
+                self._on_error(error)
+
+        def handle_connect() -> None:
+            if self._on_connect:
+                self._on_connect()
+
+        def handle_disconnect() -> None:
+            if self._on_disconnect:
+                self._on_disconnect()
+
+        shard.on_book(handle_book)
+        shard.on_price_change(handle_price_change)
+        shard.on_trade(handle_trade)
+        shard.on_error(handle_error)
+        shard.on_connect(handle_connect)
+        shard.on_disconnect(handle_disconnect)
+
+    @property
+    def is_connected(self) -> bool:
+        """True when every shard that holds assets is connected."""
+        active = [shard for shard in self.shards if shard.asset_count]
+        return bool(active) and all(shard.is_connected for shard in active)
+
+    @property
+    def subscribed_assets(self) -> Set[str]:
+        """All subscribed asset IDs across shards."""
+        return set(self._shard_of)
+
+    @property
+    def orderbooks(self) -> Dict[str, OrderbookSnapshot]:
+        """Merged view of cached orderbooks across shards."""
+        merged: Dict[str, OrderbookSnapshot] = {}
+        for index, shard in enumerate(self.shards):
+            merged.update(
+                (asset_id, book) for asset_id, book in shard.orderbooks.items()
+                if self._shard_of.get(asset_id) == index
+            )
+        return merged
+
+    def shard_loads(self) -> List[int]:
+        """Number of assets assigned to each shard."""
+        return [shard.asset_count for shard in self.shards]
+
+    def shard_for(self, asset_id: str) -> Optional[MarketWebSocket]:
+        """Get the connection that owns an asset."""
+        index = self._shard_of.get(asset_id)
+        return self.shards[index] if index is not None else None
+
+    def get_orderbook(self, asset_id: str) -> Optional[OrderbookSnapshot]:
+        """Get cached orderbook for asset."""
+        shard = self.shard_for(asset_id)
+        return shard.get_orderbook(asset_id) if shard else None
+
+    def get_mid_price(self, asset_id: str) -> float:
+        """Get mid price for asset."""
+        shard = self.shard_for(asset_id)
+        return shard.get_mid_price(asset_id) if shard else 0.0
+
+    # Callback decorators
+    def on_book(self, callback: BookCallback) -> BookCallback:
+        """Decorator to set book update callback."""
+        self._on_book = callback
+        return callback
+
+    def on_price_change(self, callback: PriceChangeCallback) -> PriceChangeCallback:
+        """Decorator to set price change callback."""
+        self._on_price_change = callback
+        return callback
+
+    def on_trade(self, callback: TradeCallback) -> TradeCallback:
+        """Decorator to set trade callback."""
+        self._on_trade = callback
+        return callback
+
+    def on_error(self, callback: ErrorCallback) -> ErrorCallback:
+        """Decorator to set error callback."""
+        self._on_error = callback
+        return callback
+
+    def on_connect(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Decorator to set connect callback (fires per shard)."""
+        self._on_connect = callback
+        return callback
+
+    def on_disconnect(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Decorator to set disconnect callback (fires per shard)."""
+        self._on_disconnect = callback
+        return callback
+
+    def _assign(self, asset_ids: List[str], leaving: Iterable[str] = ()) -> Dict[int, List[str]]:
+        """
+        Assign new assets to the least-loaded shards.
+
+        Args:
+            asset_ids: Token IDs to place (already assigned ones are skipped)
+            leaving: Assigned token IDs about to be removed; their slots
+                count as free
+
+        Returns:
+            Additions per shard index
+        """
+        loads = self.shard_loads()
+        for asset_id in leaving:
+            index = self._shard_of.get(asset_id)
+            if index is not None:
+                loads[index] -= 1
+
+        additions: Dict[int, List[str]] = {}
+        for asset_id in dict.fromkeys(asset_ids):
+            if asset_id in self._shard_of:
+                continue
+            index = loads.index(min(loads))
+            loads[index] += 1
+            self._shard_of[asset_id] = index
+            # Reserve the slot now so the shard's load is right before sending
+            self.shards[index].track_assets([asset_id])
+            additions.setdefault(index, []).append(asset_id)
+        return additions
+
+    async def _send_additions(self, additions: Dict[int, List[str]]) -> bool:
+        """Subscribe each shard to its newly assigned assets."""
+        if not additions:
+            return True
+
+        results = await asyncio.gather(*[
+            self.shards[index].subscribe_more(assets)
+            for index, assets in additions.items()
+        ])
+        self._start_idle_shards()
+        return all(results)
+
+    async def _send_removals(self, asset_ids: List[str]) -> Optional[bool]:
+        """
+        Unsubscribe assets from their shards, without rebalancing.
+
+        Returns:
+            True if every shard sent its unsubscription, None if no asset
+            was subscribed
+        """
+        removals: Dict[int, List[str]] = {}
+        for asset_id in dict.fromkeys(asset_ids):
+            index = self._shard_of.pop(asset_id, None)
+            if index is not None:
+                removals.setdefault(index, []).append(asset_id)
+
+        if not removals:
+            return None
+
+        results = await asyncio.gather(*[
+            self.shards[index].unsubscribe(assets)
+            for index, assets in removals.items()
+        ])
+        return all(results)
+
+    async def subscribe(self, asset_ids: List[str], replace: bool = False) -> bool:
+        """
+        Subscribe to market data for assets.
+
+        Args:
+            asset_ids: List of token IDs to subscribe to
+            replace: If True, make asset_ids the whole subscription. Assets
+                that stay keep their shard and cached book; only dropped
+                assets are unsubscribed
+
+        Returns:
+            True if every shard accepted its subscription
+        """
+        if not asset_ids:
+            return False
+
+        if not replace:
+            return await self.subscribe_more(asset_ids)
+
+        target = set(asset_ids)
+        removed = [asset_id for asset_id in self._shard_of if asset_id not in target]
+
+        # New assets first, placed as if the removals were done, then drop
+        # the old ones and rebalance once (a rollover swaps every asset)
+        subscribed = await self._send_additions(self._assign(asset_ids, leaving=removed))
+        if removed:
+            # Best effort: offline shards drop the assets locally
+            await self._send_removals(removed)
+            await self.rebalance()
+
+        return subscribed
+
+    async def subscribe_more(self, asset_ids: List[str]) -> bool:
+        """
+        Subscribe to additional assets on the least-loaded shards.
+
+        Args:
+            asset_ids: Additional token IDs to subscribe to
+
+        Returns:
+            True if every shard accepted its subscription
+        """
+        if not asset_ids:
+            return False
+
+        return await self._send_additions(self._assign(asset_ids))
+
+    async def unsubscribe(self, asset_ids: List[str]) -> bool:
+        """
+        Unsubscribe from assets and rebalance shards if they drift apart.
+
+        Args:
+            asset_ids: Token IDs to unsubscribe from
+
+        Returns:
+            True if every shard sent its unsubscription
+        """
+        sent = await self._send_removals(asset_ids)
+        if sent is None:
+            return False
+
+        await self.rebalance()
+        return sent
+
+    async def rebalance(self) -> int:
+        """
+        Move assets from the largest to the smallest shard until loads are
+        within rebalance_threshold of each other.
+
+        Cached books move with their assets so readers never see a gap.
+
+        Returns:
+            Number of assets moved
+        """
+        moves: Dict[Tuple[int, int], List[str]] = {}
+        loads = self.shard_loads()
+        while max(loads) - min(loads) > self.rebalance_threshold:
+            src = loads.index(max(loads))
+            dst = loads.index(min(loads))
+            asset_id = next(
+                asset_id for asset_id, index in self._shard_of.items() if index == src
+            )
+
+            self.shards[src].hand_over(asset_id, self.shards[dst])
+            self._shard_of[asset_id] = dst
+            moves.setdefault((src, dst), []).append(asset_id)
+            loads[src] -= 1
+            loads[dst] += 1
+
+        for (src, dst), assets in moves.items():
+            logger.info(f"Rebalancing {len(assets)} assets from shard {src} to shard {dst}")
+            # Subscribe on the new shard before dropping the old one
+            await self.shards[dst].subscribe_more(assets)
+            await self.shards[src].unsubscribe(assets)
+
+        self._start_idle_shards()
+        return sum(len(assets) for assets in moves.values())
+
+    def _start_idle_shards(self) -> None:
+        """Start run loops for shards that gained assets while running."""
+        if not self._running:
+            return
+        for index, shard in enumerate(self.shards):
+            task = self._tasks.get(index)
+            if shard.asset_count and (task is None or task.done()):
+                self._tasks[index] = asyncio.create_task(shard.run(self._auto_reconnect))
+                self._wakeup.set()
+
+    async def run(self, auto_reconnect: bool = True) -> None:
+        """
+        Run all shards that hold assets until stopped.
+
+        Args:
+            auto_reconnect: Whether shards reconnect on disconnect
+        """
+        self._running = True
+        self._auto_reconnect = auto_reconnect
+        self._start_idle_shards()
+
+        while self._running:
+            tasks = [task for task in self._tasks.values() if not task.done()]
+            if not tasks and self._tasks and not auto_reconnect:
+                break
+
+            # Wake up when a shard loop ends or a new one is started
+            self._wakeup.clear()
+            waiter = asyncio.create_task(self._wakeup.wait())
+            try:
+                await asyncio.wait([*tasks, waiter], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+
+    async def run_until_cancelled(self) -> None:
+        """Run until cancelled or stopped."""
+        try:
+            await self.run(auto_reconnect=True)
+        except asyncio.CancelledError:
+            await self.disconnect()
+
+    def stop(self) -> None:
+        """Stop all shards."""
+        self._running = False
+        self._wakeup.set()
+        for shard in self.shards:
+            shard.stop()
+
+    async def disconnect(self) -> None:
+        """Disconnect all shards and cancel their loops."""
+        self._running = False
+        self._wakeup.set()
+        await asyncio.gather(*[shard.disconnect() for shard in self.shards])
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
@@ -18,20 +18,31 @@ Usage:
         async def on_tick(self, prices):
             # Called each strategy tick
             pass
+
+    # React to book changes instead of polling every update_interval
+    config = StrategyConfig(tick_mode="event", tick_debounce=0.002, max_tick_latency=0.02)
 """
 
 import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 
 from lib.console import LogBuffer, log
 from lib.market_manager import MarketManager, MarketInfo
+from lib.order_pool import PreSignedOrderPool
 from lib.price_tracker import PriceTracker
-from lib.position_manager import PositionManager
+from lib.position_manager import Position, PositionManager
 from src.bot import TradingBot
-from src.websocket_client import OrderbookSnapshot
+from src.rate_limit import PRIORITY_LOW
+from src.websocket_client import OrderbookSnapshot, PriceChange
+
+
+# Tick modes
+TICK_INTERVAL = "interval"  # Poll every update_interval
+TICK_EVENT = "event"  # Tick on book changes
+TICK_MODES = (TICK_INTERVAL, TICK_EVENT)
 
 
 @dataclass
@@ -47,13 +58,35 @@ class StrategyConfig:
     # Market settings
     market_check_interval: float = 30.0
     auto_switch_market: bool = True
+    market_prefetch_seconds: float = 60.0  # Subscribe to the next window early
+
+    # WebSocket settings
+    json_backend: str = "auto"  # auto, orjson, msgspec, json
+    event_queue_size: int = 0  # >0 runs callbacks off the receive loop
+    overflow_policy: str = "coalesce"  # drop_oldest, coalesce, block
+    coalesce_books: bool = False  # Only deliver the newest book per asset
+
+    # Order settings
+    buy_slippage: float = 0.02  # Added to the current price for BUY limits
+    presign_orders: bool = False  # Keep BUY orders signed ahead of time
+    presign_min_price: float = 0.01  # Lowest pre-signed price
+    presign_max_price: float = 0.99  # Highest pre-signed price
+    presign_band: float = 0.10  # Only pre-sign prices this close to the mid (0 = whole range)
+    allow_stale_books: bool = False  # Trade on books that missed updates in a reconnect
+    max_book_age: float = 0.0  # Refuse books not updated for this long (0 = no limit)
 
     # Price tracking
     price_lookback_seconds: int = 10
     price_history_size: int = 100
 
+    # Tick scheduling
+    tick_mode: str = TICK_INTERVAL  # interval, event
+    tick_debounce: float = 0.005  # Event mode: quiet period that ends a burst
+    max_tick_latency: float = 0.05  # Event mode: max delay from first change to tick
+    render_interval: float = 0.25  # Event mode: status redraw period
+
     # Display settings
-    update_interval: float = 0.1
+    update_interval: float = 0.1  # Tick period (heartbeat in event mode)
     order_refresh_interval: float = 30.0  # Seconds between order refreshes
 
 
@@ -76,15 +109,14 @@ class BaseStrategy(ABC):
             bot: TradingBot instance for order execution
             config: Strategy configuration
         """
+        if config.tick_mode not in TICK_MODES:
+            raise ValueError(f"Unknown tick mode: {config.tick_mode}. Use: {list(TICK_MODES)}")
+
         self.bot = bot
         self.config = config
 
         # Core components
-        self.market = MarketManager(
-            coin=config.coin,
-            market_check_interval=config.market_check_interval,
-            auto_switch_market=config.auto_switch_market,
-        )
+        self.market = self._create_market()
 
         self.prices = PriceTracker(
             lookback_seconds=config.price_lookback_seconds,
@@ -97,9 +129,14 @@ class BaseStrategy(ABC):
             max_positions=config.max_positions,
         )
 
+        # Pre-signed entries (created in start() when presign_orders is set)
+        self.order_pool: Optional[PreSignedOrderPool] = None
+        self._recenter_task: Optional[asyncio.Task] = None
+
         # State
         self.running = False
         self._status_mode = False
+        self._book_changed = asyncio.Event()
 
         # Logging
         self._log_buffer = LogBuffer(max_size=5)
@@ -109,6 +146,23 @@ class BaseStrategy(ABC):
         self._last_order_refresh: float = 0
         self._order_refresh_task: Optional[asyncio.Task] = None
 
+        # Positions already warned about exiting on a stale book
+        self._stale_exit_warned: Set[str] = set()
+
+    def _create_market(self) -> MarketManager:
+        """Market discovery and WebSocket for config.coin (override to share a connection)."""
+        config = self.config
+        return MarketManager(
+            coin=config.coin,
+            market_check_interval=config.market_check_interval,
+            auto_switch_market=config.auto_switch_market,
+            json_backend=config.json_backend,
+            event_queue_size=config.event_queue_size,
+            overflow_policy=config.overflow_policy,
+            coalesce_books=config.coalesce_books,
+            prefetch_seconds=config.market_prefetch_seconds,
+        )
+
     @property
     def is_connected(self) -> bool:
         """Check if WebSocket is connected."""
@@ -129,29 +183,32 @@ class BaseStrategy(ABC):
         """Get cached open orders."""
         return self._cached_orders
 
-    def _refresh_orders_sync(self) -> List[dict]:
-        """Refresh open orders synchronously (called via to_thread)."""
-        try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.bot.get_open_orders())
-            finally:
-                loop.close()
-        except Exception:
-            return []
-
     async def _do_order_refresh(self) -> None:
         """Background task to refresh orders without blocking."""
         try:
-            orders = await asyncio.to_thread(self._refresh_orders_sync)
-            self._cached_orders = orders
+            self._cached_orders = await self.bot.get_open_orders(priority=PRIORITY_LOW)
         except Exception:
             pass
         finally:
             self._order_refresh_task = None
 
+    def _token_mids(self) -> Dict[str, float]:
+        """Mid price per current token ID."""
+        return {
+            token_id: self.market.get_mid_price(side)
+            for side, token_id in self.token_ids.items()
+        }
+
+    def _maybe_recenter_presigned(self) -> None:
+        """Move the pre-signed band after the mids in a worker (fire-and-forget)."""
+        if self.order_pool is None:
+            return
+        if self._recenter_task is not None and not self._recenter_task.done():
+            return
+        mids = self._token_mids()
+        if self.order_pool.needs_recenter(mids):
+            self._recenter_task = asyncio.create_task(self.order_pool.recenter_async(mids))
+
     def _maybe_refresh_orders(self) -> None:
         """Schedule order refresh if interval has passed (fire-and-forget)."""
         now = time.time()
@@ -194,9 +251,15 @@ class BaseStrategy(ABC):
                     self.prices.record(side, snapshot.mid_price)
                     break
 
+            self._book_changed.set()
+
             # Delegate to subclass
             await self.on_book_update(snapshot)
 
+        @self.market.on_price_change
+        def handle_price_change(market: str, changes: List[PriceChange]):  # pyright: ignore[reportUnusedFunction]
+            self._book_changed.set()
+
         @self.market.on_market_change
         def handle_market_change(old_slug: str, new_slug: str):  # pyright: ignore[reportUnusedFunction]
             self.log(f"Market changed: {old_slug} -> {new_slug}", "warning")
@@ -213,6 +276,9 @@ class BaseStrategy(ABC):
             self.log("WebSocket disconnected", "warning")
             self.on_disconnect()
 
+        # Open CLOB connections before the first order needs them
+        await self.bot.warm_up()
+
         # Start market manager
         if not await self.market.start():
             self.running = False
@@ -222,8 +288,35 @@ class BaseStrategy(ABC):
         if not await self.market.wait_for_data(timeout=5.0):
             self.log("Timeout waiting for market data", "warning")
 
+        if self.config.presign_orders:
+            await self._start_order_pool()
+
         return True
 
+    async def _start_order_pool(self) -> None:
+        """Pre-sign BUY entries for the current market and follow rollovers."""
+        if not self.bot.signer:
+            self.log("Pre-signing disabled: no signer", "warning")
+            return
+
+        low = round(self.config.presign_min_price * 100)
+        high = round(self.config.presign_max_price * 100)
+        self.order_pool = PreSignedOrderPool(
+            signer=self.bot.signer,
+            maker=self.bot.config.safe_address,
+            prices=[cents / 100 for cents in range(low, high + 1)],
+            notional=self.config.size,
+            limit_offset=self.config.buy_slippage,
+            band=self.config.presign_band or None,
+        )
+        self.order_pool.attach(self.market)
+
+        count = await self.order_pool.prepare_async(self.token_ids.values(), self._token_mids())
+        self.log(
+            f"Pre-signed {count} orders in {self.order_pool.stats.prepare_seconds:.1f}s",
+            "success",
+        )
+
     async def stop(self) -> None:
         """Stop the strategy."""
         self.running = False
@@ -237,7 +330,12 @@ class BaseStrategy(ABC):
                 pass
             self._order_refresh_task = None
 
+        if self._recenter_task is not None:
+            self._recenter_task.cancel()
+            self._recenter_task = None
+
         await self.market.stop()
+        await self.bot.close()
 
     async def run(self) -> None:
         """Main strategy loop."""
@@ -248,18 +346,15 @@ class BaseStrategy(ABC):
 
             self._status_mode = True
 
+            if self.config.tick_mode == TICK_EVENT:
+                await self._run_event_driven()
+                return
+
             while self.running:
                 # Get current prices
                 prices = self._get_current_prices()
 
-                # Call tick handler
-                await self.on_tick(prices)
-
-                # Check position exits
-                await self._check_exits(prices)
-
-                # Refresh orders in background (fire-and-forget)
-                self._maybe_refresh_orders()
+                await self._tick(prices)
 
                 # Update display
                 self.render_status(prices)
@@ -272,6 +367,69 @@ class BaseStrategy(ABC):
             await self.stop()
             self._print_summary()
 
+    async def _tick(self, prices: Dict[str, float]) -> None:
+        """Run one strategy tick."""
+        # Call tick handler
+        await self.on_tick(prices)
+
+        # Check position exits
+        await self._check_exits(prices)
+
+        # Refresh orders and pre-signed entries in background (fire-and-forget)
+        self._maybe_refresh_orders()
+        self._maybe_recenter_presigned()
+
+    async def _wait_for_book_change(self) -> bool:
+        """
+        Wait for the next tick in event mode.
+
+        After the first book change, waits until no further change arrives
+        for tick_debounce seconds, but never longer than max_tick_latency.
+        Without changes, returns after update_interval (heartbeat tick).
+
+        Returns:
+            True if the book changed, False on a heartbeat
+        """
+        try:
+            await asyncio.wait_for(self._book_changed.wait(), timeout=self.config.update_interval)
+        except asyncio.TimeoutError:
+            return False
+
+        deadline = time.monotonic() + self.config.max_tick_latency
+        while True:
+            self._book_changed.clear()
+            remaining = deadline - time.monotonic()
+            if self.config.tick_debounce <= 0 or remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(
+                    self._book_changed.wait(),
+                    timeout=min(self.config.tick_debounce, remaining),
+                )
+            except asyncio.TimeoutError:
+                break
+        return True
+
+    async def _run_event_driven(self) -> None:
+        """Tick on book changes; render on a separate timer."""
+        render_task = asyncio.create_task(self._render_loop())
+        try:
+            while self.running:
+                await self._wait_for_book_change()
+                await self._tick(self._get_current_prices())
+        finally:
+            render_task.cancel()
+            try:
+                await render_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _render_loop(self) -> None:
+        """Redraw status every render_interval."""
+        while self.running:
+            self.render_status(self._get_current_prices())
+            await asyncio.sleep(self.config.render_interval)
+
     def _get_current_prices(self) -> Dict[str, float]:
         """Get current prices from market manager."""
         prices = {}
@@ -283,54 +441,118 @@ class BaseStrategy(ABC):
 
     async def _check_exits(self, prices: Dict[str, float]) -> None:
         """Check and execute exits for all positions."""
-        exits = self.positions.check_all_exits(prices)
+        await self._exit_positions(self.positions, prices)
+
+    async def _exit_positions(
+        self,
+        positions: PositionManager,
+        prices: Dict[str, float],
+        label: str = ""
+    ) -> None:
+        """
+        Sell the positions of one market that hit take profit or stop loss.
+
+        Args:
+            positions: Positions of the market
+            prices: That market's prices by side
+            label: Log prefix naming the market (e.g. "ETH ")
+        """
+        exits = positions.check_all_exits(prices)
 
         for position, exit_type, pnl in exits:
             if exit_type == "take_profit":
                 self.log(
-                    f"TAKE PROFIT: {position.side.upper()} PnL: +${pnl:.2f}",
+                    f"TAKE PROFIT: {label}{position.side.upper()} PnL: +${pnl:.2f}",
                     "success"
                 )
             elif exit_type == "stop_loss":
                 self.log(
-                    f"STOP LOSS: {position.side.upper()} PnL: ${pnl:.2f}",
+                    f"STOP LOSS: {label}{position.side.upper()} PnL: ${pnl:.2f}",
                     "warning"
                 )
 
             # Execute sell
-            await self.execute_sell(position, prices.get(position.side, 0))
+            sell_positions = None if positions is self.positions else positions
+            await self.execute_sell(position, prices.get(position.side, 0), positions=sell_positions)
+
+    def book_is_tradeable(self, side: str) -> bool:
+        """
+        Check that the book behind side's price is live enough to trade on.
+
+        Args:
+            side: "up" or "down"
 
-    async def execute_buy(self, side: str, current_price: float) -> bool:
+        Returns:
+            False if the book is stale after a reconnect (unless
+            allow_stale_books) or older than max_book_age
+        """
+        if self.config.allow_stale_books:
+            ob = self.market.get_orderbook(side)
+            if ob is None:
+                return False
+            return not self.config.max_book_age or ob.age <= self.config.max_book_age
+        return self.market.is_book_fresh(side, self.config.max_book_age or None)
+
+    async def execute_buy(
+        self,
+        side: str,
+        current_price: float,
+        token_id: Optional[str] = None,
+        size: Optional[float] = None,
+        positions: Optional[PositionManager] = None
+    ) -> bool:
         """
         Execute market buy order.
 
         Args:
             side: "up" or "down"
             current_price: Current market price
+            token_id: Token to buy when trading another market than the
+                current one (the caller checks that market's book)
+            size: Shares to buy (default: config.size / current_price)
+            positions: Where to track the position when trading another
+                market (default: self.positions)
 
         Returns:
             True if order placed successfully
         """
-        token_id = self.token_ids.get(side)
+        if positions is None:
+            positions = self.positions
+
+        token_id = token_id or self.token_ids.get(side)
         if not token_id:
             self.log(f"No token ID for {side}", "error")
             return False
 
-        size = self.config.size / current_price
-        buy_price = min(current_price + 0.02, 0.99)
+        if token_id == self.token_ids.get(side) and not self.book_is_tradeable(side):
+            self.log(f"Skipping BUY {side.upper()}: orderbook is stale", "warning")
+            return False
+
+        signed = None
+        if self.order_pool is not None and size is None:
+            signed = self.order_pool.take(token_id, "BUY", current_price)
 
-        self.log(f"BUY {side.upper()} @ {current_price:.4f} size={size:.2f}", "trade")
+        if signed is not None:
+            size = signed["order"]["size"]
+            self.log(f"BUY {side.upper()} @ {current_price:.4f} size={size:.2f} (pre-signed)", "trade")
+            result = await self.bot.submit_signed_order(signed)
+        else:
+            if size is None:
+                size = self.config.size / current_price
+            buy_price = min(current_price + self.config.buy_slippage, 0.99)
 
-        result = await self.bot.place_order(
-            token_id=token_id,
-            price=buy_price,
-            size=size,
-            side="BUY"
-        )
+            self.log(f"BUY {side.upper()} @ {current_price:.4f} size={size:.2f}", "trade")
+
+            result = await self.bot.place_order(
+                token_id=token_id,
+                price=buy_price,
+                size=size,
+                side="BUY"
+            )
 
         if result.success:
             self.log(f"Order placed: {result.order_id}", "success")
-            self.positions.open_position(
+            positions.open_position(
                 side=side,
                 token_id=token_id,
                 entry_price=current_price,
@@ -342,17 +564,33 @@ class BaseStrategy(ABC):
             self.log(f"Order failed: {result.message}", "error")
             return False
 
-    async def execute_sell(self, position: Position, current_price: float) -> bool:
+    async def execute_sell(
+        self,
+        position: Position,
+        current_price: float,
+        positions: Optional[PositionManager] = None
+    ) -> bool:
         """
         Execute sell order to close position.
 
+        Unlike buys, exits go through on a stale book: closing risk
+        matters more than the price being slightly off.
+
         Args:
             position: Position to close
             current_price: Current price
+            positions: Manager holding the position when it is in another
+                market (default: self.positions)
 
         Returns:
             True if order placed
         """
+        if positions is None:
+            positions = self.positions
+            if not self.book_is_tradeable(position.side) and position.id not in self._stale_exit_warned:
+                self._stale_exit_warned.add(position.id)
+                self.log(f"SELL {position.side.upper()} on a stale orderbook", "warning")
+
         sell_price = max(current_price - 0.02, 0.01)
         pnl = position.get_pnl(current_price)
 
@@ -365,7 +603,8 @@ class BaseStrategy(ABC):
 
         if result.success:
             self.log(f"Sell order: {result.order_id} PnL: ${pnl:+.2f}", "success")
-            self.positions.close_position(position.id, realized_pnl=pnl)
+            positions.close_position(position.id, realized_pnl=pnl)
+            self._stale_exit_warned.discard(position.id)
             return True
         else:
             self.log(f"Sell failed: {result.message}", "error")
@@ -388,7 +627,9 @@ class BaseStrategy(ABC):
         """
         Handle orderbook update.
 
-        Called when new orderbook data is received.
+        Called when new orderbook data is received. With
+        config.coalesce_books, superseded snapshots are skipped and
+        current_event().coalesced holds how many.
 
         Args:
             snapshot: OrderbookSnapshot from WebSocket
@@ -15,14 +15,20 @@ Usage:
     python scripts/run_fair_value.py
 """
 
+import asyncio
 import time
 import requests
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from datetime import datetime, timezone
 
+from lib.console import log
+from lib.multi_market_manager import CoinMarketView, MultiMarketManager
+from lib.position_manager import PositionManager
 from strategies.base import BaseStrategy, StrategyConfig
 from src.bot import TradingBot
+from src.http import get_async_transport
+from src.price_feed import BINANCE_SYMBOLS, BinanceKlineFeed, ReferencePriceFeed
 from src.websocket_client import OrderbookSnapshot
 
 
@@ -43,6 +49,7 @@ class FairValueConfig(StrategyConfig):
     signal_threshold: float = 0.02   # Min price change % for signal (ULTRA: 0.02%)
     min_edge: float = 0.005          # Min edge vs polymarket (ULTRA: 0.5%)
     binance_lookback: int = 5        # Candle count (1-min candles)
+    price_stream: bool = True        # Binance kline WebSocket (False = REST per tick)
     
     # === RISK MANAGEMENT ===
     max_daily_loss: float = 2.00     # Stop trading hari ini jika loss >= $2
@@ -57,6 +64,7 @@ class FairValueConfig(StrategyConfig):
     
     # === TIMING ===
     check_interval: float = 30.0     # Cek signal setiap 30 detik
+    coin_deadline: float = 2.0       # Max seconds to fetch one coin's signal + prices
     window_seconds: int = 900        # 15 menit = 900 detik
 
 
@@ -64,51 +72,99 @@ class FairValueConfig(StrategyConfig):
 # BINANCE PRICE FEED
 # ============================================================
 
-BINANCE_SYMBOLS = {
-    "BTC": "BTCUSDT",
-    "ETH": "ETHUSDT",
-    "SOL": "SOLUSDT",
-    "XRP": "XRPUSDT",
-}
+BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
 
+# Reused across REST fallbacks (keep-alive)
+_binance_session = requests.Session()
 
-def get_binance_change(coin: str, lookback: int = 5) -> Optional[float]:
+
+def _klines_change(candles: list) -> Optional[float]:
+    """Percent change from the first to the last close of REST klines."""
+    if len(candles) < 2:
+        return None
+    
+    first_close = float(candles[0][4])
+    last_close = float(candles[-1][4])
+    
+    if first_close == 0:
+        return None
+    
+    change_pct = ((last_close - first_close) / first_close) * 100
+    return round(change_pct, 4)
+
+
+def get_binance_change(
+    coin: str,
+    lookback: int = 5,
+    feed: Optional[ReferencePriceFeed] = None,
+    log: Callable[[str, str], Any] = log
+) -> Optional[float]:
     """
     Get price change % for a coin over the last N minutes from Binance.
     
     Args:
         coin: Coin symbol (BTC, ETH, SOL, XRP)
         lookback: Number of 1-min candles to look back
+        feed: Streaming candles; read from memory when fresh, otherwise
+            fall back to the REST klines endpoint
+        log: Where REST errors are reported, as log(msg, level)
     
     Returns:
         Percentage change (e.g., 0.15 = +0.15%), or None on error
     """
+    if feed is not None:
+        change = feed.get_change(coin, lookback)
+        if change is not None:
+            return change
+
     symbol = BINANCE_SYMBOLS.get(coin)
     if not symbol:
         return None
     
-    url = "https://api.binance.com/api/v3/klines"
     params = {"symbol": symbol, "interval": "1m", "limit": lookback}
     
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = _binance_session.get(BINANCE_KLINES_URL, params=params, timeout=10)
         resp.raise_for_status()
-        candles = resp.json()
-        
-        if len(candles) < 2:
-            return None
-        
-        first_close = float(candles[0][4])
-        last_close = float(candles[-1][4])
-        
-        if first_close == 0:
-            return None
-        
-        change_pct = ((last_close - first_close) / first_close) * 100
-        return round(change_pct, 4)
+        return _klines_change(resp.json())
+    
+    except Exception as e:
+        log(f"[BINANCE ERROR] {coin}: {e}", "error")
+        return None
+
+
+async def get_binance_change_async(
+    coin: str,
+    lookback: int = 5,
+    feed: Optional[ReferencePriceFeed] = None,
+    log: Callable[[str, str], Any] = log
+) -> Optional[float]:
+    """
+    Async version of get_binance_change.
+    
+    The REST fallback goes through the shared async HTTP transport, so
+    several coins can be fetched at once without blocking the event loop.
+    """
+    if feed is not None:
+        change = feed.get_change(coin, lookback)
+        if change is not None:
+            return change
+
+    symbol = BINANCE_SYMBOLS.get(coin)
+    if not symbol:
+        return None
+    
+    params = {"symbol": symbol, "interval": "1m", "limit": lookback}
+    
+    try:
+        resp = await get_async_transport().request(
+            "GET", BINANCE_KLINES_URL, params=params, timeout=10
+        )
+        resp.raise_for_status()
+        return _klines_change(resp.json())
     
     except Exception as e:
-        print(f"[BINANCE ERROR] {coin}: {e}")
+        log(f"[BINANCE ERROR] {coin}: {e}", "error")
         return None
 
 
@@ -164,6 +220,17 @@ def calculate_fair_value_up(change_pct: float) -> Optional[float]:
 # STRATEGY CLASS
 # ============================================================
 
+@dataclass
+class EdgeSignal:
+    """A coin whose fair value clears min_edge on one side."""
+    coin: str
+    side: str          # "up" or "down"
+    price: float       # Polymarket entry price
+    edge: float        # Fair value minus entry price
+    fair_up: float
+    change: float      # Binance change %
+
+
 class FairValueStrategy(BaseStrategy):
     """
     Fair Value Trading Strategy — Ultra Aggressive
@@ -179,6 +246,26 @@ class FairValueStrategy(BaseStrategy):
         
         self.fv_config = config
         self.balance = 10.00  # Starting balance (update from actual)
+
+        # Positions in the other coins' markets (the primary coin uses
+        # self.positions); exits use each coin's own prices
+        self.coin_positions: Dict[str, PositionManager] = {
+            coin: PositionManager(
+                take_profit=config.take_profit,
+                stop_loss=config.stop_loss,
+                max_positions=config.max_positions,
+            )
+            for coin in config.coins if coin != config.coin
+        }
+
+        # Rolling 1-minute candles per coin from the Binance kline stream
+        self.price_feed: Optional[ReferencePriceFeed] = None
+        if config.price_stream:
+            self.price_feed = BinanceKlineFeed(
+                config.coins,
+                history=max(60, config.binance_lookback),
+                json_backend=config.json_backend,
+            )
         
         # Tracking
         self.total_trades = 0
@@ -195,6 +282,47 @@ class FairValueStrategy(BaseStrategy):
         self.consecutive_errors = 0
         self.max_consecutive_errors = 3
     
+    def _create_market(self) -> CoinMarketView:
+        """
+        Live books for every scanned coin on one WebSocket.
+
+        The primary coin is a view of the shared manager, so BaseStrategy
+        does not open a second connection for it.
+        """
+        config = self.config
+        self.coin_markets = MultiMarketManager(
+            coins=config.coins or [config.coin],
+            market_check_interval=config.market_check_interval,
+            prefetch_seconds=config.market_prefetch_seconds,
+            json_backend=config.json_backend,
+            event_queue_size=config.event_queue_size,
+            overflow_policy=config.overflow_policy,
+        )
+        return self.coin_markets.view(config.coin)
+
+    async def start(self) -> bool:
+        """Start the price feed, then the base strategy (and every coin's market)."""
+        if self.price_feed is not None and not await self.price_feed.start():
+            self.log("[WARN] Binance candles not seeded, REST fallback until the stream fills", "warning")
+        return await super().start()
+
+    async def stop(self) -> None:
+        """Stop the base strategy (and every coin's market), then the price feed."""
+        await super().stop()
+        if self.price_feed is not None:
+            await self.price_feed.stop()
+
+    def _positions_for(self, coin: str) -> PositionManager:
+        """Position manager for coin's market."""
+        return self.coin_positions.get(coin, self.positions)
+
+    async def _check_exits(self, prices: Dict[str, float]) -> None:
+        """Check exits in the primary market, then in every other coin's market."""
+        await super()._check_exits(prices)
+        for coin, positions in self.coin_positions.items():
+            if positions.position_count:
+                await self._exit_positions(positions, self.coin_markets.get_prices(coin), label=f"{coin} ")
+
     # ========================================
     # RISK CHECKS
     # ========================================
@@ -234,39 +362,88 @@ class FairValueStrategy(BaseStrategy):
     # MAIN TICK LOGIC
     # ========================================
     
-    def on_tick(self, prices: Dict[str, float]):
+    async def on_tick(self, prices: Dict[str, float]):
         """
         Called every tick — main strategy logic.
-        Scans all coins for fair value edge.
+
+        Scans all coins concurrently, each within coin_deadline, then buys
+        the largest edges while the window has trades left
+        (max_trades_per_window, reset in on_market_change).
         """
         # Risk check
         can_trade, reason = self.check_risk()
         if not can_trade:
             self.log(f"[RISK] {reason}", "warning")
             if "STOP" in reason:
-                self.stop()
+                self.running = False  # run() stops the strategy on exit
             return
         
-        # Reset trades per window counter
-        self.trades_this_window = 0
+        # Scan all coins at once; a slow coin only costs its own deadline
+        results = await asyncio.gather(
+            *(self._scan_coin(coin) for coin in self.fv_config.coins)
+        )
+        signals = sorted(
+            self._trackable(signal for signal in results if signal is not None),
+            key=lambda signal: signal.edge,
+            reverse=True,
+        )
         
-        # Scan all coins
-        for coin in self.fv_config.coins:
-            if self.trades_this_window >= self.fv_config.max_trades_per_window:
-                break
-            
-            self._evaluate_coin(coin, prices)
+        # Best edges first
+        slots = max(self.fv_config.max_trades_per_window - self.trades_this_window, 0)
+        for signal in signals[slots:]:
+            self.skips += 1
+            self.log(f"[SKIP] {signal.coin} | Edge {signal.edge:+.1%} | Trade limit reached", "info")
+        
+        await asyncio.gather(*(self._execute_signal(signal) for signal in signals[:slots]))
+    
+    def _trackable(self, signals: Iterable[EdgeSignal]) -> List[EdgeSignal]:
+        """Signals whose coin can open a position on that side (one per coin)."""
+        trackable = []
+        for signal in signals:
+            positions = self._positions_for(signal.coin)
+            if positions.can_open_position and not positions.has_position(signal.side):
+                trackable.append(signal)
+            else:
+                self.skips += 1
+                self.log(f"[SKIP] {signal.coin} | Position limit reached", "info")
+        return trackable
+    
+    async def _scan_coin(self, coin: str) -> Optional[EdgeSignal]:
+        """_evaluate_coin bounded by coin_deadline."""
+        try:
+            return await asyncio.wait_for(
+                self._evaluate_coin(coin),
+                timeout=self.fv_config.coin_deadline,
+            )
+        except asyncio.TimeoutError:
+            self.consecutive_errors += 1
+            self.log(f"[ERROR] {coin} | No data within {self.fv_config.coin_deadline:g}s", "error")
+            return None
     
-    def _evaluate_coin(self, coin: str, market_prices: Dict[str, float]):
-        """Evaluate a single coin for fair value edge."""
+    async def _evaluate_coin(self, coin: str) -> Optional[EdgeSignal]:
+        """
+        Evaluate a single coin for fair value edge.
+
+        Coins without fresh books on both sides are skipped before the
+        Binance change is fetched.
+
+        Returns:
+            EdgeSignal for the side that clears min_edge, or None
+        """
         
-        # 1. Get Binance price change
-        change = get_binance_change(coin, self.fv_config.binance_lookback)
+        # 1. Get Polymarket prices and Binance price change
+        poly = self._market_prices(coin)
+        if poly is None:
+            return None
+        
+        change = await get_binance_change_async(
+            coin, self.fv_config.binance_lookback, feed=self.price_feed, log=self.log
+        )
         
         if change is None:
             self.consecutive_errors += 1
             self.log(f"[ERROR] Binance data unavailable for {coin}", "error")
-            return
+            return None
         
         self.consecutive_errors = 0  # Reset on success
         
@@ -276,100 +453,109 @@ class FairValueStrategy(BaseStrategy):
         if fair_up is None:
             self.skips += 1
             self.log(f"[SKIP] {coin} | {change:+.4f}% | Dead zone (sideways)", "info")
-            return
+            return None
         
         fair_down = 1.0 - fair_up
         
-        # 3. Get Polymarket prices
-        # Use market_prices from BaseStrategy if available for current coin
-        # Otherwise try to get from GammaClient
-        poly_up = market_prices.get("up", 0.50)
-        poly_down = market_prices.get("down", 0.50)
-        
-        # If we're evaluating a different coin than current market,
-        # we need to get its prices separately
-        if coin != self.config.coin:
-            try:
-                from src.gamma_client import GammaClient
-                gamma = GammaClient()
-                info = gamma.get_market_info(coin)
-                if info is None:
-                    self.log(f"[SKIP] {coin} | No active market", "info")
-                    return
-                poly_up = info['prices']['up']
-                poly_down = info['prices']['down']
-            except Exception as e:
-                self.log(f"[ERROR] {coin} market info: {e}", "error")
-                return
-        
-        # 4. Check spread
+        poly_up = poly["up"]
+        poly_down = poly["down"]
+        
+        # 3. Check spread
         spread = abs(1.0 - poly_up - poly_down)
         if spread > self.fv_config.max_spread:
             self.log(f"[SKIP] {coin} | Spread {spread:.2f} > {self.fv_config.max_spread}", "info")
-            return
+            return None
         
-        # 5. Find edge
+        # 4. Find edge
         edge_up = fair_up - poly_up
         edge_down = fair_down - poly_down
         
-        side = None
-        entry_price = None
-        edge = 0
-        
         if edge_up >= self.fv_config.min_edge:
-            side = "up"
-            entry_price = poly_up
-            edge = edge_up
-        elif edge_down >= self.fv_config.min_edge:
-            side = "down"
-            entry_price = poly_down
-            edge = edge_down
-        
-        if side is None:
-            self.skips += 1
-            self.log(
-                f"[SKIP] {coin} | FairUP:{fair_up:.0%} vs Poly:{poly_up:.0%} | "
-                f"EdgeUP:{edge_up:+.1%} EdgeDN:{edge_down:+.1%} | "
-                f"Binance:{change:+.4f}%",
-                "info"
-            )
-            return
+            return EdgeSignal(coin, "up", poly_up, edge_up, fair_up, change)
+        if edge_down >= self.fv_config.min_edge:
+            return EdgeSignal(coin, "down", poly_down, edge_down, fair_up, change)
         
-        # 6. Calculate position size
+        self.skips += 1
+        self.log(
+            f"[SKIP] {coin} | FairUP:{fair_up:.0%} vs Poly:{poly_up:.0%} | "
+            f"EdgeUP:{edge_up:+.1%} EdgeDN:{edge_down:+.1%} | "
+            f"Binance:{change:+.4f}%",
+            "info"
+        )
+        return None
+    
+    def _market_prices(self, coin: str) -> Optional[Dict[str, float]]:
+        """
+        Polymarket Up/Down mid prices for coin from its live books.
+
+        Never falls back to REST or cached Gamma prices: a coin whose book
+        is missing, stale after a reconnect or older than max_book_age is
+        not traded.
+
+        Returns:
+            {"up": price, "down": price}, or None if either book is not fresh
+        """
+        for side in ("up", "down"):
+            if not self.coin_markets.is_book_fresh(coin, side, self.config.max_book_age or None):
+                self.log(f"[SKIP] {coin} | No fresh {side.upper()} orderbook", "info")
+                return None
+        return self.coin_markets.get_prices(coin)
+    
+    async def _execute_signal(self, signal: EdgeSignal) -> bool:
+        """
+        Buy the signal's side in its coin's market and record the trade.
+
+        Returns:
+            True if the order was placed
+        """
+        token_id = self.coin_markets.token_ids(signal.coin).get(signal.side)
+        if not token_id:
+            self.log(f"[SKIP] {signal.coin} | No token ID for {signal.side}", "warning")
+            return False
+        
+        # Calculate position size
         size_usd = self.fv_config.size_usd
         
         if self.fv_config.use_percent_sizing:
             size_usd = self.balance * (self.fv_config.percent_size / 100)
         
-        shares = size_usd / entry_price
+        shares = size_usd / signal.price
+        
+        bought = await self.execute_buy(
+            signal.side,
+            signal.price,
+            token_id=token_id,
+            size=shares,
+            positions=self._positions_for(signal.coin),
+        )
+        if not bought:
+            return False
         
-        # 7. Execute trade
         self.total_trades += 1
         self.trades_this_window += 1
         
         self.log(
-            f"[TRADE #{self.total_trades}] {coin} | BUY {side.upper()} | "
-            f"Price: {entry_price:.0%} | Shares: {shares:.2f} | "
-            f"Cost: ${size_usd:.2f} | Edge: {edge:+.1%} | "
-            f"Fair: {fair_up:.0%} | Binance: {change:+.4f}%",
+            f"[TRADE #{self.total_trades}] {signal.coin} | BUY {signal.side.upper()} | "
+            f"Price: {signal.price:.0%} | Shares: {shares:.2f} | "
+            f"Cost: ${size_usd:.2f} | Edge: {signal.edge:+.1%} | "
+            f"Fair: {signal.fair_up:.0%} | Binance: {signal.change:+.4f}%",
             "trade"
         )
         
-        self.execute_buy(side, entry_price)
-        
         # Record trade
         self.daily_trades.append({
             "num": self.total_trades,
-            "coin": coin,
-            "side": side,
-            "price": entry_price,
+            "coin": signal.coin,
+            "side": signal.side,
+            "price": signal.price,
             "shares": shares,
             "cost": size_usd,
-            "edge": edge,
-            "change": change,
-            "fair_up": fair_up,
+            "edge": signal.edge,
+            "change": signal.change,
+            "fair_up": signal.fair_up,
             "time": datetime.now(timezone.utc).isoformat(),
         })
+        return True
     
     # ========================================
     # RESULT TRACKING
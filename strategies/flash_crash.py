@@ -98,10 +98,10 @@ class FlashCrashStrategy(BaseStrategy):
         lines.append("-" * 80)
 
         # Get 5 levels
-        up_bids = up_ob.bids[:5] if up_ob else []
-        up_asks = up_ob.asks[:5] if up_ob else []
-        down_bids = down_ob.bids[:5] if down_ob else []
-        down_asks = down_ob.asks[:5] if down_ob else []
+        up_bids = up_ob.top_bids(5) if up_ob else []
+        up_asks = up_ob.top_asks(5) if up_ob else []
+        down_bids = down_ob.top_bids(5) if down_ob else []
+        down_asks = down_ob.top_asks(5) if down_ob else []
 
         for i in range(5):
             up_bid = f"{up_bids[i].price:>9.4f} {up_bids[i].size:>9.1f}" if i < len(up_bids) else f"{'--':>9} {'--':>9}"
@@ -0,0 +1,249 @@
+"""
+Unit tests for the async HTTP transport and async client methods.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.client import ApiError, ClobClient
+from src.gamma_client import GammaClient
+from src.http import AsyncHttpTransport, TransportError, resolve_http_backend
+from src.retry import RetryBudget
+
+httpx = pytest.importorskip("httpx")
+
+
+def _mock_transport(handler, **kwargs) -> AsyncHttpTransport:
+    transport = AsyncHttpTransport(backend="httpx", **kwargs)
+    transport._new_pool = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return transport
+
+
+def test_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown HTTP backend"):
+        resolve_http_backend("curl")
+
+
+def test_auto_warns_when_falling_back_to_threads(monkeypatch, caplog):
+    monkeypatch.setattr("src.http.available_http_backends", lambda: ["thread"])
+
+    assert resolve_http_backend("auto") == "thread"
+    assert "falling back to worker threads" in caplog.text
+
+
+def test_auto_prefers_httpx():
+    assert resolve_http_backend("auto") == "httpx"
+
+
+@pytest.mark.asyncio
+async def test_post_order_async_sends_signed_compact_body():
+    seen = {}
+
+    def handler(request):
+        seen["method"] = request.method
+        seen["path"] = request.url.path
+        seen["body"] = request.content
+        return httpx.Response(200, json={"success": True, "orderID": "o1"})
+
+    transport = _mock_transport(handler)
+    client = ClobClient(host="https://clob.example.com", funder="0xf", async_transport=transport)
+
+    result = await client.post_order_async({"order": {"salt": 1}, "signature": "0xsig"}, "FOK")
+    await transport.aclose()
+
+    assert result == {"success": True, "orderID": "o1"}
+    assert seen["method"] == "POST"
+    assert seen["path"] == "/order"
+    assert json.loads(seen["body"]) == {
+        "order": {"salt": 1}, "owner": "0xf", "orderType": "FOK", "signature": "0xsig",
+    }
+    assert b" " not in seen["body"]
+
+
+@pytest.mark.asyncio
+async def test_request_async_retries_then_raises(monkeypatch):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503)
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    transport = _mock_transport(handler)
+    client = ClobClient(host="https://clob.example.com", async_transport=transport)
+
+    with pytest.raises(ApiError, match="after 3 attempts"):
+        await client.get_order_book_async("123")
+    await transport.aclose()
+
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_shared_per_host():
+    transport = _mock_transport(lambda request: httpx.Response(200))
+
+    a = transport._pool_for("https://clob.example.com/book")
+    b = transport._pool_for("https://clob.example.com/order")
+    c = transport._pool_for("https://gamma.example.com/markets")
+    await transport.aclose()
+
+    assert a is b
+    assert a is not c
+
+
+@pytest.mark.asyncio
+async def test_connection_error_becomes_transport_error():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    transport = _mock_transport(handler)
+
+    with pytest.raises(TransportError, match="refused"):
+        await transport.request("GET", "https://clob.example.com/book")
+    await transport.aclose()
+
+
+@pytest.mark.asyncio
+async def test_gamma_current_market_async_prefers_current_window():
+    def handler(request):
+        slug = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"slug": slug, "acceptingOrders": True})
+
+    transport = _mock_transport(handler)
+    client = GammaClient(host="https://gamma.example.com", async_transport=transport)
+
+    market = await client.get_current_15m_market_async("ETH")
+    await transport.aclose()
+
+    assert market["slug"] == client._window_slugs("ETH")[0]
+
+
+@pytest.mark.asyncio
+async def test_prewarm_opens_requested_connections():
+    seen = []
+
+    def handler(request):
+        seen.append(request.method)
+        return httpx.Response(404)
+
+    transport = _mock_transport(handler)
+
+    opened = await transport.prewarm("https://clob.example.com/", connections=3)
+    stats = transport.host_stats()["https://clob.example.com"]
+    await transport.aclose()
+
+    assert opened == 3
+    assert seen == ["HEAD"] * 3
+    assert stats["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_keepalive_pings_only_when_idle():
+    pings = []
+    transport = _mock_transport(lambda request: pings.append(request) or httpx.Response(200))
+
+    await transport.request("GET", "https://clob.example.com/book")
+    task = asyncio.create_task(transport.keepalive("https://clob.example.com/", interval=0.05))
+    await asyncio.sleep(0.02)
+    assert len(pings) == 1  # Recently used, no ping yet
+
+    await asyncio.sleep(0.08)
+    task.cancel()
+    await transport.aclose()
+
+    assert len(pings) >= 2
+
+
+@pytest.mark.asyncio
+async def test_keepalive_backs_off_when_host_unreachable():
+    pings = []
+
+    def handler(request):
+        pings.append(request)
+        raise httpx.ConnectError("unreachable", request=request)
+
+    transport = _mock_transport(handler)
+    task = asyncio.create_task(transport.keepalive("https://clob.example.com/", interval=0.02))
+    await asyncio.sleep(0.15)
+    task.cancel()
+    await transport.aclose()
+
+    # Pings after 0, 0.04 and 0.12s instead of a tight loop
+    assert 2 <= len(pings) <= 4
+
+
+@pytest.mark.asyncio
+async def test_post_order_not_retried_on_server_error():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(502)
+
+    transport = _mock_transport(handler)
+    client = ClobClient(host="https://clob.example.com", async_transport=transport)
+
+    with pytest.raises(ApiError, match="after 1 attempts"):
+        await client.post_order_async({"order": {}, "signature": "0xsig"}, "GTC")
+    await transport.aclose()
+
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_post_waits_retry_after(monkeypatch):
+    responses = [httpx.Response(429, headers={"Retry-After": "0.5"}), httpx.Response(200, json={"success": True})]
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    transport = _mock_transport(lambda request: responses.pop(0))
+    client = ClobClient(
+        host="https://clob.example.com",
+        async_transport=transport,
+        retry_budget=RetryBudget(),
+    )
+
+    assert await client.post_order_async({"order": {}, "signature": "0xsig"}, "GTC") == {"success": True}
+    await transport.aclose()
+
+    assert slept == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_are_classified_and_retried(monkeypatch):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    transport = _mock_transport(handler)
+    client = ClobClient(
+        host="https://clob.example.com",
+        async_transport=transport,
+        retry_budget=RetryBudget(),
+    )
+
+    with pytest.raises(ApiError, match="after 3 attempts") as excinfo:
+        await client.post_order_async({"order": {}, "signature": "0xsig"}, "GTC")
+    await transport.aclose()
+
+    assert len(attempts) == 3
+    assert excinfo.value.__cause__.kind == "connect"
@@ -0,0 +1,135 @@
+"""
+Unit tests for BaseStrategy tick scheduling and trade guards.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.market_manager import MarketInfo
+from src.bot import OrderResult
+from strategies.base import BaseStrategy, StrategyConfig
+
+
+class _Strategy(BaseStrategy):
+    async def on_book_update(self, snapshot):
+        pass
+
+    async def on_tick(self, prices):
+        pass
+
+    def render_status(self, prices):
+        pass
+
+
+def _strategy(**kwargs) -> _Strategy:
+    return _Strategy(bot=None, config=StrategyConfig(tick_mode="event", **kwargs))
+
+
+def test_rejects_unknown_tick_mode():
+    with pytest.raises(ValueError, match="Unknown tick mode"):
+        _Strategy(bot=None, config=StrategyConfig(tick_mode="sometimes"))
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_without_book_changes():
+    strategy = _strategy(update_interval=0.01)
+
+    assert await strategy._wait_for_book_change() is False
+
+
+@pytest.mark.asyncio
+async def test_debounce_collapses_burst_into_one_tick():
+    strategy = _strategy(update_interval=1.0, tick_debounce=0.02, max_tick_latency=1.0)
+
+    async def burst():
+        for _ in range(3):
+            strategy._book_changed.set()
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(burst())
+    assert await strategy._wait_for_book_change() is True
+    await task
+
+    # The whole burst was absorbed by the debounce window
+    assert not strategy._book_changed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_max_latency_bounds_debounce():
+    strategy = _strategy(update_interval=1.0, tick_debounce=0.05, max_tick_latency=0.03)
+
+    async def flood():
+        while True:
+            strategy._book_changed.set()
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(flood())
+    start = time.monotonic()
+    try:
+        assert await strategy._wait_for_book_change() is True
+        elapsed = time.monotonic() - start
+    finally:
+        task.cancel()
+
+    assert elapsed < 0.5
+
+
+class _Book:
+    def __init__(self, stale=False, age=0.0):
+        self.stale = stale
+        self.age = age
+
+
+@pytest.mark.asyncio
+async def test_execute_buy_refuses_stale_books():
+    strategy = _strategy()
+    strategy.market.current_market = MarketInfo(
+        slug="btc-updown-15m-1000", question="", end_date="",
+        token_ids={"up": "1", "down": "2"}, prices={}, accepting_orders=True,
+    )
+    book = _Book(stale=True)
+    strategy.market.get_orderbook = lambda side: book
+
+    assert strategy.book_is_tradeable("up") is False
+    assert await strategy.execute_buy("up", 0.5) is False
+
+    book.stale = False
+    assert strategy.book_is_tradeable("up") is True
+
+
+def test_max_book_age_and_allow_stale_books():
+    strategy = _strategy(max_book_age=5.0, allow_stale_books=True)
+    strategy.market.get_orderbook = lambda side: _Book(stale=True, age=1.0)
+    assert strategy.book_is_tradeable("up") is True
+
+    strategy.market.get_orderbook = lambda side: _Book(stale=True, age=6.0)
+    assert strategy.book_is_tradeable("up") is False
+
+
+@pytest.mark.asyncio
+async def test_execute_sell_exits_on_stale_book_and_warns_once():
+    strategy = _strategy()
+    strategy.market.get_orderbook = lambda side: _Book(stale=True)
+    position = strategy.positions.open_position(side="up", token_id="1", entry_price=0.5, size=10)
+    sells = []
+
+    class _Bot:
+        async def place_order(self, **kwargs):
+            sells.append(kwargs)
+            return OrderResult(success=len(sells) > 1, order_id="o1", message="rejected")
+
+    strategy.bot = _Bot()
+    warnings = []
+    strategy.log = lambda msg, level="info": warnings.append(msg) if level == "warning" else None
+
+    assert await strategy.execute_sell(position, 0.6) is False
+    assert await strategy.execute_sell(position, 0.6) is True
+
+    assert [order["side"] for order in sells] == ["SELL", "SELL"]
+    assert warnings == ["SELL UP on a stale orderbook"]
@@ -7,6 +7,8 @@ Run with:
     pytest tests/test_bot.py -v
 """
 
+import asyncio
+import threading
 import pytest
 import sys
 from pathlib import Path
@@ -16,7 +18,9 @@ from unittest.mock import Mock, AsyncMock, patch
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.bot import TradingBot, OrderResult, NotInitializedError
+from src.client import ApiError, ClobClient
 from src.config import Config, BuilderConfig, ClobConfig
+from src.signer import OrderSigner
 
 
 class TestOrderResult:
@@ -257,3 +261,139 @@ safe_address: "0x1234567890123456789012345678901234567890"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestPlaceOrders:
+    """Tests for concurrent batch order placement."""
+
+    TEST_PRIVATE_KEY = "0x" + "a" * 64
+    TEST_SAFE_ADDRESS = "0x" + "b" * 40
+
+    def _bot(self, clob_client):
+        bot = TradingBot(config=Config(safe_address=self.TEST_SAFE_ADDRESS))
+        bot.signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        bot.clob_client = clob_client
+        return bot
+
+    def _orders(self, count):
+        return [
+            {"token_id": "123", "price": 0.40 + i * 0.01, "size": 5.0, "side": "BUY"}
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_chunks_and_keeps_input_order(self):
+        batches = []
+
+        class FakeClob:
+            async def post_orders_async(self, signed_orders, order_type):
+                batches.append(len(signed_orders))
+                offset = sum(batches[:-1])
+                return [
+                    {"success": True, "orderId": f"o{offset + i}"}
+                    for i in range(len(signed_orders))
+                ]
+
+        bot = self._bot(FakeClob())
+
+        results = await bot.place_orders(self._orders(20))
+
+        assert batches == [ClobClient.MAX_BATCH_ORDERS, 5]
+        assert [r.order_id for r in results] == [f"o{i}" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_single_mode_runs_concurrently_in_input_order(self):
+        in_flight = []
+        peak = []
+
+        class FakeClob:
+            async def post_order_async(self, signed_order, order_type):
+                in_flight.append(signed_order)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(signed_order)
+                return {"success": True, "orderId": str(signed_order["order"]["price"])}
+
+        bot = self._bot(FakeClob())
+
+        results = await bot.place_orders(self._orders(5), use_batch_endpoint=False)
+
+        assert max(peak) == 5
+        assert [float(r.order_id) for r in results] == [o["price"] for o in self._orders(5)]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_marks_every_order(self):
+        class FakeClob:
+            async def post_orders_async(self, signed_orders, order_type):
+                raise ApiError("boom")
+
+        bot = self._bot(FakeClob())
+
+        results = await bot.place_orders(self._orders(3))
+
+        assert [r.success for r in results] == [False] * 3
+        assert all("boom" in r.message for r in results)
+
+    @pytest.mark.asyncio
+    async def test_signs_off_the_event_loop_without_signing_pool(self):
+        loop_thread = threading.get_ident()
+        signing_threads = set()
+
+        class FakeClob:
+            async def post_orders_async(self, signed_orders, order_type):
+                return [{"success": True, "orderId": "o"} for _ in signed_orders]
+
+        bot = self._bot(FakeClob())
+        sign_order = bot.signer.sign_order
+
+        def recording_sign_order(order):
+            signing_threads.add(threading.get_ident())
+            return sign_order(order)
+
+        bot.signer.sign_order = recording_sign_order
+
+        results = await bot.place_orders(self._orders(3))
+
+        assert all(r.success for r in results)
+        assert signing_threads and loop_thread not in signing_threads
+
+    @pytest.mark.asyncio
+    async def test_submit_signed_order_skips_signing(self):
+        posted = []
+
+        class FakeClob:
+            async def post_order_async(self, signed_order, order_type):
+                posted.append((signed_order, order_type))
+                return {"success": True, "orderId": "o1"}
+
+        bot = self._bot(FakeClob())
+        signed = bot._sign_order(bot.signer, "123", 0.40, 5.0, "BUY")
+        bot.signer = None
+
+        result = await bot.submit_signed_order(signed, "FOK")
+
+        assert result.order_id == "o1"
+        assert posted == [(signed, "FOK")]
+
+    @pytest.mark.asyncio
+    async def test_place_orders_signs_through_signing_pool(self):
+        class FakeClob:
+            async def post_orders_async(self, signed_orders, order_type):
+                return [
+                    {"success": True, "orderId": f"{s['signer']}@{s['order']['price']}"}
+                    for s in signed_orders
+                ]
+
+        bot = self._bot(FakeClob())
+        assert await bot.start_signing_pool(max_workers=2) == 2
+
+        try:
+            orders = self._orders(4) + [{"token_id": "123", "price": 2.0, "size": 5.0, "side": "BUY"}]
+            results = await bot.place_orders(orders)
+        finally:
+            await bot.close()
+
+        expected = [f"{bot.signer.address}@{order['price']}" for order in orders[:4]]
+        assert [r.order_id for r in results[:4]] == expected
+        assert results[4].success is False
+        assert bot.signing_executor is None
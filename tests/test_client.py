@@ -3,23 +3,28 @@ Unit tests for client and bot async behavior.
 """
 
 import asyncio
+import base64
+import hashlib
+import hmac
 import sys
 from pathlib import Path
 
 import pytest
+import requests
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.client import ClobClient
+from src.client import ApiCredentials, ApiError, AuthenticationError, ClobClient, RelayerClient
 from src.bot import TradingBot
-from src.config import Config
+from src.config import BuilderConfig, Config
+from src.retry import RetryBudget
 
 
 def test_get_trades_passes_limit_and_token(monkeypatch):
     client = ClobClient(host="https://example.com")
     captured = {}
 
-    def fake_request(method, endpoint, data=None, headers=None, params=None):
+    def fake_request(method, endpoint, data=None, headers=None, params=None, **limits):
         captured["method"] = method
         captured["endpoint"] = endpoint
         captured["params"] = params
@@ -38,7 +43,7 @@ def test_get_trades_passes_limit_only(monkeypatch):
     client = ClobClient(host="https://example.com")
     captured = {}
 
-    def fake_request(method, endpoint, data=None, headers=None, params=None):
+    def fake_request(method, endpoint, data=None, headers=None, params=None, **limits):
         captured["params"] = params
         return []
 
@@ -50,29 +55,200 @@ def test_get_trades_passes_limit_only(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_bot_get_market_price_runs_in_thread(monkeypatch):
+async def test_bot_get_market_price_uses_async_client(monkeypatch):
     config = Config(safe_address="0x" + "b" * 40)
     bot = TradingBot(config=config)
 
     class DummyClient:
-        def get_market_price(self, token_id):
+        async def get_market_price_async(self, token_id):
             return {"price": 0.5, "token_id": token_id}
 
     bot.clob_client = DummyClient()
 
-    calls = {}
+    async def fail_to_thread(func, *args, **kwargs):
+        raise AssertionError("REST call should not hop to a worker thread")
 
-    async def fake_to_thread(func, *args, **kwargs):
-        calls["func"] = func
-        calls["args"] = args
-        calls["kwargs"] = kwargs
-        return func(*args, **kwargs)
-
-    monkeypatch.setattr(asyncio, "to_thread", fake_to_thread)
+    monkeypatch.setattr(asyncio, "to_thread", fail_to_thread)
 
     result = await bot.get_market_price("token_abc")
 
-    assert calls["func"] == bot.clob_client.get_market_price
-    assert calls["args"] == ("token_abc",)
-    assert calls["kwargs"] == {}
-    assert result["price"] == 0.5
+    assert result == {"price": 0.5, "token_id": "token_abc"}
+
+
+@pytest.mark.asyncio
+async def test_get_trades_async_shares_request_building(monkeypatch):
+    client = ClobClient(host="https://example.com")
+    captured = {}
+
+    async def fake_request_async(method, endpoint, data=None, headers=None, params=None, **limits):
+        captured["method"] = method
+        captured["endpoint"] = endpoint
+        captured["params"] = params
+        return {"data": [{"id": "t1"}]}
+
+    monkeypatch.setattr(client, "_request_async", fake_request_async)
+
+    trades = await client.get_trades_async(token_id="token_123", limit=50)
+
+    assert trades == [{"id": "t1"}]
+    assert captured == {
+        "method": "GET",
+        "endpoint": "/data/trades",
+        "params": {"limit": 50, "token_id": "token_123"},
+    }
+
+
+FIXED_TIME = 1700000000.0
+L2_SECRET = base64.urlsafe_b64encode(b"l2-secret-bytes").decode()
+BUILDER = BuilderConfig(api_key="bk", api_secret="builder-secret", api_passphrase="bp")
+
+
+def _reference_l2_signature(secret, message):
+    try:
+        key = base64.urlsafe_b64decode(secret)
+        return base64.urlsafe_b64encode(hmac.new(key, message.encode(), hashlib.sha256).digest()).decode()
+    except Exception:
+        return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+@pytest.mark.parametrize("secret", [L2_SECRET, "not base64!"])
+def test_build_headers_match_per_request_hmac(monkeypatch, secret):
+    monkeypatch.setattr("src.client.time.time", lambda: FIXED_TIME)
+    client = ClobClient(
+        host="https://example.com",
+        funder="0xfunder",
+        api_creds=ApiCredentials(api_key="k", secret=secret, passphrase="p"),
+        builder_creds=BUILDER,
+    )
+    message = '1700000000POST/order{"a":1}'
+
+    for _ in range(2):  # second call uses the cached templates
+        headers = client._build_headers("POST", "/order", '{"a":1}')
+
+    assert list(headers) == [
+        "POLY_BUILDER_API_KEY", "POLY_BUILDER_TIMESTAMP", "POLY_BUILDER_PASSPHRASE",
+        "POLY_BUILDER_SIGNATURE", "POLY_ADDRESS", "POLY_API_KEY", "POLY_TIMESTAMP",
+        "POLY_PASSPHRASE", "POLY_SIGNATURE",
+    ]
+    assert headers["POLY_TIMESTAMP"] == headers["POLY_BUILDER_TIMESTAMP"] == "1700000000"
+    assert headers["POLY_BUILDER_SIGNATURE"] == hmac.new(
+        b"builder-secret", message.encode(), hashlib.sha256
+    ).hexdigest()
+    assert headers["POLY_SIGNATURE"] == _reference_l2_signature(secret, message)
+
+
+def test_build_headers_follow_credential_changes(monkeypatch):
+    monkeypatch.setattr("src.client.time.time", lambda: FIXED_TIME)
+    client = ClobClient(host="https://example.com", funder="0xfunder")
+    assert client._build_headers("GET", "/data/orders") == {}
+
+    client.set_api_creds(ApiCredentials(api_key="k1", secret=L2_SECRET, passphrase="p"))
+    assert client._build_headers("GET", "/data/orders")["POLY_API_KEY"] == "k1"
+
+    client.set_api_creds(ApiCredentials(api_key="k2", secret="other", passphrase="p"))
+    headers = client._build_headers("GET", "/data/orders")
+
+    assert headers["POLY_API_KEY"] == "k2"
+    assert headers["POLY_SIGNATURE"] == _reference_l2_signature("other", "1700000000GET/data/orders")
+
+
+def test_relayer_headers_require_builder_creds():
+    with pytest.raises(AuthenticationError):
+        RelayerClient()._build_headers("POST", "/submit")
+
+    headers = RelayerClient(builder_creds=BUILDER)._build_headers("POST", "/submit", "{}")
+    assert headers["POLY_BUILDER_API_KEY"] == "bk"
+    assert len(headers["POLY_BUILDER_SIGNATURE"]) == 64
+
+
+class _FakeResponse:
+    text = '{"success": true}'
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"success": True}
+
+
+def test_signed_body_is_sent_as_signed_bytes(monkeypatch):
+    monkeypatch.setattr("src.client.time.time", lambda: FIXED_TIME)
+    client = ClobClient(
+        host="https://example.com",
+        funder="0xfunder",
+        api_creds=ApiCredentials(api_key="k", secret=L2_SECRET, passphrase="p"),
+    )
+    sent = {}
+
+    class FakeSession:
+        def post(self, url, headers=None, params=None, timeout=None, **kwargs):
+            sent.update(kwargs, headers=headers)
+            return _FakeResponse()
+
+    monkeypatch.setattr(ClobClient, "session", property(lambda self: FakeSession()))
+
+    client.post_order({"order": {"price": 0.5}, "signature": "0xsig"}, "GTC")
+
+    assert "json" not in sent
+    assert sent["data"] == b'{"order":{"price":0.5},"owner":"0xfunder","orderType":"GTC","signature":"0xsig"}'
+    assert sent["headers"]["POLY_SIGNATURE"] == _reference_l2_signature(
+        L2_SECRET, "1700000000POST/order" + sent["data"].decode()
+    )
+
+
+def test_sync_request_retries_idempotent_reads_only(monkeypatch):
+    calls = []
+    slept = []
+
+    class TimeoutSession:
+        def get(self, url, **kwargs):
+            calls.append("GET")
+            raise requests.exceptions.ReadTimeout()
+
+        def post(self, url, **kwargs):
+            calls.append("POST")
+            raise requests.exceptions.ReadTimeout()
+
+    monkeypatch.setattr(ClobClient, "session", property(lambda self: TimeoutSession()))
+    monkeypatch.setattr("src.client.time.sleep", slept.append)
+    client = ClobClient(host="https://example.com", retry_budget=RetryBudget())
+
+    with pytest.raises(ApiError, match="after 3 attempts"):
+        client.get_order_book("123")
+    with pytest.raises(ApiError, match="after 1 attempts"):
+        client.post_order({"order": {}, "signature": "0xsig"}, "GTC")
+
+    assert calls == ["GET", "GET", "GET", "POST"]
+    assert len(slept) == 2 and all(0 <= delay <= 0.5 for delay in slept)
+
+
+def test_auth_headers_are_signed_per_attempt_after_the_limiter(monkeypatch):
+    clock = [FIXED_TIME]
+    monkeypatch.setattr("src.client.time.time", lambda: clock[0])
+    monkeypatch.setattr("src.client.time.sleep", lambda delay: None)
+
+    class Limiter:
+        def acquire_sync(self, rate_class, priority):
+            clock[0] += 10  # the limiter made us wait
+
+    client = ClobClient(
+        host="https://example.com",
+        funder="0xfunder",
+        api_creds=ApiCredentials(api_key="k", secret=L2_SECRET, passphrase="p"),
+        retry_budget=RetryBudget(),
+        rate_limiter=Limiter(),
+    )
+    sent = []
+
+    class TimeoutOnceSession:
+        def get(self, url, headers=None, **kwargs):
+            sent.append(headers["POLY_TIMESTAMP"])
+            if len(sent) == 1:
+                raise requests.exceptions.ReadTimeout()
+            return _FakeResponse()
+
+    monkeypatch.setattr(ClobClient, "session", property(lambda self: TimeoutOnceSession()))
+
+    client.get_order("o1")
+
+    assert sent == [str(int(FIXED_TIME) + 10), str(int(FIXED_TIME) + 20)]
@@ -0,0 +1,51 @@
+"""
+Unit tests for JSON backend selection.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import codec
+
+
+def test_auto_resolves_to_first_available():
+    assert codec.resolve_backend("auto") == codec.available_backends()[0]
+
+
+def test_stdlib_always_available():
+    assert "json" in codec.available_backends()
+    assert codec.get_loads("json") is json.loads
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        codec.resolve_backend("yaml")
+
+
+def test_missing_backend_falls_back_to_json(monkeypatch):
+    monkeypatch.setattr(codec, "_import_backend", lambda name: json if name == "json" else None)
+
+    assert codec.resolve_backend("orjson") == "json"
+    assert codec.available_backends() == ["json"]
+
+
+@pytest.mark.parametrize("backend", codec.available_backends())
+def test_loads_and_errors_per_backend(backend):
+    loads = codec.get_loads(backend)
+
+    assert loads('{"a": [1, "0.5"]}') == {"a": [1, "0.5"]}
+    with pytest.raises(codec.decode_errors(backend)):
+        loads("{not json")
+
+
+@pytest.mark.parametrize("backend", codec.available_backends())
+def test_dumps_is_compact_and_ordered(backend):
+    dumps = codec.get_dumps(backend)
+    body = {"order": {"price": 0.5, "size": 10}, "owner": "0xabc", "ids": ["a", "b"]}
+
+    assert dumps(body) == b'{"order":{"price":0.5,"size":10},"owner":"0xabc","ids":["a","b"]}'
@@ -0,0 +1,99 @@
+"""
+Unit tests for bounded callback queues and overflow policies.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.event_queue import BoundedEventQueue, QueuedEvent, current_event, dispatching
+
+
+def _event(value, key=None):
+    return QueuedEvent(kind="book", args=(value,), key=key)
+
+
+def test_rejects_unknown_policy():
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        BoundedEventQueue(10, policy="spill")
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_newest():
+    queue = BoundedEventQueue(2, policy="drop_oldest")
+
+    for value in (1, 2, 3):
+        await queue.put(_event(value))
+
+    assert [(await queue.get()).args[0] for _ in range(2)] == [2, 3]
+    assert queue.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_pending_event_for_same_key():
+    queue = BoundedEventQueue(10, policy="coalesce")
+
+    await queue.put(_event("a1", key="a"))
+    await queue.put(_event("b1", key="b"))
+    await queue.put(_event("a2", key="a"))
+    await queue.put(_event("a3", key="a"))
+
+    first = await queue.get()
+    second = await queue.get()
+    assert (first.args[0], first.coalesced) == ("a3", 2)
+    assert (second.args[0], second.coalesced) == ("b1", 0)
+    assert queue.stats.coalesced == 2
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_starts_fresh_after_dequeue():
+    queue = BoundedEventQueue(10, policy="coalesce")
+    await queue.put(_event("a1", key="a"))
+    await queue.get()
+
+    await queue.put(_event("a2", key="a"))
+
+    assert (await queue.get()).coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_consumer():
+    queue = BoundedEventQueue(1, policy="block")
+    await queue.put(_event(1))
+
+    producer = asyncio.create_task(queue.put(_event(2)))
+    await asyncio.sleep(0)
+    assert not producer.done()
+
+    assert (await queue.get()).args[0] == 1
+    await asyncio.wait_for(producer, timeout=1)
+    assert (await queue.get()).args[0] == 2
+    assert queue.stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_latency_recorded_on_get():
+    queue = BoundedEventQueue(5)
+    await queue.put(_event(1))
+    await asyncio.sleep(0.01)
+
+    event = await queue.get()
+
+    assert event.latency >= 0.005
+    assert queue.stats.dispatched == 1
+    assert queue.stats.max_latency == event.latency
+
+
+def test_dispatching_sets_current_event():
+    event = _event(1)
+    assert current_event() is None
+
+    with dispatching(event):
+        assert current_event() is event
+
+    assert current_event() is None
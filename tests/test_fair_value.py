@@ -0,0 +1,233 @@
+"""
+Unit tests for FairValueStrategy's concurrent coin scan.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.market_manager import MarketInfo
+from src.bot import OrderResult
+from src.price_feed import ReplayPriceFeed
+from src.websocket_client import OrderbookLevel, OrderbookSnapshot
+from strategies import fair_value
+from strategies.fair_value import FairValueConfig, FairValueStrategy
+
+
+def _klines(symbol, first_close, last_close):
+    closes = [first_close] * 4 + [last_close]
+    return [
+        {"e": "kline", "s": symbol, "k": {
+            "t": 1_700_000_000_000 + i * 60_000,
+            "o": "0", "h": "0", "l": "0", "c": str(close), "x": True,
+        }}
+        for i, close in enumerate(closes)
+    ]
+
+
+def _book(token_id, mid):
+    return OrderbookSnapshot(
+        asset_id=token_id,
+        market="",
+        timestamp=0,
+        bids=[OrderbookLevel(price=round(mid - 0.01, 2), size=100)],
+        asks=[OrderbookLevel(price=round(mid + 0.01, 2), size=100)],
+    )
+
+
+class _Ws:
+    def __init__(self, books):
+        self.books = books
+
+    def get_orderbook(self, token_id):
+        return self.books.get(token_id)
+
+
+async def _strategy(changes, book_prices, **kwargs):
+    coins = list(changes)
+    config = FairValueConfig(coins=coins, price_stream=False, **kwargs)
+    strategy = FairValueStrategy(bot=None, config=config)
+
+    messages = []
+    for coin, last_close in changes.items():
+        messages += _klines(f"{coin}USDT", 100.0, last_close)
+    strategy.price_feed = ReplayPriceFeed(coins, messages)
+    await strategy.price_feed.start()
+
+    for coin in coins:
+        strategy.coin_markets.markets[coin] = MarketInfo(
+            slug=f"{coin.lower()}-updown-15m-1000",
+            question="",
+            end_date="",
+            token_ids={"up": f"{coin}-up", "down": f"{coin}-down"},
+            prices={},
+            accepting_orders=True,
+        )
+
+    strategy.coin_markets.ws = _Ws({
+        f"{coin}-{side}": _book(f"{coin}-{side}", price)
+        for coin, prices in book_prices.items()
+        for side, price in prices.items()
+    })
+
+    strategy.bot = _Bot()
+    return strategy, strategy.bot
+
+
+def _delay_binance(monkeypatch, delays):
+    fetch = fair_value.get_binance_change_async
+
+    async def slow(coin, *args, **kwargs):
+        await asyncio.sleep(delays.get(coin, 0.0))
+        return await fetch(coin, *args, **kwargs)
+
+    monkeypatch.setattr(fair_value, "get_binance_change_async", slow)
+
+
+EVEN = {"up": 0.50, "down": 0.50}
+
+
+class _Bot:
+    def __init__(self):
+        self.orders = []
+
+    @property
+    def buys(self):
+        return [(order["token_id"], order["size"]) for order in self.orders if order["side"] == "BUY"]
+
+    async def place_order(self, **kwargs):
+        self.orders.append(kwargs)
+        return OrderResult(success=True, order_id=f"o{len(self.orders)}")
+
+
+@pytest.mark.asyncio
+async def test_scans_coins_concurrently_and_buys_best_edges(monkeypatch):
+    strategy, bot = await _strategy(
+        {"BTC": 100.25, "ETH": 100.12, "SOL": 99.88},
+        {"BTC": EVEN, "ETH": EVEN, "SOL": {"up": 0.55, "down": 0.45}},
+        max_trades_per_window=2,
+    )
+    _delay_binance(monkeypatch, {"BTC": 0.1, "ETH": 0.1, "SOL": 0.1})
+
+    start = time.monotonic()
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+    elapsed = time.monotonic() - start
+
+    # Binance lookups overlapped
+    assert elapsed < 0.19
+    # BTC edge 20%, SOL 15% (down), ETH 10% left out; $0.50 each
+    assert sorted(bot.buys) == [("BTC-up", pytest.approx(1.0)), ("SOL-down", pytest.approx(0.5 / 0.45))]
+    assert strategy.positions.has_position("up")
+    assert strategy.coin_positions["SOL"].has_position("down")
+    assert strategy.coin_positions["ETH"].position_count == 0
+    assert sorted(trade["coin"] for trade in strategy.daily_trades) == ["BTC", "SOL"]
+    assert strategy.total_trades == 2
+    assert strategy.skips == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_coin_is_dropped_at_its_deadline(monkeypatch):
+    strategy, bot = await _strategy(
+        {"BTC": 100.25, "ETH": 100.12},
+        {"BTC": EVEN, "ETH": EVEN},
+        coin_deadline=0.05,
+    )
+    _delay_binance(monkeypatch, {"ETH": 5.0})
+
+    start = time.monotonic()
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+
+    assert time.monotonic() - start < 1.0
+    assert bot.buys == [("BTC-up", pytest.approx(1.0))]
+    assert strategy.consecutive_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_risk_ends_the_run_loop():
+    strategy, bot = await _strategy({"BTC": 100.25}, {"BTC": EVEN})
+    strategy.running = True
+    strategy.balance = 1.0
+
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+
+    assert strategy.running is False
+    assert bot.orders == []
+
+
+@pytest.mark.asyncio
+async def test_open_position_blocks_a_second_buy_in_that_coin():
+    strategy, bot = await _strategy(
+        {"BTC": 100.25, "SOL": 99.88},
+        {"BTC": EVEN, "SOL": {"up": 0.55, "down": 0.45}},
+    )
+    strategy.coin_positions["SOL"].open_position(side="down", token_id="SOL-down", entry_price=0.4, size=1)
+
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+
+    assert bot.buys == [("BTC-up", pytest.approx(1.0))]
+
+
+@pytest.mark.asyncio
+async def test_exits_use_each_coins_own_prices():
+    strategy, bot = await _strategy({"BTC": 100.0, "ETH": 100.0}, {}, take_profit=0.10)
+    strategy.coin_positions["ETH"].open_position(side="up", token_id="ETH-up", entry_price=0.50, size=2)
+    strategy.coin_markets.get_prices = lambda coin: {"up": 0.65, "down": 0.35} if coin == "ETH" else {}
+
+    # Primary (BTC) prices would not trigger anything
+    await strategy._check_exits({"up": 0.50, "down": 0.50})
+
+    assert bot.orders == [{"token_id": "ETH-up", "price": pytest.approx(0.63), "size": 2, "side": "SELL"}]
+    assert strategy.coin_positions["ETH"].position_count == 0
+
+
+@pytest.mark.asyncio
+async def test_trade_limit_holds_for_the_whole_window():
+    strategy, bot = await _strategy(
+        {"BTC": 100.25, "ETH": 100.12, "SOL": 99.88},
+        {"BTC": EVEN, "ETH": EVEN, "SOL": {"up": 0.55, "down": 0.45}},
+        max_trades_per_window=1,
+    )
+
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+
+    assert bot.buys == [("BTC-up", pytest.approx(1.0))]
+
+    strategy.on_market_change("btc-updown-15m-1000", "btc-updown-15m-1900")
+    await strategy.on_tick({"up": 0.50, "down": 0.50})
+
+    assert bot.buys[1:] == [("SOL-down", pytest.approx(0.5 / 0.45))]
+
+
+@pytest.mark.asyncio
+async def test_coin_with_a_stale_book_is_not_traded():
+    strategy, bot = await _strategy(
+        {"BTC": 100.25, "SOL": 99.88},
+        {"BTC": EVEN, "SOL": {"up": 0.55, "down": 0.45}},
+    )
+    strategy.coin_markets.ws.books["SOL-down"].stale = True
+
+    await strategy.on_tick(EVEN)
+
+    assert bot.buys == [("BTC-up", pytest.approx(1.0))]
+
+
+@pytest.mark.asyncio
+async def test_coin_without_a_book_is_not_traded_on_cached_prices():
+    strategy, bot = await _strategy({"BTC": 100.25, "SOL": 99.88}, {"SOL": {"up": 0.55, "down": 0.45}})
+
+    await strategy.on_tick(EVEN)
+
+    assert bot.buys == [("SOL-down", pytest.approx(0.5 / 0.45))]
+
+
+def test_primary_coin_shares_the_multi_market_connection():
+    strategy = FairValueStrategy(bot=None, config=FairValueConfig(coins=["ETH", "BTC"]))
+
+    assert strategy.market.manager is strategy.coin_markets
+    assert strategy.market.coin == "ETH"
@@ -0,0 +1,255 @@
+"""
+Unit tests for the Gamma market cache.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gamma_client import GammaClient
+from src.market_cache import MarketCache
+
+
+NOW = 1766671500.0  # Inside the 1766671200 window
+SLUG = "eth-updown-15m-1766671200"
+NEXT_SLUG = "eth-updown-15m-1766672100"
+
+
+class Clock:
+    def __init__(self, now=NOW):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _live_market(slug=SLUG, end="2025-12-25T14:15:00Z"):
+    return {"slug": slug, "acceptingOrders": True, "endDate": end}
+
+
+def test_live_market_cached_until_end_date():
+    clock = Clock()
+    cache = MarketCache(clock=clock)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return _live_market()
+
+    for _ in range(3):
+        assert cache.load("url", SLUG, fetch)["slug"] == SLUG
+
+    clock.now = 1766672100.0  # endDate
+    cache.load("url", SLUG, fetch)
+
+    assert len(fetches) == 2
+    assert cache.stats()["hits"] == 2
+
+
+def test_missing_slug_negative_cached_until_window_opens():
+    clock = Clock()
+    cache = MarketCache(negative_ttl=15.0, clock=clock)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return None
+
+    assert cache.load("url", NEXT_SLUG, fetch) is None
+    assert cache.load("url", NEXT_SLUG, fetch) is None
+    assert cache.stats()["negative_hits"] == 1
+
+    clock.now += 16
+    cache.load("url", NEXT_SLUG, fetch)
+    assert len(fetches) == 2
+
+    # Never remembered past the window opening
+    assert cache.expires_at(NEXT_SLUG, None, 1766672095.0) == 1766672100.0
+
+
+def test_failures_are_not_cached_and_max_age_forces_refresh():
+    clock = Clock()
+    cache = MarketCache(clock=clock)
+
+    def fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        cache.load("url", SLUG, fail)
+    assert cache.get("url") == (False, None)
+
+    cache.load("url", SLUG, _live_market)
+    clock.now += 31
+    assert cache.get("url", max_age=30.0) == (False, None)
+
+
+def test_concurrent_sync_lookups_share_one_fetch():
+    cache = MarketCache()
+    release = threading.Event()
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        release.wait(1.0)
+        return _live_market(end="2999-01-01T00:00:00Z")
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.load("url", SLUG, fetch)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+    assert [market["slug"] for market in results] == [SLUG] * 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_lookups_share_one_request():
+    requests_made = []
+
+    class Transport:
+        async def request(self, method, url, **kwargs):
+            requests_made.append(url)
+            await asyncio.sleep(0.01)
+            slug = url.rsplit("/", 1)[-1]
+
+            class Response:
+                status_code = 404 if slug != SLUG else 200
+
+                def raise_for_status(self):
+                    pass
+
+                def json(self):
+                    return _live_market(end="2999-01-01T00:00:00Z")
+            return Response()
+
+    client = GammaClient(host="https://gamma.example.com", async_transport=Transport(), cache=MarketCache())
+
+    markets = await asyncio.gather(*(client.get_market_by_slug_async(SLUG) for _ in range(5)))
+    missing = await client.get_market_by_slug_async(NEXT_SLUG)
+    missing_again = await client.get_market_by_slug_async(NEXT_SLUG)
+
+    assert [m["slug"] for m in markets] == [SLUG] * 5
+    assert missing is None and missing_again is None
+    assert len(requests_made) == 2
+    assert client.cache.stats()["shared"] == 4
+
+
+def test_callers_get_copies_of_cached_markets():
+    cache = MarketCache(clock=Clock())
+    first = cache.load("url", SLUG, _live_market)
+    first["slug"] = "corrupted"
+
+    second = cache.load("url", SLUG, _live_market)
+    second["acceptingOrders"] = False
+
+    assert cache.load("url", SLUG, _live_market) == _live_market()
+
+
+def _gamma_transport(live_slugs, requested):
+    class Transport:
+        async def request(self, method, url, **kwargs):
+            slug = url.rsplit("/", 1)[-1]
+            requested.append(slug)
+
+            class Response:
+                status_code = 200 if slug in live_slugs else 404
+
+                def raise_for_status(self):
+                    pass
+
+                def json(self):
+                    return {
+                        **_live_market(slug, end="2999-01-01T00:00:00Z"),
+                        "outcomes": '["Up", "Down"]',
+                        "outcomePrices": '["0.6", "0.4"]',
+                    }
+            return Response()
+    return Transport()
+
+
+@pytest.mark.asyncio
+async def test_repeated_discovery_is_served_from_cache():
+    requested = []
+    client = GammaClient(host="https://gamma.example.com", cache=MarketCache())
+    current = client._window_slugs("ETH")[0]
+    client._async_transport = _gamma_transport({current}, requested)
+
+    for _ in range(10):
+        info = await client.get_market_info_async("ETH")
+
+    assert info["slug"] == current
+    assert requested == [current]  # Other windows only tried if needed
+    assert client.cache.stats()["hits"] == 9
+
+
+@pytest.mark.asyncio
+async def test_discovery_falls_back_to_next_window_in_order():
+    requested = []
+    client = GammaClient(host="https://gamma.example.com", cache=MarketCache())
+    current, upcoming, _previous = client._window_slugs("ETH")
+    client._async_transport = _gamma_transport({upcoming}, requested)
+
+    for _ in range(3):
+        info = await client.get_market_info_async("ETH")
+
+    assert info["slug"] == upcoming
+    assert requested == [current, upcoming]
+
+
+def test_max_age_does_not_bypass_negative_entries():
+    clock = Clock()
+    cache = MarketCache(negative_ttl=15.0, clock=clock)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return None
+
+    cache.load("url", SLUG, fetch)
+    clock.now += 10
+
+    assert cache.load("url", SLUG, fetch, max_age=5.0) is None
+    assert len(fetches) == 1
+
+
+def test_market_info_max_age_refreshes_prices():
+    clock = Clock()
+    client = GammaClient(cache=MarketCache(clock=clock))
+    current = client._window_slugs("ETH")[0]
+    prices = iter(['["0.6", "0.4"]', '["0.7", "0.3"]'])
+    client._fetch_market = lambda url: {
+        **_live_market(current, end="2999-01-01T00:00:00Z"),
+        "outcomes": '["Up", "Down"]',
+        "outcomePrices": next(prices),
+    }
+
+    assert client.get_market_info("ETH")["prices"] == {"up": 0.6, "down": 0.4}
+    clock.now += 10
+    assert client.get_market_info("ETH")["prices"] == {"up": 0.6, "down": 0.4}
+    info = client.get_market_info("ETH", max_age=client.price_max_age)
+
+    assert info["prices"] == {"up": 0.7, "down": 0.3}
+
+
+@pytest.mark.asyncio
+async def test_async_slug_lookup_swallows_any_failure_like_sync():
+    class Transport:
+        async def request(self, method, url, **kwargs):
+            raise RuntimeError("connection reset")
+
+    client = GammaClient(host="https://gamma.example.com", async_transport=Transport(), cache=MarketCache())
+
+    assert await client.get_market_by_slug_async(SLUG) is None
@@ -1,13 +1,19 @@
 """
-Unit tests for MarketManager market switching logic.
+Unit tests for MarketManager market switching and book delivery.
 """
 
+import asyncio
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib.market_manager import MarketManager, MarketInfo
+from src.event_queue import current_event
 
 
 def _market(slug: str, token_ids: dict, end_date: str = "") -> MarketInfo:
@@ -59,3 +65,146 @@ def test_should_switch_with_end_date_fallback():
     )
 
     assert manager._should_switch_market(old_market, new_market) is True
+
+
+def _book(asset_id: str, hash_value: str) -> dict:
+    return {
+        "event_type": "book",
+        "asset_id": asset_id,
+        "market": "0xmarket",
+        "timestamp": "1000",
+        "hash": hash_value,
+        "bids": [{"price": "0.48", "size": "10"}],
+        "asks": [{"price": "0.52", "size": "10"}],
+    }
+
+
+async def _started_manager(**kwargs) -> MarketManager:
+    manager = MarketManager(coin="BTC", auto_switch_market=False, **kwargs)
+    market = _market("btc-updown-15m-1000", {"up": "1", "down": "2"})
+
+    def discover_market(update_state: bool = True):
+        manager._update_current_market(market)
+        return market
+
+    async def run_websocket():
+        pass
+
+    manager.discover_market = discover_market
+    manager._run_websocket = run_websocket
+    assert await manager.start() is True
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_coalesce_books_delivers_newest_snapshot_per_asset():
+    manager = await _started_manager(coalesce_books=True)
+    delivered = []
+
+    @manager.on_book_update
+    def handle(snapshot):
+        delivered.append((snapshot.asset_id, snapshot.hash, current_event().coalesced))
+
+    # Burst arrives before the delivery task gets to run
+    for hash_value in ("a", "b", "c"):
+        await manager.ws._handle_message(_book("1", hash_value))
+    await manager.ws._handle_message(_book("2", "x"))
+
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await manager.stop()
+
+    assert delivered == [("1", "c", 2), ("2", "x", 0)]
+    assert manager.skipped_book_updates == {"1": 2}
+
+
+@pytest.mark.asyncio
+async def test_books_delivered_inline_by_default():
+    manager = await _started_manager()
+    delivered = []
+    manager.on_book_update(lambda snapshot: delivered.append(snapshot.hash))
+
+    for hash_value in ("a", "b"):
+        await manager.ws._handle_message(_book("1", hash_value))
+
+    assert delivered == ["a", "b"]
+    assert manager.book_queue_stats is None
+    await manager.stop()
+
+
+class FakeWebSocket:
+    def __init__(self, assets):
+        self.assets = set(assets)
+        self.calls = []
+
+    async def subscribe(self, asset_ids, replace=False):
+        self.calls.append(("subscribe", sorted(asset_ids), replace))
+        self.assets = set(asset_ids) if replace else self.assets | set(asset_ids)
+        return True
+
+    async def subscribe_more(self, asset_ids):
+        self.calls.append(("subscribe_more", sorted(asset_ids)))
+        self.assets |= set(asset_ids)
+        return True
+
+    async def unsubscribe(self, asset_ids):
+        self.calls.append(("unsubscribe", sorted(asset_ids)))
+        self.assets -= set(asset_ids)
+        return True
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_rollover_presubscribes_next_window_and_switches_at_end():
+    end = int(time.time()) + 1  # End dates have whole-second resolution
+    manager = MarketManager(coin="BTC", prefetch_seconds=5.0)
+    manager._running = True
+    manager.ws = FakeWebSocket({"1", "2"})
+    manager._update_current_market(_market("btc-updown-15m-1000", {"up": "1", "down": "2"}, _iso(end)))
+    changes = []
+    manager.on_market_change(lambda old, new: changes.append((old, new, sorted(manager.ws.assets))))
+    requested = []
+
+    async def next_market_info(coin, window_start=None):
+        requested.append(window_start)
+        return {
+            "slug": "btc-updown-15m-1900",
+            "end_date": _iso(end + 900),
+            "token_ids": {"up": "3", "down": "4"},
+            "accepting_orders": True,
+        }
+
+    manager.gamma.get_next_market_info_async = next_market_info
+    task = asyncio.create_task(manager._rollover_loop())
+
+    await asyncio.sleep(0.05)
+    assert manager.next_market.slug == "btc-updown-15m-1900"
+    assert manager.current_market.slug == "btc-updown-15m-1000"
+    assert manager.ws.assets == {"1", "2", "3", "4"}
+
+    await asyncio.sleep(end - time.time() + 0.1)
+    manager._running = False
+    task.cancel()
+
+    assert time.time() >= end
+    assert requested[0] == end
+    assert manager.current_market.slug == "btc-updown-15m-1900"
+    assert manager.next_market is None
+    # Switched with the new books warm; only the old window was dropped
+    assert changes == [("btc-updown-15m-1000", "btc-updown-15m-1900", ["1", "2", "3", "4"])]
+    assert manager.ws.calls == [("subscribe_more", ["3", "4"]), ("unsubscribe", ["1", "2"])]
+
+
+@pytest.mark.asyncio
+async def test_switch_without_presubscription_replaces_subscription():
+    manager = MarketManager(coin="BTC")
+    manager.ws = FakeWebSocket({"1", "2"})
+    manager._update_current_market(_market("btc-updown-15m-1000", {"up": "1", "down": "2"}))
+
+    await manager._switch_market(_market("btc-updown-15m-1900", {"up": "3", "down": "4"}))
+
+    assert manager.ws.calls == [("subscribe", ["3", "4"], True)]
+    assert manager.current_market.slug == "btc-updown-15m-1900"
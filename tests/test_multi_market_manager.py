@@ -0,0 +1,151 @@
+"""
+Unit tests for MultiMarketManager discovery, routing and rollover.
+"""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.multi_market_manager import MultiMarketManager
+from src.websocket_client import MarketWebSocket
+
+
+TOKENS = {"BTC": ("b1", "b2"), "ETH": ("e1", "e2")}
+
+
+def _info(coin, window=1000, end_date="2025-01-01T00:15:00Z", tokens=None):
+    up, down = tokens or TOKENS[coin]
+    return {
+        "slug": f"{coin.lower()}-updown-15m-{window}",
+        "end_date": end_date,
+        "token_ids": {"up": up, "down": down},
+        "accepting_orders": True,
+    }
+
+
+def _book(asset_id, bid, ask):
+    return {
+        "event_type": "book",
+        "asset_id": asset_id,
+        "market": "0xmarket",
+        "timestamp": "1",
+        "bids": [{"price": str(bid), "size": "10"}],
+        "asks": [{"price": str(ask), "size": "10"}],
+    }
+
+
+def _manager(lookups):
+    manager = MultiMarketManager(coins=["BTC", "ETH"])
+    manager.ws = MarketWebSocket()
+    calls = []
+
+    async def market_info(coin):
+        calls.append(coin)
+        return lookups.get(coin)
+
+    manager.gamma.get_market_info_async = market_info
+    return manager, calls
+
+
+def test_rejects_unsupported_coin():
+    with pytest.raises(ValueError, match="Unsupported coin"):
+        MultiMarketManager(coins=["BTC", "DOGE"])
+
+
+@pytest.mark.asyncio
+async def test_discovers_all_coins_on_one_subscription():
+    manager, calls = _manager({"BTC": _info("BTC"), "ETH": _info("ETH")})
+
+    markets = await manager.discover_markets()
+
+    assert sorted(calls) == ["BTC", "ETH"]
+    assert set(markets) == {"BTC", "ETH"}
+    assert manager.ws._subscribed_assets == {"b1", "b2", "e1", "e2"}
+    assert manager.coin_for_token("e2") == ("ETH", "down")
+
+
+@pytest.mark.asyncio
+async def test_prices_and_callbacks_come_from_each_coins_books():
+    manager, _ = _manager({"BTC": _info("BTC"), "ETH": _info("ETH")})
+    await manager.discover_markets()
+    manager.ws.on_book(manager._handle_book)
+    seen = []
+    manager.on_book_update(lambda coin, snapshot: seen.append((coin, snapshot.asset_id)))
+
+    await manager.ws._handle_message(_book("b1", 0.60, 0.62))
+    await manager.ws._handle_message(_book("e2", 0.30, 0.34))
+
+    assert manager.get_mid_price("BTC", "up") == pytest.approx(0.61)
+    assert manager.get_mid_price("ETH", "down") == pytest.approx(0.32)
+    assert manager.get_mid_price("ETH", "up") == 0.0
+    assert manager.is_book_fresh("BTC", "up") is True
+    assert manager.is_book_fresh("BTC", "down") is False
+    assert seen == [("BTC", "b1"), ("ETH", "e2")]
+
+
+@pytest.mark.asyncio
+async def test_coins_roll_over_independently_with_warm_books():
+    manager, _ = _manager({"BTC": _info("BTC"), "ETH": _info("ETH", end_date="2025-01-01T00:30:00Z")})
+    await manager.discover_markets()
+    changes = []
+    manager.on_market_change(lambda coin, old, new: changes.append((coin, old, new)))
+
+    async def next_market_info(coin, window_start=None):
+        return _info(coin, window=1900, tokens=(f"{coin}n1", f"{coin}n2"))
+
+    manager.gamma.get_next_market_info_async = next_market_info
+    btc_end = manager.get_market("BTC").end_timestamp()
+
+    # Inside BTC's prefetch window only
+    await manager._roll_markets(btc_end - 30)
+    await manager._sync_subscription()
+    assert set(manager.next_markets) == {"BTC"}
+    assert {"BTCn1", "BTCn2", "b1"} <= manager.ws._subscribed_assets
+    await manager.ws._handle_message(_book("BTCn1", 0.50, 0.52))
+
+    await manager._roll_markets(btc_end)
+    await manager._sync_subscription()
+
+    assert changes == [("BTC", "btc-updown-15m-1000", "btc-updown-15m-1900")]
+    assert manager.get_market("ETH").slug == "eth-updown-15m-1000"
+    assert manager.get_mid_price("BTC", "up") == pytest.approx(0.51)
+    assert manager.ws._subscribed_assets == {"BTCn1", "BTCn2", "e1", "e2"}
+
+
+@pytest.mark.asyncio
+async def test_view_follows_one_coin_like_a_market_manager():
+    manager, _ = _manager({"BTC": _info("BTC"), "ETH": _info("ETH")})
+    await manager.discover_markets()
+    manager.ws.on_book(manager._handle_book)
+    manager.ws.on_price_change(manager._handle_price_change)
+    eth = manager.view("eth")
+    books, price_changes, rolls = [], [], []
+    eth.on_book_update(lambda snapshot: books.append(snapshot.asset_id))
+    eth.on_price_change(lambda market, changes: price_changes.append(changes[0].asset_id))
+    eth.on_market_change(lambda old, new: rolls.append((old, new)))
+
+    await manager.ws._handle_message(_book("b1", 0.60, 0.62))
+    await manager.ws._handle_message(_book("e1", 0.30, 0.34))
+    await manager.ws._handle_message({
+        "event_type": "price_change",
+        "market": "0xmarket",
+        "price_changes": [{
+            "asset_id": "e1", "price": "0.31", "size": "5", "side": "BUY",
+            "best_bid": "0.31", "best_ask": "0.34",
+        }],
+    })
+    manager._switch_market("BTC", replace(manager.markets["BTC"], slug="btc-updown-15m-1900"))
+
+    assert eth.token_ids == {"up": "e1", "down": "e2"}
+    assert eth.get_mid_price("up") == pytest.approx(0.325)
+    assert eth.is_book_fresh("up") is True
+    assert books == ["e1"]
+    assert price_changes == ["e1"]
+    assert rolls == []
+
+    with pytest.raises(ValueError, match="Untracked coin"):
+        manager.view("SOL")
@@ -0,0 +1,196 @@
+"""
+Unit tests for PreSignedOrderPool.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.order_pool import PreSignedOrderPool
+from src.signer import OrderSigner
+
+
+TEST_PRIVATE_KEY = "0x" + "a" * 64
+TEST_SAFE_ADDRESS = "0x" + "b" * 40
+
+
+def _pool(**kwargs) -> PreSignedOrderPool:
+    options = {"prices": [0.40, 0.41, 0.42], "notional": 5.0}
+    options.update(kwargs)
+    return PreSignedOrderPool(
+        signer=OrderSigner(TEST_PRIVATE_KEY),
+        maker=TEST_SAFE_ADDRESS,
+        **options,
+    )
+
+
+class FakeMarket:
+    def __init__(self, token_ids):
+        self.token_ids = token_ids
+        self.callbacks = []
+
+    def get_mid_price(self, side):
+        return 0.0
+
+    def on_market_change(self, callback):
+        self.callbacks.append(callback)
+        return callback
+
+
+def test_requires_sizes_or_notional():
+    with pytest.raises(ValueError):
+        PreSignedOrderPool(OrderSigner(TEST_PRIVATE_KEY), TEST_SAFE_ADDRESS, prices=[0.5])
+
+
+def test_prepare_signs_every_token_side_and_price():
+    pool = _pool(sides=("BUY", "SELL"))
+
+    assert pool.prepare(["1", "2"]) == 12
+    assert len(pool) == 12
+    assert pool.stats.signed == 12
+
+
+def test_take_matches_rounded_price_and_notional_size():
+    pool = _pool()
+    pool.prepare(["1"])
+
+    signed = pool.take("1", "buy", 0.4049)
+
+    assert signed["order"]["price"] == 0.40
+    assert signed["order"]["size"] == pytest.approx(12.5)
+    assert signed["order"]["side"] == "BUY"
+    assert pool.stats.hits == 1
+
+
+def test_take_misses_off_grid_or_unknown_token():
+    pool = _pool()
+    pool.prepare(["1"])
+
+    assert pool.take("1", "BUY", 0.55) is None
+    assert pool.take("9", "BUY", 0.40) is None
+    assert pool.take("1", "SELL", 0.40) is None
+    assert pool.stats.misses == 3
+
+
+def test_fixed_sizes_are_part_of_the_key():
+    pool = _pool(notional=None, sizes=[10, 20])
+    pool.prepare(["1"])
+
+    assert pool.take("1", "BUY", 0.41, size=20)["order"]["size"] == 20
+    assert pool.take("1", "BUY", 0.41, size=15) is None
+
+
+def test_limit_offset_signs_away_from_matched_price():
+    pool = _pool(prices=[0.40, 0.99], sides=("BUY", "SELL"), limit_offset=0.02)
+    pool.prepare(["1"])
+
+    assert pool.take("1", "BUY", 0.40)["order"]["price"] == pytest.approx(0.42)
+    assert pool.take("1", "SELL", 0.40)["order"]["price"] == pytest.approx(0.38)
+    assert pool.take("1", "BUY", 0.99)["order"]["price"] == pytest.approx(0.99)
+
+
+async def _wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_taken_order_is_refilled_in_background():
+    pool = _pool()
+    pool.prepare(["1"])
+
+    first = pool.take("1", "BUY", 0.40)
+    assert pool.take("1", "BUY", 0.40) is None
+
+    await _wait_for(lambda: len(pool) == 3)
+
+    second = pool.take("1", "BUY", 0.40)
+    assert second is not None and second is not first
+
+
+def test_band_signs_only_prices_near_the_mid():
+    pool = _pool(prices=[cents / 100 for cents in range(1, 100)], band=0.02)
+
+    assert pool.prepare(["1", "2"], mids={"1": 0.50}) == 5 + 99
+
+    assert pool.take("1", "BUY", 0.52) is not None
+    assert pool.take("1", "BUY", 0.53) is None
+    assert pool.take("2", "BUY", 0.90) is not None
+
+
+def test_recenter_signs_only_the_prices_gained():
+    pool = _pool(prices=[cents / 100 for cents in range(1, 100)], band=0.04)
+    pool.prepare(["1"], mids={"1": 0.50})
+
+    assert pool.needs_recenter({"1": 0.51}) is False
+    assert pool.recenter({"1": 0.51}) == 0
+    assert pool.recenter({"1": 0.53}) == 3
+
+    assert len(pool) == 9
+    assert pool.take("1", "BUY", 0.57) is not None
+    assert pool.take("1", "BUY", 0.48) is None
+
+
+@pytest.mark.asyncio
+async def test_attach_reprepares_on_market_change():
+    pool = _pool()
+    market = FakeMarket({"up": "1", "down": "2"})
+    pool.attach(market)
+    await pool.prepare_async(market.token_ids.values())
+
+    market.token_ids = {"up": "3", "down": "4"}
+    market.callbacks[0]("old", "new")
+
+    # Expired tokens are dropped before the new ones are signed
+    assert pool.take("1", "BUY", 0.40) is None
+
+    await _wait_for(lambda: len(pool))
+
+    assert pool.token_ids == ["3", "4"]
+    assert pool.take("3", "BUY", 0.40) is not None
+
+
+@pytest.mark.asyncio
+async def test_attach_logs_failed_reprepare(caplog):
+    pool = _pool()
+    market = FakeMarket({"up": "1", "down": "2"})
+    pool.attach(market)
+
+    def fail(order):
+        raise RuntimeError("signer down")
+
+    pool.signer.sign_order = fail
+    market.callbacks[0]("old", "new")
+
+    with pytest.raises(RuntimeError):
+        await pool._prepare_task
+
+    assert "signer down" in caplog.text
+
+
+def test_order_taken_during_recenter_is_not_put_back():
+    pool = _pool(prices=[cents / 100 for cents in range(1, 100)], band=0.04)
+    pool.prepare(["1"], mids={"1": 0.50})
+    # Keep the taken key empty so a re-insert would be visible
+    pool._schedule_refill = lambda key, generation: None
+
+    taken = []
+    sign_order = pool.signer.sign_order
+
+    def sign_and_take(order):
+        if not taken:
+            taken.append(pool.take("1", "BUY", 0.52))
+        return sign_order(order)
+
+    pool.signer.sign_order = sign_and_take
+    assert pool.recenter({"1": 0.53}) == 3
+
+    assert taken[0] is not None
+    assert pool.take("1", "BUY", 0.52) is None
+    assert pool.take("1", "BUY", 0.57) is not None
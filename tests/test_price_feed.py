@@ -0,0 +1,158 @@
+"""
+Unit tests for the streaming reference price feed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.price_feed import BinanceKlineFeed, Candle, CandleHistory, ReplayPriceFeed
+from strategies import fair_value
+
+
+def _kline(symbol, minute, close, closed=False, wrapped=True):
+    event = {
+        "e": "kline",
+        "s": symbol,
+        "k": {
+            "t": 1_700_000_000_000 + minute * 60_000,
+            "o": "100", "h": "110", "l": "90", "c": str(close), "x": closed,
+        },
+    }
+    return {"stream": f"{symbol.lower()}@kline_1m", "data": event} if wrapped else event
+
+
+def _candle(minute, close, closed=True):
+    return Candle(open_time=minute * 60_000, open=0, high=0, low=0, close=close, closed=closed)
+
+
+def test_newest_candle_is_updated_in_place():
+    history = CandleHistory(maxlen=3)
+    for minute, close in ((0, 100), (1, 101), (1, 102), (2, 103), (3, 104)):
+        history.update(_candle(minute, close))
+
+    assert [c.close for c in history.candles] == [102, 103, 104]
+    assert history.change(3) == pytest.approx(1.9608)
+    assert history.change(4) is None
+
+
+def test_change_refuses_a_window_with_missing_minutes():
+    history = CandleHistory()
+    for minute in (0, 1, 2, 5, 6):  # Stream was down for minutes 3-4
+        history.update(_candle(minute, 100 + minute))
+
+    assert history.change(2) == pytest.approx(0.9524)
+    assert history.change(3) is None
+    assert history.change(5) is None
+
+    history.merge([_candle(minute, 100 + minute) for minute in range(7)])
+
+    assert history.change(5) == pytest.approx(3.9216)
+
+
+def test_merge_keeps_newer_stream_candles():
+    history = CandleHistory(maxlen=3)
+    history.update(_candle(2, 50, closed=False))
+    history.update(_candle(3, 60, closed=False))
+
+    history.merge([_candle(1, 40), _candle(2, 55), _candle(3, 59, closed=False)])
+
+    assert [(c.open_time // 60_000, c.close) for c in history.candles] == [(1, 40), (2, 55), (3, 60)]
+
+
+@pytest.mark.asyncio
+async def test_kline_feed_reseeds_after_reconnect():
+    feed = BinanceKlineFeed(["BTC"])
+    seeded = []
+    connections = []
+
+    async def seed():
+        seeded.append(feed.reconnects)
+        return 1
+
+    class FakeStream:
+        async def __aenter__(self):
+            connections.append(self)
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if len(connections) == 1:
+                raise ConnectionError("dropped")
+            feed._running = False
+            raise StopAsyncIteration
+
+    feed.seed = seed
+    feed._ws_connect = lambda url: FakeStream()
+    feed._running = True
+
+    await feed._run()
+    await asyncio.sleep(0)
+
+    assert len(connections) == 2
+    assert seeded == [1]  # Only after the reconnect; start() seeds the first connection
+
+
+def test_out_of_order_candles_are_ignored():
+    history = CandleHistory()
+    history.update(Candle(open_time=5, open=0, high=0, low=0, close=1))
+    history.update(Candle(open_time=4, open=0, high=0, low=0, close=9))
+
+    assert [c.close for c in history.candles] == [1]
+
+
+@pytest.mark.asyncio
+async def test_replay_feed_matches_rest_change_semantics():
+    closes = [100.0, 100.5, 101.0, 100.0, 102.0]
+    messages = [_kline("BTCUSDT", i, close, closed=True) for i, close in enumerate(closes)]
+    messages.append(_kline("ETHUSDT", 0, 50.0, wrapped=False))
+    messages.append({"stream": "x", "data": {"e": "trade", "s": "BTCUSDT"}})
+    feed = ReplayPriceFeed(["BTC", "ETH"], messages)
+
+    await feed.start()
+
+    # Same as REST klines limit=5: first close vs last close
+    assert feed.get_change("BTC", lookback=5) == pytest.approx(2.0)
+    assert feed.get_change("BTC", lookback=2) == pytest.approx(2.0)
+    assert feed.get_change("ETH", lookback=5) is None
+    assert feed.get_price("ETH") == 50.0
+    assert feed.messages == 6
+
+
+@pytest.mark.asyncio
+async def test_stale_feed_reports_nothing():
+    feed = ReplayPriceFeed(["BTC"], [_kline("BTCUSDT", 0, 100), _kline("BTCUSDT", 1, 101)], max_age=0.0)
+    await feed.start()
+    feed.history("BTC").updated_at -= 1
+
+    assert feed.is_fresh("BTC") is False
+    assert feed.get_change("BTC", 2) is None
+
+
+def test_rejects_unknown_coin_and_builds_combined_stream():
+    with pytest.raises(ValueError):
+        ReplayPriceFeed(["DOGE"])
+
+    feed = BinanceKlineFeed(["BTC", "eth"])
+    assert feed.stream_url.endswith("?streams=btcusdt@kline_1m/ethusdt@kline_1m")
+
+
+@pytest.mark.asyncio
+async def test_get_binance_change_reads_feed_without_rest(monkeypatch):
+    def no_rest(*args, **kwargs):
+        raise AssertionError("REST should not be called")
+
+    monkeypatch.setattr(fair_value._binance_session, "get", no_rest)
+    feed = ReplayPriceFeed(["SOL"], [_kline("SOLUSDT", i, 10 + i) for i in range(5)])
+    await feed.start()
+
+    assert fair_value.get_binance_change("SOL", 5, feed=feed) == pytest.approx(40.0)
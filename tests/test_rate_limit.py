@@ -0,0 +1,100 @@
+"""
+Unit tests for the token buckets and the shared API rate limiter.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.client import ClobClient
+from src.rate_limit import (
+    CLOB_ORDER,
+    CLOB_READ,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PriorityTokenBucket,
+    RateLimiter,
+)
+
+
+def test_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        PriorityTokenBucket(rate=0, capacity=1)
+
+
+@pytest.mark.asyncio
+async def test_high_priority_preempts_waiting_low_priority():
+    bucket = PriorityTokenBucket(rate=50.0, capacity=1)
+    await bucket.acquire()
+    order = []
+
+    async def request(name, priority):
+        await bucket.acquire(priority=priority)
+        order.append(name)
+
+    low = [asyncio.create_task(request(f"low{i}", PRIORITY_LOW)) for i in range(2)]
+    await asyncio.sleep(0)
+    high = asyncio.create_task(request("high", PRIORITY_HIGH))
+    await asyncio.gather(*low, high)
+
+    assert order[0] == "high"
+    assert bucket.stats()["acquired"] == [1, 1, 2]
+
+
+def test_sync_acquire_waits_for_refill():
+    bucket = PriorityTokenBucket(rate=50.0, capacity=1)
+
+    assert bucket.acquire_sync() == 0.0
+    assert bucket.acquire_sync() > 0
+    assert bucket.stats()["waiting"] == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_order_class_draws_from_host_and_order_buckets():
+    limiter = RateLimiter(
+        limits={"clob": (1.0, 10), "clob_order": (1.0, 2)},
+        classes={CLOB_READ: ("clob",), CLOB_ORDER: ("clob", "clob_order")},
+    )
+
+    await limiter.acquire(CLOB_ORDER, PRIORITY_HIGH)
+    await limiter.acquire(CLOB_READ)
+    await limiter.acquire("unknown")
+
+    stats = limiter.stats()
+    assert stats["clob"]["tokens"] == pytest.approx(8, abs=0.1)
+    assert stats["clob_order"]["tokens"] == pytest.approx(1, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_client_requests_use_endpoint_class_and_priority(monkeypatch):
+    calls = []
+
+    class RecordingLimiter(RateLimiter):
+        async def acquire(self, endpoint_class, priority=1):
+            calls.append((endpoint_class, priority))
+            return 0.0
+
+    client = ClobClient(host="https://example.com", rate_limiter=RecordingLimiter(limits={}))
+
+    async def fake_send(method, url, **kwargs):
+        class Response:
+            text = "[]"
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return []
+        return Response()
+
+    monkeypatch.setattr(client.async_transport, "request", fake_send)
+
+    await client.cancel_order_async("o1")
+    await client.get_open_orders_async(priority=PRIORITY_LOW)
+
+    assert calls == [(CLOB_ORDER, PRIORITY_HIGH), (CLOB_READ, PRIORITY_LOW)]
@@ -0,0 +1,97 @@
+"""
+Unit tests for retry classification, backoff and budgets.
+"""
+
+import sys
+from pathlib import Path
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.retry import (
+    CONNECT,
+    CONNECTION_LOST,
+    RATE_LIMITED,
+    READ_TIMEOUT,
+    SERVER_ERROR,
+    RetryBudget,
+    RetryPolicy,
+    classify_error,
+    parse_retry_after,
+    retry_after_from,
+)
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(response=response)
+
+
+class TestClassifyError:
+    def test_status_codes(self):
+        assert classify_error(_http_error(429)) == RATE_LIMITED
+        assert classify_error(_http_error(502)) == SERVER_ERROR
+        assert classify_error(_http_error(400)) is None
+
+    def test_requests_connection_errors(self):
+        refused = MaxRetryError(None, "/", reason=NewConnectionError(None, "refused"))
+
+        assert classify_error(requests.exceptions.ConnectTimeout()) == CONNECT
+        assert classify_error(requests.exceptions.ConnectionError(refused)) == CONNECT
+        assert classify_error(requests.exceptions.ReadTimeout()) == READ_TIMEOUT
+        assert classify_error(requests.exceptions.ConnectionError("reset")) == CONNECTION_LOST
+
+    def test_unknown_errors_are_not_retried(self):
+        assert classify_error(ValueError("bad json")) is None
+
+
+def test_retry_after_seconds_and_headers():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert retry_after_from(_http_error(429, {"Retry-After": "1.5"})) == 1.5
+
+
+class TestRetryPolicy:
+    def test_post_only_retried_when_not_processed(self):
+        policy = RetryPolicy()
+
+        assert policy.should_retry("POST", CONNECT)
+        assert policy.should_retry("POST", RATE_LIMITED)
+        assert not policy.should_retry("POST", READ_TIMEOUT)
+        assert not policy.should_retry("POST", SERVER_ERROR)
+        assert policy.should_retry("DELETE", SERVER_ERROR)
+        assert not policy.should_retry("GET", None)
+
+    def test_jittered_backoff_is_capped(self):
+        policy = RetryPolicy(max_attempts=10, base_delay=0.5, max_delay=1.0)
+
+        delays = [policy.next_delay("GET", attempt, SERVER_ERROR) for attempt in range(1, 9)]
+
+        assert all(0 <= delay <= 1.0 for delay in delays)
+        assert policy.next_delay("GET", 10, SERVER_ERROR) is None
+
+    def test_retry_after_honored_or_gives_up(self):
+        policy = RetryPolicy(max_retry_after=3.0)
+
+        assert policy.next_delay("POST", 1, RATE_LIMITED, retry_after=2.0) == 2.0
+        assert policy.next_delay("POST", 1, RATE_LIMITED, retry_after=30.0) is None
+
+
+def test_budget_limits_retries_to_ratio_of_requests():
+    budget = RetryBudget(ratio=0.5, burst=2)
+    policy = RetryPolicy(max_attempts=5)
+
+    allowed = [policy.next_delay("GET", 1, SERVER_ERROR, budget=budget) is not None for _ in range(3)]
+    assert allowed == [True, True, False]
+
+    budget.record_request()
+    budget.record_request()
+
+    assert policy.next_delay("GET", 1, SERVER_ERROR, budget=budget) is not None
+    assert budget.retries == 3
+    assert budget.denied == 1
@@ -14,6 +14,8 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from eth_account.messages import encode_typed_data
+
 from src.signer import OrderSigner, Order, SignerError
 
 
@@ -138,6 +140,44 @@ class TestOrderSigner:
         assert signature.startswith("0x")
         assert len(signature) == 132  # 65 bytes hex encoded
 
+    @pytest.mark.parametrize("side,price,size,fee", [
+        ("BUY", 0.65, 10.0, 0),
+        ("SELL", 0.01, 1234.5, 100),
+        ("BUY", 1.0, 0.5, 0),
+    ])
+    def test_fast_path_signature_matches_encode_typed_data(self, side, price, size, fee):
+        """Test cached-hash signing is byte-identical to encode_typed_data."""
+        order = Order(
+            token_id="71321045679252212594626385532706912750332728571942532289631379312455583992563",
+            price=price,
+            size=size,
+            side=side,
+            maker="0x" + "b" * 40,
+            nonce=1700000000,
+            fee_rate_bps=fee,
+        )
+
+        signable = encode_typed_data(
+            domain_data=OrderSigner.DOMAIN,
+            message_types=OrderSigner.ORDER_TYPES,
+            message_data=self.signer._order_message(order),
+        )
+        expected = "0x" + self.signer.wallet.sign_message(signable).signature.hex()
+
+        assert self.signer.sign_order(order)["signature"] == expected
+
+    def test_domain_separator_matches_eth_account(self):
+        """Test the cached domain separator against eth_account's encoding."""
+        signable = encode_typed_data(
+            domain_data=OrderSigner.DOMAIN,
+            message_types=OrderSigner.ORDER_TYPES,
+            message_data=self.signer._order_message(
+                Order(token_id="1", price=0.5, size=1.0, side="BUY", maker="0x" + "b" * 40)
+            ),
+        )
+
+        assert signable.header == self.signer._domain_separator
+
 
 class TestOrder:
     """Tests for Order dataclass."""
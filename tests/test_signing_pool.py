@@ -0,0 +1,67 @@
+"""
+Unit tests for SigningExecutor (process-pool order signing).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.signer import Order, OrderSigner
+from src.signing_pool import SigningExecutor
+
+
+TEST_PRIVATE_KEY = "0x" + "a" * 64
+TEST_SAFE_ADDRESS = "0x" + "b" * 40
+
+
+@pytest.fixture(scope="module")
+def signer():
+    return OrderSigner(TEST_PRIVATE_KEY)
+
+
+@pytest.fixture(scope="module")
+def executor(signer):
+    executor = SigningExecutor(signer, max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def _orders(count):
+    return [
+        Order(
+            token_id="123",
+            price=0.40 + i * 0.01,
+            size=5.0,
+            side="BUY",
+            maker=TEST_SAFE_ADDRESS,
+            nonce=1700000000,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_starts_workers_with_key(executor):
+    assert await executor.warm_up() == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_in_process_signatures_in_order(executor, signer):
+    orders = _orders(7)
+
+    signed = await executor.sign_orders_batch(orders)
+
+    assert [s["signature"] for s in signed] == [
+        signer.sign_order(order)["signature"] for order in orders
+    ]
+
+
+@pytest.mark.asyncio
+async def test_single_order_and_empty_batch(executor, signer):
+    order = _orders(1)[0]
+
+    assert await executor.sign_order(order) == signer.sign_order(order)
+    assert await executor.sign_orders_batch([]) == []
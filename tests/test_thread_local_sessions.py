@@ -1,16 +1,21 @@
 """
-Unit tests for thread-local HTTP sessions.
+Unit tests for thread-local HTTP sessions and their pools.
 """
 
+import asyncio
 import queue
 import threading
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.client import ApiClient
+from src.config import Config, HttpConfig
 from src.gamma_client import GammaClient
+from src.http import AsyncHttpTransport
 
 
 def _session_id(client, out_queue: queue.Queue) -> None:
@@ -41,3 +46,107 @@ def test_gamma_client_thread_local_session():
 
     thread_id = out_queue.get()
     assert main_id != thread_id
+
+
+def test_session_pool_sized_from_http_config():
+    client = ApiClient(
+        base_url="https://example.com",
+        http_config=HttpConfig(pool_connections=3, pool_maxsize=7, max_retries=2),
+    )
+
+    adapter = client.session.get_adapter("https://example.com")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 2
+
+
+def test_config_from_dict_reads_http_section():
+    config = Config.from_dict({"http": {"pool_maxsize": 25, "keepalive_interval": 0}})
+
+    assert config.http.pool_maxsize == 25
+    assert config.http.keepalive_interval == 0.0
+    assert config.http.prewarm is True
+
+
+def test_pool_stats():
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        client = GammaClient(host=url)
+        client.session.head(url, timeout=5)
+
+        [stats] = client.pool_stats()
+        host = stats["hosts"]["http://127.0.0.1"]
+        assert stats["requests"] == 1
+        assert stats["thread"] == threading.current_thread().name
+        assert host["connections_opened"] == 1
+        assert host["idle_connections"] == 1
+    finally:
+        server.shutdown()
+
+
+class _NewThreadExecutor(ThreadPoolExecutor):
+    """Runs every call on a fresh thread, like a cold to_thread worker."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run).start()
+        return future
+
+
+def test_thread_backend_reuses_warmed_connection_across_workers():
+    ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep connections open
+
+        def _answer(self):
+            ports.append((self.command, self.client_address[1]))
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_HEAD = do_POST = _answer
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def warm_then_post():
+        asyncio.get_running_loop().set_default_executor(_NewThreadExecutor())
+        transport = AsyncHttpTransport(backend="thread")
+        await transport.prewarm(url)
+        await transport.request("POST", url + "order", json_data={"order": 1})
+
+    try:
+        asyncio.run(warm_then_post())
+    finally:
+        server.shutdown()
+
+    (_, warmed), (method, posted) = ports
+    assert method == "POST"
+    assert posted == warmed
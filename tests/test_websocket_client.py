@@ -0,0 +1,541 @@
+"""
+Unit tests for MarketWebSocket message handling and local orderbook maintenance.
+"""
+
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.codec import available_backends
+from src.websocket_client import (
+    BookSide,
+    LastTradePrice,
+    MarketMessageDecoder,
+    MarketWebSocket,
+    OrderbookLevel,
+    OrderbookSnapshot,
+    PriceChangeEvent,
+    WsInstrumentation,
+)
+
+
+ASSET = "asset_1"
+
+
+def _book_message(bids=None, asks=None, hash_value="h0"):
+    return {
+        "event_type": "book",
+        "asset_id": ASSET,
+        "market": "0xmarket",
+        "timestamp": "1000",
+        "hash": hash_value,
+        "bids": bids if bids is not None else [
+            {"price": "0.48", "size": "30"},
+            {"price": "0.50", "size": "15"},
+        ],
+        "asks": asks if asks is not None else [
+            {"price": "0.54", "size": "10"},
+            {"price": "0.52", "size": "25"},
+        ],
+    }
+
+
+def _price_change(price, size, side, best_bid, best_ask, hash_value="h1", timestamp=None):
+    message = {
+        "event_type": "price_change",
+        "market": "0xmarket",
+        "price_changes": [{
+            "asset_id": ASSET,
+            "price": price,
+            "size": size,
+            "side": side,
+            "hash": hash_value,
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+        }],
+    }
+    if timestamp is not None:
+        message["timestamp"] = timestamp
+    return message
+
+
+def _subscribed_ws(**kwargs):
+    ws = MarketWebSocket(**kwargs)
+    ws.track_assets([ASSET])
+    return ws
+
+
+class FakeRestClient:
+    def __init__(self, book):
+        self.book = book
+        self.calls = []
+
+    async def get_order_book_async(self, token_id):
+        self.calls.append(token_id)
+        return dict(self.book)
+
+
+class TestOrderbookSnapshot:
+    def test_from_message_sorts_levels(self):
+        snapshot = OrderbookSnapshot.from_message(_book_message())
+
+        assert [level.price for level in snapshot.bids] == [0.50, 0.48]
+        assert [level.price for level in snapshot.asks] == [0.52, 0.54]
+        assert snapshot.mid_price == pytest.approx(0.51)
+
+    def test_apply_change_insert_update_delete(self):
+        snapshot = OrderbookSnapshot.from_message(_book_message())
+
+        snapshot.apply_change(0.49, 5, "BUY")
+        assert [level.price for level in snapshot.bids] == [0.50, 0.49, 0.48]
+
+        snapshot.apply_change(0.50, 99, "BUY")
+        assert snapshot.bids[0].size == 99
+
+        snapshot.apply_change(0.52, 0, "SELL")
+        assert snapshot.best_ask == 0.54
+
+        snapshot.apply_change(0.51, 7, "SELL")
+        assert snapshot.best_ask == 0.51
+
+
+    def test_mid_price_cache_invalidated_on_change(self):
+        snapshot = OrderbookSnapshot.from_message(_book_message())
+        assert snapshot.mid_price == pytest.approx(0.51)
+
+        snapshot.apply_change(0.51, 3, "BUY")
+
+        assert snapshot.mid_price == pytest.approx(0.515)
+
+    def test_top_levels_limit_depth(self):
+        snapshot = OrderbookSnapshot.from_message(_book_message())
+
+        assert snapshot.top_bids(1) == [OrderbookLevel(price=0.50, size=15.0)]
+        assert [level.price for level in snapshot.top_asks(5)] == [0.52, 0.54]
+
+    def test_empty_book_defaults(self):
+        snapshot = OrderbookSnapshot(asset_id=ASSET, market="", timestamp=0)
+
+        assert snapshot.best_bid == 0.0
+        assert snapshot.best_ask == 1.0
+        assert snapshot.mid_price == 0.5
+
+    def test_constructor_accepts_levels(self):
+        snapshot = OrderbookSnapshot(
+            asset_id=ASSET,
+            market="",
+            timestamp=0,
+            bids=[OrderbookLevel(0.4, 1), OrderbookLevel(0.45, 2)],
+            asks=[OrderbookLevel(0.6, 1)],
+        )
+
+        assert snapshot.best_bid == 0.45
+        assert snapshot.best_ask == 0.6
+
+
+class TestBookSide:
+    def test_best_price_is_extreme_for_each_side(self):
+        bids = BookSide(descending=True)
+        asks = BookSide(descending=False)
+        levels = [{"price": "0.3", "size": "1"}, {"price": "0.5", "size": "2"}, {"price": "0.4", "size": "3"}]
+
+        bids.load(levels)
+        asks.load(levels)
+
+        assert bids.best_price == 0.5
+        assert asks.best_price == 0.3
+
+    def test_set_and_size_at(self):
+        side = BookSide(descending=False)
+        side.set(0.6, 10)
+        side.set(0.55, 4)
+        side.set(0.6, 12)
+
+        assert len(side) == 2
+        assert side.size_at(0.6) == 12
+        assert side.size_at(0.7) == 0.0
+
+        side.set(0.55, 0)
+        side.set(0.99, 0)  # deleting a missing level is a no-op
+
+        assert [level.price for level in side.levels()] == [0.6]
+
+
+class TestMarketMessageDecoder:
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_decodes_typed_events(self, backend):
+        decoder = MarketMessageDecoder(backend)
+        trade = {
+            "event_type": "last_trade_price",
+            "asset_id": ASSET,
+            "market": "0xmarket",
+            "price": "0.456",
+            "size": "219.2",
+            "side": "BUY",
+            "timestamp": "1750428146322",
+            "fee_rate_bps": "0",
+        }
+        frame = json.dumps([
+            _book_message(),
+            _price_change("0.51", "40", "BUY", "0.51", "0.52"),
+            trade,
+        ])
+
+        book, change, last_trade = decoder.decode(frame)
+
+        assert isinstance(book, OrderbookSnapshot)
+        assert book.best_bid == 0.50 and book.best_ask == 0.52
+        assert isinstance(change, PriceChangeEvent)
+        assert change.price_changes[0].price == 0.51
+        assert change.price_changes[0].best_ask == 0.52
+        assert isinstance(last_trade, LastTradePrice)
+        assert last_trade.timestamp == 1750428146322
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_unknown_events_and_loose_numbers_fall_back_to_dicts(self, backend):
+        decoder = MarketMessageDecoder(backend)
+        frame = json.dumps([
+            {"event_type": "tick_size_change", "asset_id": ASSET},
+            _book_message(bids=[{"price": ".48", "size": "30"}], asks=[]),
+        ])
+
+        tick, book = decoder.decode(frame)
+
+        assert tick == {"event_type": "tick_size_change", "asset_id": ASSET}
+        assert book.best_bid == 0.48
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_malformed_frame_raises_backend_error(self, backend):
+        decoder = MarketMessageDecoder(backend)
+
+        with pytest.raises(decoder.errors):
+            decoder.decode("{not json")
+
+
+class TestPriceChangeHandling:
+    @pytest.mark.asyncio
+    async def test_price_change_updates_cached_book(self):
+        ws = _subscribed_ws()
+        await ws._handle_message(_book_message())
+
+        await ws._handle_message(_price_change("0.51", "40", "BUY", "0.51", "0.52"))
+
+        book = ws.get_orderbook(ASSET)
+        assert book.best_bid == 0.51
+        assert book.hash == "h1"
+        assert ws.get_mid_price(ASSET) == pytest.approx(0.515)
+
+    @pytest.mark.asyncio
+    async def test_price_change_forwards_callback(self):
+        ws = _subscribed_ws()
+        received = []
+        ws.on_price_change(lambda market, changes: received.append((market, changes)))
+        await ws._handle_message(_book_message())
+
+        await ws._handle_message(_price_change("0.51", "40", "BUY", "0.51", "0.52"))
+
+        assert received[0][0] == "0xmarket"
+        assert received[0][1][0].price == 0.51
+
+    @pytest.mark.asyncio
+    async def test_drift_triggers_rest_resync(self):
+        rest_book = _book_message(
+            bids=[{"price": "0.45", "size": "1"}],
+            asks=[{"price": "0.60", "size": "1"}],
+            hash_value="rest",
+        )
+        rest = FakeRestClient(rest_book)
+        ws = MarketWebSocket(rest_client=rest)
+        ws._subscribed_assets.add(ASSET)
+        books = []
+        ws.on_book(books.append)
+        await ws._handle_message(_book_message())
+
+        # Server reports a best bid that our local book cannot produce
+        await ws._handle_message(_price_change("0.30", "1", "BUY", "0.45", "0.60"))
+        await asyncio.gather(*ws._resync_tasks.values())
+
+        assert rest.calls == [ASSET]
+        book = ws.get_orderbook(ASSET)
+        assert book.hash == "rest"
+        assert book.best_bid == 0.45
+        assert books[-1] is book
+
+    @pytest.mark.asyncio
+    async def test_consistent_change_does_not_resync(self):
+        rest = FakeRestClient(_book_message())
+        ws = _subscribed_ws(rest_client=rest)
+        await ws._handle_message(_book_message())
+
+        await ws._handle_message(_price_change("0.50", "0", "BUY", "0.48", "0.52"))
+
+        assert ws._resync_tasks == {}
+        assert rest.calls == []
+        assert ws.get_orderbook(ASSET).best_bid == 0.48
+
+    @pytest.mark.asyncio
+    async def test_change_without_top_of_book_does_not_resync(self):
+        rest = FakeRestClient(_book_message())
+        ws = _subscribed_ws(rest_client=rest)
+        await ws._handle_message(_book_message())
+        message = _price_change("0.51", "40", "BUY", "0.51", "0.52")
+        for change in message["price_changes"]:
+            del change["best_bid"], change["best_ask"]
+
+        await ws._handle_message(message)
+
+        assert ws._resync_tasks == {}
+        assert ws.get_orderbook(ASSET).best_bid == 0.51
+
+    @pytest.mark.asyncio
+    async def test_resync_replays_updates_that_arrive_in_flight(self):
+        ws = MarketWebSocket()
+        ws._subscribed_assets.add(ASSET)
+        await ws._handle_message(_book_message())
+
+        class RacingRestClient(FakeRestClient):
+            async def get_order_book_async(self, token_id):
+                # A delta lands on the WebSocket while REST is answering
+                await ws._handle_message(_price_change("0.51", "40", "BUY", "0.51", "0.52", "ws"))
+                return await super().get_order_book_async(token_id)
+
+        ws.rest_client = RacingRestClient(_book_message(hash_value="rest"))
+
+        assert await ws._resync_orderbook(ASSET) is True
+        book = ws.get_orderbook(ASSET)
+        assert book.hash == "ws"
+        assert book.best_bid == 0.51
+
+    @pytest.mark.asyncio
+    async def test_resync_fixes_drift_while_deltas_keep_arriving(self):
+        ws = _subscribed_ws()
+        # Local book has a phantom 0.53 bid the server does not have
+        await ws._handle_message(_book_message(bids=[{"price": "0.53", "size": "5"}]))
+        rest_book = _book_message(
+            bids=[{"price": "0.50", "size": "15"}],
+            asks=[{"price": "0.52", "size": "25"}],
+            hash_value="rest",
+        )
+        rest_book["timestamp"] = "2000"
+
+        class BusyRestClient(FakeRestClient):
+            async def get_order_book_async(self, token_id):
+                # Already part of the snapshot, then newer than it
+                await ws._handle_message(_price_change("0.50", "15", "BUY", "0.50", "0.52", timestamp=1500))
+                for i, size in enumerate(("20", "30", "40")):
+                    await ws._handle_message(
+                        _price_change("0.49", size, "BUY", "0.50", "0.52", f"ws{i}", timestamp=2001 + i)
+                    )
+                    await asyncio.sleep(0)
+                return await super().get_order_book_async(token_id)
+
+        ws.rest_client = BusyRestClient(rest_book)
+
+        # Server reports a top of book the local book cannot produce
+        await ws._handle_message(_price_change("0.30", "1", "BUY", "0.50", "0.52"))
+        await asyncio.gather(*ws._resync_tasks.values())
+
+        book = ws.get_orderbook(ASSET)
+        assert [(level.price, level.size) for level in book.bids] == [(0.50, 15), (0.49, 40)]
+        assert book.best_ask == 0.52
+        assert book.hash == "ws2"
+        assert ws._resync_deltas == {}
+
+    @pytest.mark.asyncio
+    async def test_resync_yields_to_a_book_sent_in_flight(self):
+        ws = _subscribed_ws()
+        await ws._handle_message(_book_message())
+
+        class RacingRestClient(FakeRestClient):
+            async def get_order_book_async(self, token_id):
+                await ws._handle_message(_book_message(hash_value="ws"))
+                return await super().get_order_book_async(token_id)
+
+        ws.rest_client = RacingRestClient(_book_message(hash_value="rest"))
+
+        assert await ws._resync_orderbook(ASSET) is False
+        assert ws.get_orderbook(ASSET).hash == "ws"
+
+
+class TestWsInstrumentation:
+    def _instrumentation(self, caplog, **kwargs):
+        log = logging.getLogger("test_ws_instrumentation")
+        caplog.set_level(logging.INFO, logger=log.name)
+        return WsInstrumentation(log=log, **kwargs)
+
+    def test_samples_first_and_every_nth_frame(self, caplog):
+        inst = self._instrumentation(caplog, log_first_frames=2, sample_every=5)
+
+        for i in range(1, 11):
+            inst.on_frame(f"frame-{i}")
+
+        logged = [r.getMessage() for r in caplog.records]
+        assert logged == [
+            "WS message #1: frame-1",
+            "WS message #2: frame-2",
+            "WS message #5: frame-5",
+            "WS message #10: frame-10",
+        ]
+        assert inst.frame_count == 10
+
+    def test_rate_limit_caps_logged_frames(self, caplog):
+        inst = self._instrumentation(caplog, log_first_frames=100, max_frames_per_minute=3)
+
+        for i in range(10):
+            inst.on_frame("x")
+
+        assert len(caplog.records) == 3
+
+    def test_frame_preview_truncated(self, caplog):
+        inst = self._instrumentation(caplog, preview_chars=4)
+
+        inst.on_frame("abcdefgh")
+
+        assert caplog.records[0].getMessage() == "WS message #1: abcd"
+
+    def test_nothing_logged_when_info_disabled(self, caplog):
+        log = logging.getLogger("test_ws_instrumentation_quiet")
+        log.setLevel(logging.WARNING)
+        inst = WsInstrumentation(log=log)
+
+        inst.on_frame("frame")
+
+        assert caplog.records == []
+        assert inst.debug_enabled is False
+
+
+class TestQueuedDispatch:
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_block_receive(self):
+        ws = _subscribed_ws(event_queue_size=10)
+        release = asyncio.Event()
+        seen = []
+
+        async def slow_book(snapshot):
+            await release.wait()
+            seen.append(snapshot.hash)
+
+        ws.on_book(slow_book)
+
+        await asyncio.wait_for(ws._handle_message(_book_message(hash_value="first")), timeout=1)
+        await asyncio.wait_for(ws._handle_message(_book_message(hash_value="second")), timeout=1)
+
+        # Cache is updated immediately even though callbacks are pending
+        assert ws.get_orderbook(ASSET).hash == "second"
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await ws.disconnect()
+
+        assert seen[-1] == "second"
+        assert ws.queue_stats()["book"].dispatched == len(seen)
+
+    @pytest.mark.asyncio
+    async def test_inline_when_queue_disabled(self):
+        ws = _subscribed_ws()
+        seen = []
+        ws.on_book(lambda snapshot: seen.append(snapshot.asset_id))
+
+        await ws._handle_message(_book_message())
+
+        assert seen == [ASSET]
+        assert ws.queue_stats() == {}
+
+
+class FakeConnection:
+    def __init__(self):
+        self.open = True
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+def _asset_book(asset_id):
+    message = _book_message()
+    message["asset_id"] = asset_id
+    return message
+
+
+class TestSubscriptionDiff:
+    @pytest.mark.asyncio
+    async def test_replace_sends_only_the_difference(self, monkeypatch):
+        monkeypatch.setattr(MarketWebSocket, "is_connected", property(lambda self: self._ws is not None))
+        ws = MarketWebSocket()
+        ws._ws = FakeConnection()
+        await ws.subscribe(["a", "b"], replace=True)
+        for asset_id in ("a", "b"):
+            await ws._handle_message(_asset_book(asset_id))
+        kept = ws.get_orderbook("b")
+
+        await ws.subscribe(["b", "c"], replace=True)
+
+        assert ws._ws.sent == [
+            {"assets_ids": ["a", "b"], "type": "MARKET"},
+            {"assets_ids": ["c"], "operation": "subscribe"},
+            {"assets_ids": ["a"], "operation": "unsubscribe"},
+        ]
+        assert ws._subscribed_assets == {"b", "c"}
+        assert ws.get_orderbook("b") is kept
+        assert ws.get_orderbook("a") is None
+
+    @pytest.mark.asyncio
+    async def test_replace_while_offline_evicts_dropped_books(self):
+        ws = MarketWebSocket()
+        await ws.subscribe(["a", "b"])
+        for asset_id in ("a", "b"):
+            await ws._handle_message(_asset_book(asset_id))
+
+        await ws.subscribe(["b"], replace=True)
+
+        assert ws._subscribed_assets == {"b"}
+        assert set(ws.orderbooks) == {"b"}
+
+
+class TestReconnect:
+    def test_first_retry_is_immediate_then_backoff_grows(self):
+        ws = MarketWebSocket(reconnect_interval=1.0, max_reconnect_interval=4.0)
+
+        assert ws._reconnect_delay(1) == 0.0
+        for attempt, ceiling in ((2, 1.0), (3, 2.0), (4, 4.0), (10, 4.0)):
+            assert all(0 <= ws._reconnect_delay(attempt) <= ceiling for _ in range(20))
+
+    @pytest.mark.asyncio
+    async def test_disconnect_marks_books_stale_and_backfill_recovers_them(self):
+        rest = FakeRestClient(_book_message(hash_value="rest"))
+        ws = MarketWebSocket(rest_client=rest)
+        for asset_id in (ASSET, "asset_2"):
+            ws._subscribed_assets.add(asset_id)
+            await ws._handle_message(_asset_book(asset_id))
+
+        assert ws._mark_books_stale() == 2
+        assert ws.get_orderbook(ASSET).stale
+
+        # The WebSocket resends asset_2 before the REST snapshots land
+        await ws._handle_message(_asset_book("asset_2"))
+        recovered = await ws._backfill_books()
+
+        assert recovered == 1
+        assert rest.calls == [ASSET]
+        assert ws.get_orderbook(ASSET).hash == "rest"
+        assert not any(book.stale for book in ws.orderbooks.values())
+
+    @pytest.mark.asyncio
+    async def test_price_change_refreshes_age_but_not_stale_flag(self):
+        ws = _subscribed_ws()
+        await ws._handle_message(_book_message())
+        book = ws.get_orderbook(ASSET)
+        book.updated_at -= 10
+        ws._mark_books_stale()
+
+        await ws._handle_message(_price_change("0.50", "0", "BUY", "0.48", "0.52"))
+
+        assert book.age < 1
+        assert book.stale
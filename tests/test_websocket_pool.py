@@ -0,0 +1,172 @@
+"""
+Unit tests for sharded MarketWebSocketPool subscription management.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.websocket_pool import MarketWebSocketPool
+
+
+def _book(asset_id):
+    return {
+        "event_type": "book",
+        "asset_id": asset_id,
+        "market": "0xmarket",
+        "timestamp": "1",
+        "bids": [{"price": "0.40", "size": "1"}],
+        "asks": [{"price": "0.60", "size": "1"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_subscribe_spreads_assets_across_shards():
+    pool = MarketWebSocketPool(num_connections=3)
+
+    await pool.subscribe([f"a{i}" for i in range(7)])
+
+    assert sorted(pool.shard_loads()) == [2, 2, 3]
+    assert pool.subscribed_assets == {f"a{i}" for i in range(7)}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_subscribe_keeps_assignment():
+    pool = MarketWebSocketPool(num_connections=2)
+    await pool.subscribe(["a", "b"])
+    shard = pool.shard_for("a")
+
+    await pool.subscribe_more(["a", "c"])
+
+    assert pool.shard_for("a") is shard
+    assert sum(pool.shard_loads()) == 3
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_rebalances_and_moves_books():
+    pool = MarketWebSocketPool(num_connections=2, rebalance_threshold=1)
+    await pool.subscribe(["a", "b", "c", "d", "e", "f"])
+    for asset_id in pool.subscribed_assets:
+        await pool.shard_for(asset_id)._handle_message(_book(asset_id))
+
+    emptied = pool.shards[0].subscribed_assets
+    await pool.unsubscribe(list(emptied))
+
+    assert sorted(pool.shard_loads()) == [1, 2]
+    for asset_id in pool.subscribed_assets:
+        assert pool.get_orderbook(asset_id) is not None
+    assert set(pool.orderbooks) == pool.subscribed_assets
+
+
+@pytest.mark.asyncio
+async def test_replace_resets_assignment():
+    pool = MarketWebSocketPool(num_connections=2)
+    await pool.subscribe(["a", "b", "c"])
+
+    await pool.subscribe(["x", "y"], replace=True)
+
+    assert pool.subscribed_assets == {"x", "y"}
+    assert pool.shard_loads() == [1, 1]
+    assert pool.get_orderbook("a") is None
+
+
+@pytest.mark.asyncio
+async def test_replace_keeps_shard_and_book_of_persisting_assets():
+    pool = MarketWebSocketPool(num_connections=2)
+    await pool.subscribe(["a", "b", "c", "d"])
+    await pool.shard_for("a")._handle_message(_book("a"))
+    shard = pool.shard_for("a")
+
+    await pool.subscribe(["a", "x"], replace=True)
+
+    assert pool.subscribed_assets == {"a", "x"}
+    assert pool.shard_for("a") is shard
+    assert pool.get_orderbook("a") is not None
+
+
+@pytest.mark.asyncio
+async def test_rollover_replace_needs_no_rebalance(monkeypatch):
+    pool = MarketWebSocketPool(num_connections=2, rebalance_threshold=1)
+    await pool.subscribe(["a", "b", "c", "d"])
+    moves = []
+    rebalance = pool.rebalance
+
+    async def counting_rebalance():
+        moved = await rebalance()
+        moves.append(moved)
+        return moved
+
+    monkeypatch.setattr(pool, "rebalance", counting_rebalance)
+
+    await pool.subscribe(["w", "x", "y", "z"], replace=True)
+
+    assert moves == [0]
+    assert pool.shard_loads() == [2, 2]
+    assert pool.subscribed_assets == {"w", "x", "y", "z"}
+
+
+@pytest.mark.asyncio
+async def test_events_from_all_shards_reach_pool_callback():
+    pool = MarketWebSocketPool(num_connections=2)
+    seen = []
+    pool.on_book(lambda snapshot: seen.append(snapshot.asset_id))
+    await pool.subscribe(["a", "b"])
+
+    await pool.shard_for("a")._handle_message(_book("a"))
+    await pool.shard_for("b")._handle_message(_book("b"))
+
+    assert pool.shard_for("a") is not pool.shard_for("b")
+    assert seen == ["a", "b"]
+    assert pool.get_mid_price("b") == pytest.approx(0.5)
+
+
+def test_requires_at_least_one_connection():
+    with pytest.raises(ValueError):
+        MarketWebSocketPool(num_connections=0)
+
+
+@pytest.mark.asyncio
+async def test_run_starts_shards_that_gain_assets(monkeypatch):
+    pool = MarketWebSocketPool(num_connections=2)
+    started = []
+
+    for index, shard in enumerate(pool.shards):
+        async def fake_run(auto_reconnect=True, index=index):
+            started.append(index)
+            await asyncio.sleep(3600)
+        monkeypatch.setattr(shard, "run", fake_run)
+
+    runner = asyncio.create_task(pool.run())
+    await asyncio.sleep(0)
+    assert started == []
+
+    await pool.subscribe(["a"])
+    await asyncio.sleep(0)
+    assert started == [0]
+
+    await pool.disconnect()
+    await asyncio.wait_for(runner, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_moved_asset_events_on_the_old_shard_are_ignored():
+    pool = MarketWebSocketPool(num_connections=2, rebalance_threshold=1)
+    await pool.subscribe(["a", "b", "c", "d"])
+    for asset_id in pool.subscribed_assets:
+        await pool.shard_for(asset_id)._handle_message(_book(asset_id))
+    old, new = pool.shards
+    seen = []
+    pool.on_book(lambda snapshot: seen.append(snapshot.asset_id))
+
+    await pool.unsubscribe(list(new.subscribed_assets))
+    (moved,) = new.subscribed_assets
+    # The old shard's unsubscribe has not taken effect on the server yet
+    await old._handle_message(_book(moved))
+
+    assert seen == []
+    assert old.get_orderbook(moved) is None
+    assert new.get_orderbook(moved) is not None